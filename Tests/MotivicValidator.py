@@ -1,14 +1,126 @@
-from sympy import Matrix, diag, kronecker_product, symbols, diff, sin, cos, sqrt, Rational, polylog
+from sympy import Matrix, diag, kronecker_product, symbols, diff, sin, cos, sqrt, Rational, polylog, sympify, QQ
+from sympy.polys.matrices import DomainMatrix
+from math import ceil, exp, log
+from sys import float_info
+import mpmath
+
+# === Matrix Storage Backends ===
+class MatrixBackend:
+    # Dense SymPy immutable storage (the original representation of MixedMotive)
+    name = 'dense'
+
+    def convert(self, matrix):
+        if isinstance(matrix, DomainMatrix):
+            return matrix.to_Matrix().as_immutable()
+        return matrix.as_immutable()
+
+    def to_sympy(self, matrix):
+        return matrix
+
+    def transpose(self, matrix):
+        return matrix.transpose()
+
+    def kronecker(self, matrix_a, matrix_b):
+        return kronecker_product(matrix_a, matrix_b).as_immutable()
+
+    def block_diagonal(self, *blocks):
+        return diag(*blocks).as_immutable()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name})"
+
+
+class DomainMatrixBackend(MatrixBackend):
+    # Exact DomainMatrix storage over QQ: fmt='sparse' keeps only the non-zero rationals
+    # (dict of keys), fmt='dense' keeps a flat list of rationals. No Expr objects are built.
+    def __init__(self, name, fmt):
+        self.name = name
+        self.fmt = fmt
+
+    def _format(self, matrix):
+        return matrix.to_sparse() if self.fmt == 'sparse' else matrix.to_dense()
+
+    def _from_dod(self, dod, shape):
+        return self._format(DomainMatrix.from_dod(dod, shape, QQ))
+
+    def _scalar(self, value):
+        return QQ.from_sympy(sympify(value))
+
+    def convert(self, matrix):
+        if isinstance(matrix, DomainMatrix):
+            return self._format(matrix.convert_to(QQ))
+        dok = {pos: self._scalar(value) for pos, value in matrix.todok().items()}
+        return self._format(DomainMatrix.from_dok(dok, matrix.shape, QQ))
+
+    def to_sympy(self, matrix):
+        return matrix.to_Matrix().as_immutable()
+
+    def transpose(self, matrix):
+        return matrix.transpose()
+
+    def kronecker(self, matrix_a, matrix_b):
+        rows_b, cols_b = matrix_b.shape
+        dod_b = matrix_b.to_dod()
+        result = {}
+        for i, row_a in matrix_a.to_dod().items():
+            for k, row_b in dod_b.items():
+                result[i * rows_b + k] = {
+                    j * cols_b + l: a_ij * b_kl
+                    for j, a_ij in row_a.items()
+                    for l, b_kl in row_b.items()
+                }
+        shape = (matrix_a.shape[0] * rows_b, matrix_a.shape[1] * cols_b)
+        return self._from_dod(result, shape)
+
+    def block_diagonal(self, *blocks):
+        result = {}
+        row_offset, col_offset = 0, 0
+        for block in blocks:
+            for i, row in block.to_dod().items():
+                result[row_offset + i] = {col_offset + j: value for j, value in row.items()}
+            row_offset += block.shape[0]
+            col_offset += block.shape[1]
+        return self._from_dod(result, (row_offset, col_offset))
+
+
+# Registry of available storage backends, keyed by name
+MATRIX_BACKENDS = {
+    'dense': MatrixBackend(),
+    'sparse': DomainMatrixBackend('sparse', 'sparse'),
+    'domain': DomainMatrixBackend('domain', 'dense'),
+}
+
+def register_matrix_backend(backend):
+    MATRIX_BACKENDS[backend.name] = backend
+
+def get_matrix_backend(backend):
+    if isinstance(backend, MatrixBackend):
+        return backend
+    if backend not in MATRIX_BACKENDS:
+        raise ValueError(f"Unknown matrix backend: {backend}")
+    return MATRIX_BACKENDS[backend]
+
 
 # === Mixed Motives ===
 class MixedMotive:
-    def __init__(self, variety_name, dimension, matrix_rep):
+    def __init__(self, variety_name, dimension, matrix_rep, backend='dense'):
         self.variety_name = variety_name
         self.dimension = dimension
-        self.matrix_rep = matrix_rep.as_immutable()
+        # Storage backend: 'dense' (SymPy Matrix), 'sparse' or 'domain' (DomainMatrix over QQ)
+        self.backend = get_matrix_backend(backend)
+        self.matrix_data = self.backend.convert(matrix_rep)
         self.correspondences = []
         self.exact_sequences = []
 
+    @property
+    def matrix_rep(self):
+        # Dense SymPy view, only materialized on request
+        return self.backend.to_sympy(self.matrix_data)
+
+    @matrix_rep.setter
+    def matrix_rep(self, matrix):
+        self.matrix_data = self.backend.convert(matrix)
+
     def add_correspondence(self, other_motive, morphism_matrix):
         # Adding correspondences between motives represented by matrix multiplication
         self.correspondences.append((other_motive, self.matrix_rep * morphism_matrix))
@@ -16,19 +128,21 @@ class MixedMotive:
     def tensor_product(self, other_motive):
         # Tensor product via Kronecker product using sympy.kronecker_product()
         new_dimension = self.dimension * other_motive.dimension
-        new_morphism = kronecker_product(self.matrix_rep, other_motive.matrix_rep)
-        return MixedMotive(f"Tensor({self.variety_name}, {other_motive.variety_name})", new_dimension, new_morphism)
+        new_morphism = self.backend.kronecker(self.matrix_data, self.backend.convert(other_motive.matrix_data))
+        return MixedMotive(f"Tensor({self.variety_name}, {other_motive.variety_name})", new_dimension, new_morphism,
+                           backend=self.backend)
 
     def dual(self):
         # Dual of a motive via transpose of the matrix representing the motive
-        dual_matrix = self.matrix_rep.transpose()
-        return MixedMotive(f"Dual({self.variety_name})", self.dimension, dual_matrix)
+        dual_matrix = self.backend.transpose(self.matrix_data)
+        return MixedMotive(f"Dual({self.variety_name})", self.dimension, dual_matrix, backend=self.backend)
 
     def triangulate(self, other_motive):
         # Triangulate motives using block diagonal matrices for different dimensions
-        triangulated_matrix = diag(self.matrix_rep, other_motive.matrix_rep)
+        triangulated_matrix = self.backend.block_diagonal(self.matrix_data, self.backend.convert(other_motive.matrix_data))
         triangulated_dimension = self.dimension + other_motive.dimension
-        return MixedMotive(f"Triangulate({self.variety_name}, {other_motive.variety_name})", triangulated_dimension, triangulated_matrix)
+        return MixedMotive(f"Triangulate({self.variety_name}, {other_motive.variety_name})", triangulated_dimension,
+                           triangulated_matrix, backend=self.backend)
 
     def add_exact_sequence(self, motive1, motive2, motive3):
         # Exact sequence: Represented by matrix transformations between motives
@@ -84,20 +198,116 @@ motives[1].add_exact_sequence(motives[0], motives[2], motives[3])
 motives[3].add_exact_sequence(motives[2], motives[1], motives[3])
 
 # === Automorphic L-functions ===
+def rounding_bound(magnitude, terms, s_value):
+    # First-order bound on the floating-point error of summing `terms` terms a_n n^-s with sum |a_n n^-s| = magnitude:
+    # each n^-s is off by up to about (|s| log n + 2) ulps and the summation adds at most `terms` ulps of the magnitude
+    if terms == 0:
+        return 0.0
+    return float_info.epsilon * (terms + abs(s_value) * log(terms) + 2) * magnitude
+
 class AutomorphicLFunction:
-    def __init__(self, variety_name):
+    def __init__(self, variety_name, coefficient_period=None, coefficient_ratio=None):
+        # Coefficients a_n = c_n * z^n with c_n periodic (values c_1..c_q) and ratio z; both default
+        # to 1, giving the zeta sum
         self.variety_name = variety_name
+        self.coefficient_period = list(coefficient_period) if coefficient_period is not None else [1]
+        self.coefficient_ratio = coefficient_ratio if coefficient_ratio is not None else 1
         self.l_values = []
         self.motivic_contributions = []
+        self.l_precisions = []
+
+    def coefficient(self, n):
+        return self.coefficient_period[(n - 1) % len(self.coefficient_period)] * self.coefficient_ratio ** n
+
+    def coefficient_bound(self):
+        # C with |a_n| <= C for every n (needs |z| <= 1)
+        return max(abs(c) for c in self.coefficient_period) if abs(self.coefficient_ratio) <= 1 else float('inf')
 
     def add_l_value(self, l_value, motivic_value):
         self.l_values.append(l_value)
         self.motivic_contributions.append(motivic_value)
 
     def compute_l_function(self, s_value):
-        result = sum([1 / (n ** s_value) for n in range(1, 1000)])  # Extended series computation
+        result = sum([self.coefficient(n) / (n ** s_value) for n in range(1, 1000)])  # Extended series computation
         return result
 
+    def compute_l_function_adaptive(self, s_value, tolerance=1e-10, max_terms=10 ** 6):
+        # Sums the first N terms with N the fewest whose tail bound sum_{n > N} C n^-sigma <= C N^(1 - sigma) / (sigma - 1)
+        # plus the rounding of the sum is within tolerance; returns (value, error bound, terms used). The tail
+        # gets what the rounding leaves of the tolerance, with the rounding estimated from
+        # sum_{n <= N} C n^-sigma <= C sigma / (sigma - 1). The bound only exceeds the tolerance at max_terms or
+        # when the rounding alone does
+        sigma = complex(s_value).real
+        constant = self.coefficient_bound()
+        if sigma <= 1 or constant == float('inf'):
+            terms, tail = max_terms, float('inf')
+        elif constant == 0:
+            terms, tail = 0, 0.0
+        else:
+            budget, estimate = tolerance, constant * sigma / (sigma - 1)
+            while True:
+                log_terms = log(constant / ((sigma - 1) * budget)) / (sigma - 1)
+                terms = max_terms if log_terms >= log(max_terms) else max(1, ceil(exp(log_terms)))
+                tail = constant * terms ** (1 - sigma) / (sigma - 1)
+                if tail > budget and terms < max_terms:  # Rounding in exp / log
+                    terms += 1
+                    tail = constant * terms ** (1 - sigma) / (sigma - 1)
+                rounding = rounding_bound(estimate, terms, s_value)
+                if tail + rounding <= tolerance or terms == max_terms or rounding >= tolerance:
+                    break
+                budget = tolerance - rounding
+        result, magnitude = 0, 0.0
+        for n in range(1, terms + 1):
+            term = self.coefficient(n) / (n ** s_value)
+            result += term
+            magnitude += abs(term)
+        return result, tail + rounding_bound(magnitude, terms, s_value), terms
+
+    def closed_form(self, s_value):
+        # sum_n c_n z^n n^-s at the current mpmath precision: zeta(s) for trivial coefficients,
+        # mpmath.dirichlet (Hurwitz zeta sums, with the poles at s = 1 cancelling when sum_r c_r = 0) for
+        # periodic ones, polylog(s, z) for a geometric ratio, and q^-s sum_r c_r z^r Phi(z^q, s, r/q) (Lerch)
+        # for both. Only where the series converges: these functions continue analytically past it, and the
+        # continued value is not the sum
+        s_value = mpmath.mpmathify(s_value)
+        period, ratio = self.coefficient_period, mpmath.mpmathify(self.coefficient_ratio)
+        q = len(period)
+        if not any(period):
+            return mpmath.mpf(0)
+        self.check_convergence(s_value)
+        if ratio == 1:
+            if q == 1:
+                return period[0] * mpmath.zeta(s_value)
+            return mpmath.dirichlet(s_value, period[-1:] + period[:-1])  # dirichlet indexes c by n mod q
+        if q == 1:
+            return period[0] * mpmath.polylog(s_value, ratio)
+        return q ** -s_value * mpmath.fsum(c * ratio ** r * mpmath.lerchphi(ratio ** q, s_value, mpmath.mpf(r) / q)
+                                           for r, c in enumerate(period, 1) if c)
+
+    def check_convergence(self, s_value):
+        # Raises ValueError where sum_n c_n z^n n^-s diverges: |z| > 1; |z| = 1 with Re s <= 0; and |z| = 1 with
+        # 0 < Re s <= 1 when the partial sums of c_n z^n are unbounded (z^q = 1 and sum_r c_r z^r != 0)
+        ratio = mpmath.mpmathify(self.coefficient_ratio)
+        if abs(ratio) > 1:
+            raise ValueError(f"The series diverges for |z| = {mpmath.nstr(abs(ratio))} > 1")
+        if abs(ratio) < 1 or mpmath.re(s_value) > 1:
+            return
+        period_sum = mpmath.fsum(c * ratio ** r for r, c in enumerate(self.coefficient_period, 1))
+        if mpmath.re(s_value) <= 0 or (ratio ** len(self.coefficient_period) == 1 and period_sum != 0):
+            raise ValueError(f"The series diverges at s = {mpmath.nstr(s_value)} for |z| = 1")
+
+    def compute_l_function_accelerated(self, s_value, dps=30):
+        # Closed-form value in place of the truncated sum, evaluated at dps and dps + 10 digits; returns
+        # (value, digits on which the two agree)
+        with mpmath.workdps(dps):
+            estimate = self.closed_form(s_value)
+        with mpmath.workdps(dps + 10):
+            value = self.closed_form(s_value)
+            difference = abs(value - estimate)
+            scale = abs(value) if value != 0 else 1  # Absolute digits for a zero value
+            digits = dps if difference == 0 else max(0, min(dps, int(-mpmath.log10(difference / scale))))
+        return value, digits
+
     def average_l_value(self):
         return sum(self.l_values) / len(self.l_values) if self.l_values else 0
 
@@ -113,8 +323,9 @@ varieties = ['Elliptic Curve', 'Shimura Variety', 'K3 Surface', 'Siegel Modular
 l_functions = [AutomorphicLFunction(variety) for variety in varieties]
 
 for l_func in l_functions:
-    l_value = l_func.compute_l_function(3)
+    l_value, l_precision = l_func.compute_l_function_accelerated(3)
     l_func.add_l_value(l_value, l_value * 0.9)
+    l_func.l_precisions.append(l_precision)
 
 # === Cohomology ===
 def perturb_matrix(mat):
@@ -208,6 +419,8 @@ for l_func in l_functions:
     print(f"{l_func.variety_name}:")
     print(f"  Average L-function Value: {l_func.average_l_value()}")
     print(f"  Average Motivic Contribution: {l_func.average_motivic_contribution()}")
+    print(f"  L-function Value: {mpmath.nstr(l_func.l_values[-1], min(l_func.l_precisions))} "
+          f"(Precision Reached: {min(l_func.l_precisions)} digits)")
 
 # Print Cohomological Unification results
 print("\n=== Cohomological Unification Results ===")
@@ -15,13 +15,268 @@ from sympy import (
     pprint,
     init_printing,
     expand,
-    zeros
+    zeros,
+    sympify,
+    QQ,
+    prevprime,
+    lambdify
 )
 from sympy.abc import s, x, y
+from sympy.polys.matrices import DomainMatrix
+from sympy.polys.polyerrors import CoercionFailed
+from math import log
+from collections import OrderedDict
+import numpy as np
 
 # Initialize pretty printing for better readability
 init_printing(use_unicode=True)
 
+# === Matrix Storage Backends ===
+class MatrixBackend:
+    """
+    Storage backend for motive matrices.
+
+    The base class keeps SymPy immutable dense matrices, which is the original
+    storage of MixedMotive. Subclasses override the primitives below so that
+    tensor products, duals, triangulations and degenerations never leave
+    their own representation.
+    """
+    name = 'dense'
+
+    def convert(self, matrix):
+        """
+        Convert a SymPy Matrix or DomainMatrix into this backend's storage.
+
+        :param matrix: Matrix in any supported representation.
+        :return: Matrix in this backend's representation.
+        """
+        if isinstance(matrix, DomainMatrix):
+            return matrix.to_Matrix().as_immutable()
+        return matrix.as_immutable()
+
+    def to_sympy(self, matrix):
+        """
+        Materialize a stored matrix as a SymPy immutable dense Matrix.
+
+        :param matrix: Matrix in this backend's representation.
+        :return: Immutable dense SymPy Matrix.
+        """
+        return matrix
+
+    def shape(self, matrix):
+        return matrix.shape
+
+    def eye(self, n):
+        return Matrix.eye(n).as_immutable()
+
+    def scale(self, matrix, factor):
+        return (matrix * factor).as_immutable()
+
+    def transpose(self, matrix):
+        return matrix.transpose()
+
+    def kronecker(self, matrix_a, matrix_b):
+        return kronecker_product(matrix_a, matrix_b).as_immutable()
+
+    def block_diagonal(self, *blocks):
+        return diag(*blocks).as_immutable()
+
+    def add_entries(self, matrix, entries):
+        """
+        Add values to individual entries of a matrix.
+
+        :param matrix: Matrix in this backend's representation.
+        :param entries: Dictionary mapping (row, col) positions to increments.
+        :return: New matrix with the increments applied.
+        """
+        updated = matrix.as_mutable()
+        for (i, j), value in entries.items():
+            updated[i, j] += value
+        return updated.as_immutable()
+
+    def zero_entries(self, matrix, positions):
+        """
+        Set the given entries of a matrix to zero.
+
+        :param matrix: Matrix in this backend's representation.
+        :param positions: Iterable of (row, col) positions.
+        :return: New matrix with the entries cleared.
+        """
+        updated = matrix.as_mutable()
+        for i, j in positions:
+            updated[i, j] = 0
+        return updated.as_immutable()
+
+    def affine_update(self, matrix, alpha, beta, zeros, corrections):
+        """
+        Compute alpha * matrix (with the given entries cleared) + beta * I + corrections in one pass.
+
+        :param matrix: Matrix in this backend's representation.
+        :param alpha: Scalar multiplier of the matrix.
+        :param beta: Scalar multiplier of the identity.
+        :param zeros: Iterable of (row, col) positions of the matrix that are cleared.
+        :param corrections: Dictionary mapping (row, col) positions to increments.
+        :return: New matrix with the update applied.
+        """
+        updated = Matrix(matrix) * alpha if alpha != 1 else Matrix(matrix)
+        for i, j in zeros:
+            updated[i, j] = 0
+        if beta:
+            for i in range(min(updated.shape)):
+                updated[i, i] += beta
+        for (i, j), value in corrections.items():
+            updated[i, j] += value
+        return updated.as_immutable()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name})"
+
+
+class DomainMatrixBackend(MatrixBackend):
+    """
+    Exact storage as a SymPy DomainMatrix over QQ.
+
+    With fmt='sparse' the matrix is a dict-of-keys store holding only the
+    non-zero rationals; with fmt='dense' it is a flat list of rationals. In
+    both cases no SymPy Expr objects are built until to_sympy() is called.
+    """
+
+    def __init__(self, name, fmt):
+        """
+        Initialize a DomainMatrix backend.
+
+        :param name: Registry name of the backend.
+        :param fmt: DomainMatrix storage format, either 'sparse' or 'dense'.
+        """
+        self.name = name
+        self.fmt = fmt
+
+    def _format(self, matrix):
+        return matrix.to_sparse() if self.fmt == 'sparse' else matrix.to_dense()
+
+    def _from_dod(self, dod, shape):
+        return self._format(DomainMatrix.from_dod(dod, shape, QQ))
+
+    def _scalar(self, value):
+        return QQ.from_sympy(sympify(value))
+
+    def convert(self, matrix):
+        if isinstance(matrix, DomainMatrix):
+            return self._format(matrix.convert_to(QQ))
+        dok = {pos: self._scalar(value) for pos, value in matrix.todok().items()}
+        return self._format(DomainMatrix.from_dok(dok, matrix.shape, QQ))
+
+    def to_sympy(self, matrix):
+        return matrix.to_Matrix().as_immutable()
+
+    def eye(self, n):
+        return self._format(DomainMatrix.eye(n, QQ))
+
+    def scale(self, matrix, factor):
+        return matrix * self._scalar(factor)
+
+    def transpose(self, matrix):
+        return matrix.transpose()
+
+    def kronecker(self, matrix_a, matrix_b):
+        rows_b, cols_b = matrix_b.shape
+        dod_b = matrix_b.to_dod()
+        result = {}
+        for i, row_a in matrix_a.to_dod().items():
+            for k, row_b in dod_b.items():
+                result[i * rows_b + k] = {
+                    j * cols_b + l: a_ij * b_kl
+                    for j, a_ij in row_a.items()
+                    for l, b_kl in row_b.items()
+                }
+        shape = (matrix_a.shape[0] * rows_b, matrix_a.shape[1] * cols_b)
+        return self._from_dod(result, shape)
+
+    def block_diagonal(self, *blocks):
+        result = {}
+        row_offset, col_offset = 0, 0
+        for block in blocks:
+            for i, row in block.to_dod().items():
+                result[row_offset + i] = {col_offset + j: value for j, value in row.items()}
+            row_offset += block.shape[0]
+            col_offset += block.shape[1]
+        return self._from_dod(result, (row_offset, col_offset))
+
+    def add_entries(self, matrix, entries):
+        dod = matrix.to_dod()
+        for (i, j), value in entries.items():
+            row = dod.setdefault(i, {})
+            updated = row.get(j, QQ.zero) + self._scalar(value)
+            if updated:
+                row[j] = updated
+            else:
+                row.pop(j, None)
+        return self._from_dod(dod, matrix.shape)
+
+    def zero_entries(self, matrix, positions):
+        dod = matrix.to_dod()
+        for i, j in positions:
+            dod.get(i, {}).pop(j, None)
+        return self._from_dod(dod, matrix.shape)
+
+    def affine_update(self, matrix, alpha, beta, zeros, corrections):
+        alpha = self._scalar(alpha)
+        dod = {i: {j: value * alpha for j, value in row.items()} for i, row in matrix.to_dod().items()} if alpha else {}
+        for i, j in zeros:
+            dod.get(i, {}).pop(j, None)
+        increments = dict(corrections)
+        if beta:
+            for i in range(min(matrix.shape)):
+                increments[(i, i)] = increments.get((i, i), 0) + beta
+        for (i, j), value in increments.items():
+            row = dod.setdefault(i, {})
+            updated = row.get(j, QQ.zero) + self._scalar(value)
+            if updated:
+                row[j] = updated
+            else:
+                row.pop(j, None)
+        return self._from_dod(dod, matrix.shape)
+
+
+# Registry of available storage backends, keyed by name
+MATRIX_BACKENDS = {
+    'dense': MatrixBackend(),
+    'sparse': DomainMatrixBackend('sparse', 'sparse'),
+    'domain': DomainMatrixBackend('domain', 'dense'),
+}
+
+def register_matrix_backend(backend):
+    """
+    Register an additional storage backend under its name.
+
+    :param backend: MatrixBackend instance.
+    """
+    MATRIX_BACKENDS[backend.name] = backend
+
+def get_matrix_backend(backend):
+    """
+    Resolve a backend name or instance to a MatrixBackend.
+
+    :param backend: Backend name (e.g., 'dense', 'sparse', 'domain') or MatrixBackend instance.
+    :return: MatrixBackend instance.
+    """
+    if isinstance(backend, MatrixBackend):
+        return backend
+    if backend not in MATRIX_BACKENDS:
+        raise ValueError(f"Unknown matrix backend: {backend}")
+    return MATRIX_BACKENDS[backend]
+
+def matrix_backend_for(matrix):
+    """
+    Pick the backend that natively stores a given matrix.
+
+    :param matrix: SymPy Matrix or DomainMatrix.
+    :return: MatrixBackend instance.
+    """
+    if isinstance(matrix, DomainMatrix):
+        return MATRIX_BACKENDS['sparse' if matrix.rep.fmt == 'sparse' else 'domain']
+    return MATRIX_BACKENDS['dense']
+
 # === DegenerationType Class ===
 class DegenerationType:
     def __init__(self, name, parameters=None):
@@ -41,6 +296,9 @@ class DegenerationType:
         :param motive_matrix: Matrix representation of the motive.
         :return: Perturbed Matrix after applying degeneration.
         """
+        if isinstance(motive_matrix, DomainMatrix):
+            return self.apply_backend_degeneration(motive_matrix, matrix_backend_for(motive_matrix))
+
         if self.name == 'logarithmic':
             # Introduce logarithmic scaling factors
             scaling_factor = self.parameters.get('scaling_factor', Rational(1, 100))
@@ -80,9 +338,183 @@ class DegenerationType:
 
         return perturbed_matrix
 
+    def apply_backend_degeneration(self, motive_matrix, backend):
+        """
+        Apply the degeneration using the primitives of a storage backend.
+
+        :param motive_matrix: Matrix in the backend's representation.
+        :param backend: MatrixBackend that stores motive_matrix.
+        :return: Perturbed matrix in the same representation.
+        """
+        rows, cols = backend.shape(motive_matrix)
+
+        if self.name == 'logarithmic':
+            scaling_factor = self.parameters.get('scaling_factor', Rational(1, 100))
+            return backend.scale(backend.eye(rows), 1 + scaling_factor)
+
+        elif self.name == 'tropical':
+            perturb_positions = [
+                (i, j) for i, j in self.parameters.get('perturb_positions', [])
+                if 0 <= i < rows and 0 <= j < cols
+            ]
+            scaling_factor = self.parameters.get('scaling_factor', Rational(1, 200))
+            return backend.scale(backend.zero_entries(motive_matrix, perturb_positions), 1 + scaling_factor)
+
+        elif self.name == 'nodal':
+            nodal_factor = self.parameters.get('nodal_factor', Rational(2, 5))
+            if rows >= 2 and cols >= 2:
+                return backend.add_entries(motive_matrix, {(0, 1): nodal_factor, (1, 0): nodal_factor})
+            return motive_matrix
+
+        elif self.name == 'arithmetic':
+            arithmetic_factor = self.parameters.get('arithmetic_factor', Rational(1, 400))
+            return backend.scale(backend.eye(rows), 1 + arithmetic_factor)
+
+        return motive_matrix
+
+    def fuse(self, fused):
+        """
+        Fold the degeneration into a FusedDegeneration instead of applying it.
+
+        :param fused: FusedDegeneration accumulating the chain.
+        """
+        rows, cols = fused.shape
+
+        if self.name == 'logarithmic':
+            scaling_factor = self.parameters.get('scaling_factor', Rational(1, 100))
+            fused.replace_with_identity(1 + scaling_factor)
+
+        elif self.name == 'tropical':
+            for i, j in self.parameters.get('perturb_positions', []):
+                if 0 <= i < rows and 0 <= j < cols:
+                    fused.zero(i, j)
+            fused.scale(1 + self.parameters.get('scaling_factor', Rational(1, 200)))
+
+        elif self.name == 'nodal':
+            nodal_factor = self.parameters.get('nodal_factor', Rational(2, 5))
+            if rows >= 2 and cols >= 2:
+                fused.add(0, 1, nodal_factor)
+                fused.add(1, 0, nodal_factor)
+
+        elif self.name == 'arithmetic':
+            arithmetic_factor = self.parameters.get('arithmetic_factor', Rational(1, 400))
+            fused.replace_with_identity(1 + arithmetic_factor)
+
+    def apply_block_degeneration(self, blocks, scalar, backend):
+        """
+        Apply the degeneration to the block diagonal matrix scalar * diag(blocks) block by block.
+
+        :param blocks: List of square blocks in the backend's representation.
+        :param scalar: Scalar multiplier of the block diagonal matrix.
+        :param backend: MatrixBackend that stores the blocks.
+        :return: Tuple (blocks, scalar) after the degeneration, or None if the
+                 degeneration couples different blocks and the block structure is lost.
+        """
+        sizes = [backend.shape(block)[0] for block in blocks]
+
+        if self.name == 'logarithmic':
+            scaling_factor = self.parameters.get('scaling_factor', Rational(1, 100))
+            return [backend.eye(size) for size in sizes], 1 + scaling_factor
+
+        elif self.name == 'tropical':
+            local_positions = [[] for _ in blocks]
+            for i, j in self.parameters.get('perturb_positions', []):
+                offset = 0
+                for index, size in enumerate(sizes):
+                    if offset <= i < offset + size and offset <= j < offset + size:
+                        local_positions[index].append((i - offset, j - offset))
+                    offset += size
+            # Entries outside the diagonal blocks are already zero
+            blocks = [
+                backend.zero_entries(block, positions) if positions else block
+                for block, positions in zip(blocks, local_positions)
+            ]
+            scaling_factor = self.parameters.get('scaling_factor', Rational(1, 200))
+            return blocks, scalar * (1 + scaling_factor)
+
+        elif self.name == 'nodal':
+            nodal_factor = self.parameters.get('nodal_factor', Rational(2, 5))
+            if sum(sizes) < 2:
+                return blocks, scalar
+            if sizes[0] < 2 or scalar == 0:
+                return None
+            correction = nodal_factor / scalar
+            return [backend.add_entries(blocks[0], {(0, 1): correction, (1, 0): correction})] + blocks[1:], scalar
+
+        elif self.name == 'arithmetic':
+            arithmetic_factor = self.parameters.get('arithmetic_factor', Rational(1, 400))
+            return [backend.eye(size) for size in sizes], 1 + arithmetic_factor
+
+        return blocks, scalar
+
+# === Fused Degeneration Pipeline ===
+class FusedDegeneration:
+    def __init__(self, shape):
+        """
+        Initialize an empty degeneration chain for matrices of a given shape.
+
+        The chain is kept as the single affine update
+            M -> alpha * B (with the entries in zeros cleared) + beta * I + corrections,
+        where B is the input matrix, or the identity once a logarithmic or arithmetic
+        degeneration has replaced it, and corrections is a sparse dictionary.
+
+        :param shape: Shape (rows, cols) of the input matrix.
+        """
+        self.shape = shape
+        self.identity_base = False
+        self.alpha = Rational(1)
+        self.beta = Rational(0)
+        self.zeros = set()
+        self.corrections = {}
+
+    def replace_with_identity(self, value):
+        self.shape = (self.shape[0], self.shape[0])
+        self.identity_base = True
+        self.alpha = value
+        self.beta = Rational(0)
+        self.zeros = set()
+        self.corrections = {}
+
+    def scale(self, factor):
+        self.alpha *= factor
+        self.beta *= factor
+        self.corrections = {position: value * factor for position, value in self.corrections.items()}
+
+    def zero(self, i, j):
+        # The cleared entry becomes beta * delta_ij + correction, so cancel the identity part explicitly
+        self.zeros.add((i, j))
+        self.corrections[(i, j)] = -self.beta if i == j else Rational(0)
+
+    def add(self, i, j, value):
+        self.corrections[(i, j)] = self.corrections.get((i, j), Rational(0)) + value
+
+    def apply(self, matrix, backend):
+        """
+        Apply the fused update in a single pass.
+
+        :param matrix: Input matrix in the backend's representation.
+        :param backend: MatrixBackend that stores matrix.
+        :return: Perturbed matrix in the same representation.
+        """
+        base = backend.eye(self.shape[0]) if self.identity_base else matrix
+        return backend.affine_update(base, self.alpha, self.beta, self.zeros, self.corrections)
+
+def compile_degenerations(degenerations, shape):
+    """
+    Compile a chain of degenerations into one FusedDegeneration.
+
+    :param degenerations: List of DegenerationType instances, in application order.
+    :param shape: Shape (rows, cols) of the matrix the chain is applied to.
+    :return: FusedDegeneration equivalent to applying the chain in order.
+    """
+    fused = FusedDegeneration(shape)
+    for degeneration in degenerations:
+        degeneration.fuse(fused)
+    return fused
+
 # === Mixed Motives Class ===
 class MixedMotive:
-    def __init__(self, variety_name, dimension, matrix_rep, variety_parameters=None):
+    def __init__(self, variety_name, dimension, matrix_rep, variety_parameters=None, backend='dense'):
         """
         Initialize a MixedMotive with variety-specific parameters.
 
@@ -90,15 +522,28 @@ class MixedMotive:
         :param dimension: Dimension of the motive.
         :param matrix_rep: Matrix representation of the motive.
         :param variety_parameters: Dictionary of variety-specific parameters.
+        :param backend: Storage backend name or MatrixBackend instance ('dense', 'sparse', 'domain').
         """
         self.variety_name = variety_name
         self.dimension = dimension
-        self.matrix_rep = matrix_rep.as_immutable()
+        self.backend = get_matrix_backend(backend)
+        self.matrix_data = self.backend.convert(matrix_rep)
         self.correspondences = []
         self.exact_sequences = []
         self.variety_parameters = variety_parameters or {}
         self.degenerations = []
 
+    @property
+    def matrix_rep(self):
+        """
+        Dense immutable SymPy view of the motive's matrix, built on request.
+        """
+        return self.backend.to_sympy(self.matrix_data)
+
+    @matrix_rep.setter
+    def matrix_rep(self, matrix):
+        self.matrix_data = self.backend.convert(matrix)
+
     def add_correspondence(self, other_motive, morphism_matrix):
         """
         Add a correspondence between two motives via a morphism matrix.
@@ -114,18 +559,37 @@ class MixedMotive:
         """
         Compute the tensor product of two motives using the Kronecker product.
 
+        The Kronecker product is not formed here: the result is a TensorMotive that
+        keeps the factor matrices and only materializes the full matrix on request.
+
         :param other_motive: The other MixedMotive instance.
-        :return: A new MixedMotive instance representing the tensor product.
+        :return: A new TensorMotive instance representing the tensor product.
         """
         new_dimension = self.dimension * other_motive.dimension
         scaling_factor_self = self.variety_parameters.get('tensor_scaling', Rational(1))
         scaling_factor_other = other_motive.variety_parameters.get('tensor_scaling', Rational(1))
-        tensor_matrix = kronecker_product(self.matrix_rep, other_motive.matrix_rep) * (scaling_factor_self * scaling_factor_other)
+        factors_self, scalar_self = self.tensor_factors()
+        factors_other, scalar_other = other_motive.tensor_factors()
         new_variety_name = f"Tensor({self.variety_name}, {other_motive.variety_name})"
-        return MixedMotive(new_variety_name, new_dimension, tensor_matrix, variety_parameters={
-            'interaction_factor': Rational(1),
-            'tensor_scaling': Rational(1)
-        })
+        return TensorMotive(
+            new_variety_name,
+            new_dimension,
+            factors_self + factors_other,
+            scalar_self * scalar_other * scaling_factor_self * scaling_factor_other,
+            variety_parameters={
+                'interaction_factor': Rational(1),
+                'tensor_scaling': Rational(1)
+            },
+            backend=self.backend
+        )
+
+    def tensor_factors(self):
+        """
+        Decompose the motive's matrix into Kronecker factors.
+
+        :return: Tuple (list of factor matrices, scalar multiplier).
+        """
+        return [self.matrix_data], Rational(1)
 
     def dual(self):
         """
@@ -133,27 +597,39 @@ class MixedMotive:
 
         :return: A new MixedMotive instance representing the dual motive.
         """
-        dual_matrix = self.matrix_rep.transpose()
+        dual_matrix = self.backend.transpose(self.matrix_data)
         duality_factor = self.variety_parameters.get('duality_factor', Rational(1))
-        dual_matrix = dual_matrix * duality_factor
-        return MixedMotive(f"Dual({self.variety_name})", self.dimension, dual_matrix, self.variety_parameters)
+        dual_matrix = self.backend.scale(dual_matrix, duality_factor)
+        return MixedMotive(f"Dual({self.variety_name})", self.dimension, dual_matrix, self.variety_parameters,
+                           backend=self.backend)
 
     def triangulate(self, other_motive):
         """
         Triangulate two motives by creating a block diagonal matrix.
 
+        The triangulated matrix kronecker_product(eye(2), diag(A, B)) equals
+        diag(A, B, A, B); it is kept as a BlockDiagonalMotive whose repeated
+        blocks share storage, and only expanded to a full matrix on request.
+
         :param other_motive: The other MixedMotive instance.
-        :return: A new MixedMotive instance representing the triangulated motive.
+        :return: A new BlockDiagonalMotive instance representing the triangulated motive.
         """
         triangulation_weight_self = self.variety_parameters.get('triangulation_weight', Rational(1))
         triangulation_weight_other = other_motive.variety_parameters.get('triangulation_weight', Rational(1))
-        triangulated_matrix = kronecker_product(Matrix.eye(2), diag(self.matrix_rep, other_motive.matrix_rep)) * (triangulation_weight_self + triangulation_weight_other)
+        blocks = [self.matrix_data, self.backend.convert(other_motive.matrix_data)]
         new_dimension = self.dimension + other_motive.dimension
         new_variety_name = f"Triangulate({self.variety_name}, {other_motive.variety_name})"
-        return MixedMotive(new_variety_name, new_dimension, triangulated_matrix, variety_parameters={
-            'interaction_factor': Rational(1),
-            'triangulation_weight': Rational(1)
-        })
+        return BlockDiagonalMotive(
+            new_variety_name,
+            new_dimension,
+            blocks * 2,
+            triangulation_weight_self + triangulation_weight_other,
+            variety_parameters={
+                'interaction_factor': Rational(1),
+                'triangulation_weight': Rational(1)
+            },
+            backend=self.backend
+        )
 
     def add_exact_sequence(self, motive1, motive2, motive3):
         """
@@ -183,29 +659,304 @@ class MixedMotive:
         """
         Apply all added degenerations to the motive's matrix representation.
 
-        :return: The perturbed matrix after applying all degenerations.
+        The chain is compiled into a single fused update, so the matrix is rebuilt
+        once instead of once per degeneration.
+
+        :return: The perturbed matrix after applying all degenerations, in the motive's storage backend.
         """
-        perturbed_matrix = self.matrix_rep
-        for degeneration in self.degenerations:
-            perturbed_matrix = degeneration.apply_degeneration(perturbed_matrix)
-        return perturbed_matrix
+        fused = compile_degenerations(self.degenerations, self.backend.shape(self.matrix_data))
+        return fused.apply(self.matrix_data, self.backend)
 
-    def check_exact_sequence(self):
+    def check_exact_sequence(self, method='fraction_free'):
         """
         Verify the exactness of all exact sequences.
         Implement homological algebra checks to ensure image equals kernel.
 
+        :param method: Rank engine passed to verify_exact_sequence ('fraction_free', 'modular' or 'sympy').
         :return: Dictionary mapping exact sequences to their verification status.
         """
         verifications = {}
         for idx, seq in enumerate(self.exact_sequences, 1):
-            is_exact = verify_exact_sequence(seq)
+            is_exact = verify_exact_sequence(seq, method=method)
             verifications[f"Exact Sequence {idx}"] = is_exact
         return verifications
 
     def __repr__(self):
         return f"MixedMotive({self.variety_name}, dim={self.dimension})"
 
+# === Lazy Tensor Product Class ===
+class TensorMotive(MixedMotive):
+    def __init__(self, variety_name, dimension, factors, scalar=Rational(1), variety_parameters=None, backend='dense'):
+        """
+        Initialize a TensorMotive representing scalar * (F_1 ⊗ F_2 ⊗ ... ⊗ F_k).
+
+        Only the factor matrices are stored. Matrix-vector products, trace, determinant
+        and eigenvalues are computed from the factors; the full Kronecker matrix is built
+        the first time matrix_data (or matrix_rep) is accessed.
+
+        :param variety_name: Name of the variety.
+        :param dimension: Dimension of the motive.
+        :param factors: List of factor matrices.
+        :param scalar: Scalar multiplier of the Kronecker product.
+        :param variety_parameters: Dictionary of variety-specific parameters.
+        :param backend: Storage backend name or MatrixBackend instance.
+        """
+        self.variety_name = variety_name
+        self.dimension = dimension
+        self.backend = get_matrix_backend(backend)
+        self.factors = [self.backend.convert(factor) for factor in factors]
+        self.scalar = scalar
+        self._matrix_data = None
+        self.correspondences = []
+        self.exact_sequences = []
+        self.variety_parameters = variety_parameters or {}
+        self.degenerations = []
+
+    @property
+    def matrix_data(self):
+        """
+        Full Kronecker matrix in the motive's storage backend, materialized on first access.
+        """
+        if self._matrix_data is None:
+            self._matrix_data = self.materialize()
+        return self._matrix_data
+
+    @matrix_data.setter
+    def matrix_data(self, matrix):
+        self._matrix_data = matrix
+
+    @property
+    def is_materialized(self):
+        return self._matrix_data is not None
+
+    def materialize(self):
+        """
+        Build the full Kronecker product of the factors.
+
+        :return: Matrix in the motive's storage backend.
+        """
+        matrix = self.factors[0]
+        for factor in self.factors[1:]:
+            matrix = self.backend.kronecker(matrix, factor)
+        return self.backend.scale(matrix, self.scalar)
+
+    def tensor_factors(self):
+        if self.is_materialized:
+            return [self._matrix_data], Rational(1)
+        return list(self.factors), self.scalar
+
+    def dual(self):
+        """
+        Compute the dual factor by factor, since (A ⊗ B)^T = A^T ⊗ B^T.
+
+        :return: A new TensorMotive instance representing the dual motive.
+        """
+        if self.is_materialized:
+            return super().dual()
+        duality_factor = self.variety_parameters.get('duality_factor', Rational(1))
+        return TensorMotive(
+            f"Dual({self.variety_name})",
+            self.dimension,
+            [self.backend.transpose(factor) for factor in self.factors],
+            self.scalar * duality_factor,
+            self.variety_parameters,
+            backend=self.backend
+        )
+
+    def _sympy_factors(self):
+        return [self.backend.to_sympy(factor) for factor in self.factors]
+
+    def matvec(self, vector):
+        """
+        Multiply the tensor product by a vector without forming the Kronecker matrix.
+
+        Uses (A ⊗ B) vec(X) = vec(A X B^T): the vector is viewed as a k-way tensor and
+        each factor is applied along its own axis.
+
+        :param vector: Column vector (Matrix or list) of length equal to the number of columns.
+        :return: Column Matrix with the product.
+        """
+        factors = self._sympy_factors()
+        result = list(vector)
+        left = 1
+        for axis, factor in enumerate(factors):
+            right = 1
+            for later in factors[axis + 1:]:
+                right *= later.cols
+            block_size = factor.cols * right
+            updated = []
+            for offset in range(left):
+                block = Matrix(factor.cols, right, result[offset * block_size:(offset + 1) * block_size])
+                updated.extend(factor * block)
+            result = updated
+            left *= factor.rows
+        return Matrix(result) * self.scalar
+
+    def trace(self):
+        """
+        Compute the trace as the product of the factor traces.
+
+        :return: Trace of the tensor product.
+        """
+        result = self.scalar
+        for factor in self._sympy_factors():
+            result *= factor.trace()
+        return result
+
+    def determinant(self):
+        """
+        Compute the determinant via det(A_1 ⊗ ... ⊗ A_k) = prod_i det(A_i)^(N / n_i).
+
+        :return: Determinant of the tensor product.
+        """
+        factors = self._sympy_factors()
+        size = 1
+        for factor in factors:
+            size *= factor.rows
+        result = self.scalar ** size
+        for factor in factors:
+            result *= factor.det() ** (size // factor.rows)
+        return result
+
+    def eigenvalues(self):
+        """
+        Compute the eigenvalues as all products of factor eigenvalues.
+
+        :return: Dictionary mapping eigenvalues to algebraic multiplicities.
+        """
+        eigenvalues = {self.scalar: 1}
+        for factor in self._sympy_factors():
+            combined = {}
+            for value, multiplicity in eigenvalues.items():
+                for factor_value, factor_multiplicity in factor.eigenvals().items():
+                    product = expand(value * factor_value)
+                    combined[product] = combined.get(product, 0) + multiplicity * factor_multiplicity
+            eigenvalues = combined
+        return eigenvalues
+
+    def __repr__(self):
+        return f"TensorMotive({self.variety_name}, dim={self.dimension}, factors={len(self.factors)})"
+
+# === Block Diagonal Motive Class ===
+class BlockDiagonalMotive(MixedMotive):
+    def __init__(self, variety_name, dimension, blocks, scalar=Rational(1), variety_parameters=None, backend='dense'):
+        """
+        Initialize a BlockDiagonalMotive representing scalar * diag(B_1, ..., B_k).
+
+        The blocks are stored separately; degenerations and eigenvalues are computed
+        block by block, and the full matrix is built the first time matrix_data
+        (or matrix_rep) is accessed.
+
+        :param variety_name: Name of the variety.
+        :param dimension: Dimension of the motive.
+        :param blocks: List of diagonal blocks.
+        :param scalar: Scalar multiplier of the block diagonal matrix.
+        :param variety_parameters: Dictionary of variety-specific parameters.
+        :param backend: Storage backend name or MatrixBackend instance.
+        """
+        self.variety_name = variety_name
+        self.dimension = dimension
+        self.backend = get_matrix_backend(backend)
+        self.blocks = [self.backend.convert(block) for block in blocks]
+        self.scalar = scalar
+        self._matrix_data = None
+        self.correspondences = []
+        self.exact_sequences = []
+        self.variety_parameters = variety_parameters or {}
+        self.degenerations = []
+
+    @property
+    def matrix_data(self):
+        """
+        Full block diagonal matrix in the motive's storage backend, materialized on first access.
+        """
+        if self._matrix_data is None:
+            self._matrix_data = self.materialize()
+        return self._matrix_data
+
+    @matrix_data.setter
+    def matrix_data(self, matrix):
+        self._matrix_data = matrix
+
+    @property
+    def is_materialized(self):
+        return self._matrix_data is not None
+
+    @property
+    def is_square(self):
+        return all(rows == cols for rows, cols in (self.backend.shape(block) for block in self.blocks))
+
+    def materialize(self):
+        """
+        Build the full block diagonal matrix.
+
+        :return: Matrix in the motive's storage backend.
+        """
+        return self.backend.scale(self.backend.block_diagonal(*self.blocks), self.scalar)
+
+    def dual(self):
+        """
+        Compute the dual block by block, since diag(A, B)^T = diag(A^T, B^T).
+
+        :return: A new BlockDiagonalMotive instance representing the dual motive.
+        """
+        if self.is_materialized:
+            return super().dual()
+        duality_factor = self.variety_parameters.get('duality_factor', Rational(1))
+        return BlockDiagonalMotive(
+            f"Dual({self.variety_name})",
+            self.dimension,
+            [self.backend.transpose(block) for block in self.blocks],
+            self.scalar * duality_factor,
+            self.variety_parameters,
+            backend=self.backend
+        )
+
+    def degenerate(self):
+        """
+        Apply all added degenerations block by block.
+
+        :return: A new BlockDiagonalMotive with the perturbed blocks, or None if a
+                 degeneration couples different blocks.
+        """
+        if self.is_materialized or not self.is_square:
+            return None
+        blocks, scalar = self.blocks, self.scalar
+        for degeneration in self.degenerations:
+            updated = degeneration.apply_block_degeneration(blocks, scalar, self.backend)
+            if updated is None:
+                return None
+            blocks, scalar = updated
+        return BlockDiagonalMotive(self.variety_name, self.dimension, blocks, scalar,
+                                   self.variety_parameters, backend=self.backend)
+
+    def apply_degenerations(self):
+        """
+        Apply all added degenerations, block by block whenever the degenerations allow it.
+
+        :return: The perturbed matrix after applying all degenerations, in the motive's storage backend.
+        """
+        degenerated = self.degenerate()
+        if degenerated is None:
+            return super().apply_degenerations()
+        return degenerated.materialize()
+
+    def eigenvalues(self):
+        """
+        Compute the eigenvalues as the union of the block eigenvalues.
+
+        :return: Dictionary mapping eigenvalues to algebraic multiplicities.
+        """
+        eigenvalues = {}
+        for block in self.blocks:
+            for value, multiplicity in self.backend.to_sympy(block).eigenvals().items():
+                value = expand(value * self.scalar)
+                eigenvalues[value] = eigenvalues.get(value, 0) + multiplicity
+        return eigenvalues
+
+    def __repr__(self):
+        return f"BlockDiagonalMotive({self.variety_name}, dim={self.dimension}, blocks={len(self.blocks)})"
+
 # === Automorphic L-function Class ===
 class AutomorphicLFunction:
     def __init__(self, variety_name, variety_parameters=None):
@@ -294,6 +1045,215 @@ class AutomorphicLFunction:
     def __repr__(self):
         return f"AutomorphicLFunction({self.variety_name}, avg_L={self.average_l_value():.6f}, avg_motivic={self.average_motivic_contribution():.6f})"
 
+# === Identity Plus Rank-One Matrix Class ===
+class IdentityPlusRankOneMatrix:
+    def __init__(self, alpha, beta, n, corrections=None):
+        """
+        Initialize the n x n matrix alpha * I + beta * J, where J is the all-ones matrix.
+
+        Only (alpha, beta, n) are stored. Degenerations add a sparse dictionary of
+        corrections; while it is empty, eigenvalues, determinant, inverse and products
+        are computed in closed form.
+
+        :param alpha: Coefficient of the identity.
+        :param beta: Coefficient of the all-ones matrix.
+        :param n: Size of the matrix.
+        :param corrections: Dictionary mapping (row, col) positions to sparse corrections.
+        """
+        self.alpha = alpha
+        self.beta = beta
+        self.n = n
+        self.corrections = {position: value for position, value in (corrections or {}).items() if value != 0}
+
+    @property
+    def shape(self):
+        return (self.n, self.n)
+
+    @property
+    def is_rank_one_update(self):
+        return not self.corrections
+
+    def entry(self, i, j):
+        """
+        Compute a single entry without building the matrix.
+
+        :return: Entry (i, j).
+        """
+        return (self.alpha if i == j else 0) + self.beta + self.corrections.get((i, j), 0)
+
+    def to_matrix(self):
+        """
+        Expand to a dense SymPy Matrix.
+
+        :return: Mutable dense Matrix.
+        """
+        return Matrix(self.n, self.n, lambda i, j: self.entry(i, j))
+
+    def eigenvalues(self):
+        """
+        Compute the eigenvalues: alpha + n * beta once (eigenvector of ones) and alpha n - 1 times.
+
+        :return: Dictionary mapping eigenvalues to algebraic multiplicities.
+        """
+        if not self.is_rank_one_update:
+            return self.to_matrix().eigenvals()
+        eigenvalues = {}
+        for value, multiplicity in ((self.alpha + self.n * self.beta, 1), (self.alpha, self.n - 1)):
+            if multiplicity:
+                eigenvalues[value] = eigenvalues.get(value, 0) + multiplicity
+        return eigenvalues
+
+    def det(self):
+        """
+        Compute the determinant alpha^(n - 1) * (alpha + n * beta).
+
+        :return: Determinant.
+        """
+        if not self.is_rank_one_update:
+            return self.to_matrix().det()
+        return self.alpha ** (self.n - 1) * (self.alpha + self.n * self.beta)
+
+    def inverse(self):
+        """
+        Invert with the Sherman-Morrison formula:
+        (alpha * I + beta * J)^-1 = I / alpha - beta / (alpha * (alpha + n * beta)) * J.
+
+        :return: Inverse as an IdentityPlusRankOneMatrix (or a dense Matrix if corrections are present).
+        """
+        if not self.is_rank_one_update or self.alpha == 0:
+            return self.to_matrix().inv()
+        if self.alpha + self.n * self.beta == 0:
+            raise ValueError("Matrix is singular.")
+        return IdentityPlusRankOneMatrix(
+            1 / self.alpha,
+            -self.beta / (self.alpha * (self.alpha + self.n * self.beta)),
+            self.n
+        )
+
+    def __mul__(self, other):
+        """
+        Multiply by a scalar, another IdentityPlusRankOneMatrix (closed form) or a Matrix.
+
+        (a1 I + b1 J)(a2 I + b2 J) = a1 a2 I + (a1 b2 + b1 a2 + n b1 b2) J since J^2 = n J.
+        """
+        if isinstance(other, IdentityPlusRankOneMatrix):
+            if other.n != self.n:
+                raise ValueError("Matrix dimensions do not match.")
+            if self.is_rank_one_update and other.is_rank_one_update:
+                return IdentityPlusRankOneMatrix(
+                    self.alpha * other.alpha,
+                    self.alpha * other.beta + self.beta * other.alpha + self.n * self.beta * other.beta,
+                    self.n
+                )
+            return self.to_matrix() * other.to_matrix()
+        if hasattr(other, 'shape'):
+            return self.to_matrix() * other
+        return IdentityPlusRankOneMatrix(
+            self.alpha * other,
+            self.beta * other,
+            self.n,
+            {position: value * other for position, value in self.corrections.items()}
+        )
+
+    def __rmul__(self, other):
+        return self * other
+
+    def apply_degenerations(self, degenerations):
+        """
+        Apply a chain of degenerations through the fused degeneration pipeline.
+
+        :param degenerations: List of DegenerationType instances.
+        :return: New IdentityPlusRankOneMatrix carrying the result.
+        """
+        return self.apply_fused(compile_degenerations(degenerations, self.shape))
+
+    def apply_fused(self, fused):
+        """
+        Apply alpha_f * B (with entries cleared) + beta_f * I + corrections_f to this matrix B.
+
+        :param fused: FusedDegeneration compiled for an n x n matrix.
+        :return: New IdentityPlusRankOneMatrix carrying the result.
+        """
+        if fused.identity_base:
+            base = IdentityPlusRankOneMatrix(Rational(1), Rational(0), self.n)
+        else:
+            base = self
+        corrections = {position: fused.alpha * value for position, value in base.corrections.items()}
+        for (i, j) in fused.zeros:
+            corrections[(i, j)] = corrections.get((i, j), 0) - fused.alpha * base.entry(i, j)
+        for position, value in fused.corrections.items():
+            corrections[position] = corrections.get(position, 0) + value
+        return IdentityPlusRankOneMatrix(
+            fused.alpha * base.alpha + fused.beta,
+            fused.alpha * base.beta,
+            self.n,
+            corrections
+        )
+
+    def __repr__(self):
+        return f"IdentityPlusRankOneMatrix(alpha={self.alpha}, beta={self.beta}, n={self.n}, corrections={len(self.corrections)})"
+
+# === Differential Operator Cache ===
+class DifferentialOperatorCache:
+    def __init__(self, maxsize=128):
+        """
+        Initialize an LRU cache of partial derivatives keyed on the structural hash of an expression.
+
+        Each entry holds the symbolic partials d/dx and d/dy, computed once, and their
+        lambdify-compiled NumPy evaluators, compiled on first use.
+
+        :param maxsize: Maximum number of expressions kept before the least recently used is evicted.
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, expression):
+        entry = self.entries.get(expression)
+        if entry is None:
+            self.misses += 1
+            entry = {'partials': (diff(expression, x), diff(expression, y))}
+            self.entries[expression] = entry
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(expression)
+        return entry
+
+    def partials(self, expression):
+        """
+        Symbolic partial derivatives of an expression in x and y.
+
+        :param expression: SymPy expression in x and y.
+        :return: Tuple (d/dx, d/dy).
+        """
+        return self._entry(expression)['partials']
+
+    def evaluators(self, expression):
+        """
+        NumPy evaluators of the partial derivatives, compiled once with lambdify.
+
+        :param expression: SymPy expression in x and y.
+        :return: Tuple of callables (d/dx, d/dy) taking NumPy arrays x and y.
+        """
+        entry = self._entry(expression)
+        if 'evaluators' not in entry:
+            entry['evaluators'] = tuple(lambdify((x, y), partial, 'numpy') for partial in entry['partials'])
+        return entry['evaluators']
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"DifferentialOperatorCache(size={len(self.entries)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+# Cache shared by all cohomology differential operators
+DIFFERENTIAL_OPERATOR_CACHE = DifferentialOperatorCache()
+
 # === Cohomology Type Class ===
 class CohomologyType:
     def __init__(self, variety_name, cohomology_type, rank, dimension, cohomology_parameters=None):
@@ -328,23 +1288,31 @@ class CohomologyType:
 
         :return: Perturbed Matrix.
         """
-        base_matrix = Matrix.eye(self.dimension)
-        perturbed_matrix = base_matrix.copy()
+        return self.matrix_perturbation_structured().to_matrix()
+
+    def matrix_perturbation_structured(self):
+        """
+        Build the perturbed identity without expanding it to a dense Matrix.
+
+        The perturbed identity has 1 + diagonal_perturb on the diagonal and off_diagonal_perturb
+        elsewhere, i.e. (1 + diagonal_perturb - off_diagonal_perturb) * I + off_diagonal_perturb * J.
+
+        :return: Perturbed matrix as an IdentityPlusRankOneMatrix.
+        """
         diagonal_perturb = self.cohomology_parameters.get('diagonal_perturb', Rational(1, 10))
         off_diagonal_perturb = self.cohomology_parameters.get('off_diagonal_perturb', Rational(1, 20))
 
         # Apply initial perturbations
-        for i in range(self.dimension):
-            for j in range(self.dimension):
-                if i == j:
-                    perturbed_matrix[i, j] += diagonal_perturb
-                else:
-                    perturbed_matrix[i, j] += off_diagonal_perturb
+        perturbed_matrix = IdentityPlusRankOneMatrix(
+            1 + diagonal_perturb - off_diagonal_perturb,
+            off_diagonal_perturb,
+            self.dimension
+        )
 
         # Apply degenerations if any
         degenerations = self.cohomology_parameters.get('degenerations', [])
-        for degeneration in degenerations:
-            perturbed_matrix = degeneration.apply_degeneration(perturbed_matrix)
+        if degenerations:
+            perturbed_matrix = perturbed_matrix.apply_degenerations(degenerations)
 
         return perturbed_matrix
 
@@ -357,29 +1325,279 @@ class CohomologyType:
         """
         coeff_x = self.cohomology_parameters.get('diff_coeff_x', Rational(1))
         coeff_y = self.cohomology_parameters.get('diff_coeff_y', Rational(1))
-        return coeff_x * diff(function(x, y), x) + coeff_y * diff(function(x, y), y)
+        partial_x, partial_y = DIFFERENTIAL_OPERATOR_CACHE.partials(function(x, y))
+        return coeff_x * partial_x + coeff_y * partial_y
+
+    def evaluate_differential_operator(self, function, x_values, y_values):
+        """
+        Evaluate the differential operator numerically over arrays of (x, y) points.
+
+        :param function: A function of two variables, x and y.
+        :param x_values: NumPy array (or scalar) of x coordinates.
+        :param y_values: NumPy array (or scalar) of y coordinates, broadcastable against x_values.
+        :return: NumPy array with the operator evaluated at each point.
+        """
+        coeff_x = float(self.cohomology_parameters.get('diff_coeff_x', Rational(1)))
+        coeff_y = float(self.cohomology_parameters.get('diff_coeff_y', Rational(1)))
+        evaluate_x, evaluate_y = DIFFERENTIAL_OPERATOR_CACHE.evaluators(function(x, y))
+        return coeff_x * evaluate_x(x_values, y_values) + coeff_y * evaluate_y(x_values, y_values)
 
     def __repr__(self):
         return f"{self.cohomology_type}({self.variety_name}, cohomology_value={self.compute_cohomology_value():.6f})"
 
+# === Exact Rank Engine ===
+def integer_domain_matrix(matrix):
+    """
+    Convert a matrix to a DomainMatrix over ZZ with the same rank.
+
+    Each row is multiplied by the LCM of its denominators, which does not change
+    the row space, so rank and nullity are preserved.
+
+    :param matrix: SymPy Matrix or DomainMatrix with rational entries.
+    :return: Sparse DomainMatrix over ZZ.
+    """
+    rational_matrix = MATRIX_BACKENDS['sparse'].convert(matrix)
+    _, integer_matrix = rational_matrix.clear_denoms_rowwise(convert=True)
+    return integer_matrix
+
+def fraction_free_rank(matrix):
+    """
+    Compute the exact rank by fraction-free elimination over ZZ.
+
+    :param matrix: SymPy Matrix or DomainMatrix with rational entries.
+    :return: Rank of the matrix.
+    """
+    integer_matrix = integer_domain_matrix(matrix)
+    if integer_matrix.nnz() == 0:
+        return 0
+    _, _, pivots = integer_matrix.rref_den()
+    return len(pivots)
+
+def rank_mod_p(integer_rows, p):
+    """
+    Compute the rank of an integer matrix modulo a word-sized prime.
+
+    Gaussian elimination is vectorized over rows with int64 NumPy arrays; every
+    intermediate product is below p**2 < 2**62.
+
+    :param integer_rows: NumPy object array of Python integers.
+    :param p: Prime modulus below 2**31.
+    :return: Rank of the matrix over GF(p).
+    """
+    reduced = (integer_rows % p).astype(np.int64)
+    rows, cols = reduced.shape
+    rank = 0
+    for col in range(cols):
+        if rank == rows:
+            break
+        candidates = np.nonzero(reduced[rank:, col])[0]
+        if candidates.size == 0:
+            continue
+        pivot = rank + candidates[0]
+        if pivot != rank:
+            reduced[[rank, pivot]] = reduced[[pivot, rank]]
+        inverse = pow(int(reduced[rank, col]), p - 2, p)
+        reduced[rank] = (reduced[rank] * inverse) % p
+        multipliers = reduced[rank + 1:, col].copy()
+        reduced[rank + 1:] = (reduced[rank + 1:] - np.outer(multipliers, reduced[rank])) % p
+        rank += 1
+    return rank
+
+def multimodular_rank(matrix, max_primes=64):
+    """
+    Compute the exact rank from ranks modulo several word-sized primes.
+
+    rank mod p never exceeds the rational rank, and it is smaller only if p divides
+    every maximal non-zero minor. Primes are added until their product exceeds the
+    Hadamard bound on those minors, at which point the largest modular rank is
+    certified to be the rational rank. Falls back to fraction-free elimination if
+    max_primes is not enough.
+
+    :param matrix: SymPy Matrix or DomainMatrix with rational entries.
+    :param max_primes: Maximum number of primes to try.
+    :return: Rank of the matrix.
+    """
+    integer_matrix = integer_domain_matrix(matrix)
+    rows, cols = integer_matrix.shape
+    if rows == 0 or cols == 0 or integer_matrix.nnz() == 0:
+        return 0
+    integer_rows = np.zeros((rows, cols), dtype=object)
+    for (i, j), value in integer_matrix.to_dok().items():
+        integer_rows[i, j] = int(value)
+
+    # log of the Hadamard bound: product of the row norms
+    log_bound = sum(
+        0.5 * log(sum(value * value for value in row)) for row in integer_rows.tolist() if any(row)
+    )
+    rank = 0
+    log_modulus = 0.0
+    p = 2 ** 31
+    for _ in range(max_primes):
+        p = prevprime(p)
+        rank = max(rank, rank_mod_p(integer_rows, p))
+        log_modulus += log(p)
+        if rank == min(rows, cols) or log_modulus > log_bound:
+            return rank
+    return fraction_free_rank(integer_matrix)
+
+def exact_rank(matrix, method='fraction_free'):
+    """
+    Compute the rank of a matrix with the selected exact engine.
+
+    Matrices with entries outside QQ (e.g. sqrt(2) or pi) always use the generic engine.
+
+    :param matrix: SymPy Matrix or DomainMatrix.
+    :param method: 'fraction_free' (DomainMatrix over ZZ), 'modular' (certified multi-modular)
+                   or 'sympy' (generic Matrix.rank()).
+    :return: Rank of the matrix.
+    """
+    if method in ('fraction_free', 'modular'):
+        try:
+            rational_matrix = MATRIX_BACKENDS['sparse'].convert(matrix)
+        except CoercionFailed:
+            method = 'sympy'
+    if method == 'fraction_free':
+        return fraction_free_rank(rational_matrix)
+    elif method == 'modular':
+        return multimodular_rank(rational_matrix)
+    elif method == 'sympy':
+        return MATRIX_BACKENDS['dense'].convert(matrix).rank()
+    raise ValueError(f"Unknown rank method: {method}")
+
+# === Factorization Cache ===
+def matrix_content_key(matrix):
+    """
+    Build a hashable key from the content of a matrix.
+
+    Immutable SymPy matrices already hash by content; DomainMatrix instances are
+    keyed on their shape, domain and non-zero entries.
+
+    :param matrix: SymPy Matrix or DomainMatrix.
+    :return: Hashable key equal for matrices with equal content.
+    """
+    if isinstance(matrix, DomainMatrix):
+        return ('domain', matrix.shape, str(matrix.domain), frozenset(matrix.to_dok().items()))
+    return ('sympy', matrix.as_immutable())
+
+class FactorizationCache:
+    def __init__(self, maxsize=256):
+        """
+        Initialize an LRU cache of rank, nullspace basis and RREF keyed on matrix content.
+
+        :param maxsize: Maximum number of matrices kept before the least recently used is evicted.
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, matrix):
+        key = matrix_content_key(matrix)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = {}
+            self.entries[key] = entry
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(key)
+        return entry
+
+    def _lookup(self, matrix, name, compute):
+        entry = self._entry(matrix)
+        if name in entry:
+            self.hits += 1
+        else:
+            self.misses += 1
+            entry[name] = compute()
+        return entry[name]
+
+    def rank(self, matrix, method='fraction_free'):
+        """
+        Cached exact rank; reuses a cached RREF when one is available.
+
+        :param matrix: SymPy Matrix or DomainMatrix.
+        :param method: Rank engine used on a cache miss, see exact_rank().
+        :return: Rank of the matrix.
+        """
+        entry = self._entry(matrix)
+        if 'rank' not in entry and 'rref' in entry:
+            entry['rank'] = len(entry['rref'][1])
+        return self._lookup(matrix, 'rank', lambda: exact_rank(matrix, method))
+
+    def rref(self, matrix):
+        """
+        Cached reduced row echelon form over QQ.
+
+        :param matrix: SymPy Matrix or DomainMatrix.
+        :return: Tuple (RREF as a SymPy Matrix, tuple of pivot columns).
+        """
+        def compute():
+            try:
+                reduced, pivots = MATRIX_BACKENDS['sparse'].convert(matrix).rref()
+            except CoercionFailed:
+                # Entries outside QQ: generic SymPy elimination
+                reduced, pivots = MATRIX_BACKENDS['dense'].convert(matrix).rref()
+                return reduced.as_immutable(), tuple(pivots)
+            return reduced.to_Matrix().as_immutable(), tuple(pivots)
+        return self._lookup(matrix, 'rref', compute)
+
+    def nullspace(self, matrix):
+        """
+        Cached nullspace basis over QQ.
+
+        :param matrix: SymPy Matrix or DomainMatrix.
+        :return: List of column vectors spanning the kernel.
+        """
+        def compute():
+            try:
+                basis = MATRIX_BACKENDS['sparse'].convert(matrix).nullspace().to_Matrix()
+            except CoercionFailed:
+                # Entries outside QQ: generic SymPy nullspace
+                return [vector.as_immutable() for vector in MATRIX_BACKENDS['dense'].convert(matrix).nullspace()]
+            return [basis.row(i).T.as_immutable() for i in range(basis.rows)]
+        return self._lookup(matrix, 'nullspace', compute)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f"FactorizationCache(size={len(self)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+# Cache shared by all exactness checks
+FACTORIZATION_CACHE = FactorizationCache()
+
 # === Exact Sequence Verification Function ===
-def verify_exact_sequence(exact_sequence):
+def verify_exact_sequence(exact_sequence, method='fraction_free', cache=None):
     """
     Verify the exactness of an exact sequence.
     Implement homological algebra checks to ensure image equals kernel.
 
     :param exact_sequence: Tuple of three matrices representing the sequence (f: A -> B, g: B -> C).
+    :param method: Rank engine, see exact_rank(). 'sympy' reproduces the original uncached rank()/nullspace() check.
+    :param cache: FactorizationCache to use; defaults to the shared FACTORIZATION_CACHE.
     :return: Boolean indicating whether the sequence is exact.
     """
+    cache = cache if cache is not None else FACTORIZATION_CACHE
     # Extract morphism matrices
     f, g, _ = exact_sequence  # The third matrix is often unused in verification
 
-    # Compute image of f
-    image_f = f.rank()
+    if method == 'sympy':
+        # Compute image of f
+        image_f = f.rank()
 
-    # Compute kernel of g
-    kernel_g = g.nullspace()
-    dim_kernel_g = len(kernel_g)
+        # Compute kernel of g
+        kernel_g = g.nullspace()
+        dim_kernel_g = len(kernel_g)
+    else:
+        # dim(image(f)) = rank(f) and dim(kernel(g)) = cols(g) - rank(g) by rank-nullity
+        image_f = cache.rank(f, method)
+        dim_kernel_g = g.shape[1] - cache.rank(g, method)
 
     # Exactness condition: image(f) == kernel(g)
     # Therefore, dim(image(f)) should equal dim(kernel(g))
@@ -654,9 +1872,9 @@ def main():
 
     # Compute multiple L-values without randomness
     for l_func in l_functions:
+        s_val = 2.0  # Fixed s-value; can be varied as needed
+        l_val = l_func.compute_l_function(s_val)  # The realistic model does not depend on s, so compute it once
         for _ in range(10):  # Number of deterministic test points
-            s_val = 2.0  # Fixed s-value; can be varied as needed
-            l_val = l_func.compute_l_function(s_val)
             motivic_contribution = l_val * Rational(9, 10)  # Example relation (0.9)
             l_func.add_l_value(l_val, motivic_contribution)
 
@@ -703,7 +1921,7 @@ def main():
         # Apply all degenerations
         perturbed_matrix = motive.apply_degenerations()
         # Update the matrix_rep with the perturbed matrix
-        motive.matrix_rep = perturbed_matrix.as_immutable()
+        motive.matrix_data = perturbed_matrix
 
     # Verify Exact Sequences
     exact_sequence_verifications = {}
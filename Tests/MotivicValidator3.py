@@ -1,9 +1,163 @@
-from sympy import Matrix, diag, kronecker_product, symbols, diff, sin, cos, sqrt, Rational, pprint
+from sympy import Matrix, diag, kronecker_product, symbols, diff, sin, cos, sqrt, Rational, pprint, sympify, QQ
 from sympy.abc import s, x, y
 from sympy import init_printing
+from sympy.polys.matrices import DomainMatrix
 
 init_printing(use_unicode=True)
 
+# === Matrix Storage Backends ===
+class MatrixBackend:
+    # Dense SymPy immutable storage (the original representation of MixedMotive)
+    name = 'dense'
+
+    def convert(self, matrix):
+        if isinstance(matrix, DomainMatrix):
+            return matrix.to_Matrix().as_immutable()
+        return matrix.as_immutable()
+
+    def to_sympy(self, matrix):
+        return matrix
+
+    def shape(self, matrix):
+        return matrix.shape
+
+    def eye(self, n):
+        return Matrix.eye(n).as_immutable()
+
+    def scale(self, matrix, factor):
+        return (matrix * factor).as_immutable()
+
+    def add_identity(self, matrix, factor):
+        n = min(matrix.shape)
+        return self.add_entries(matrix, {(i, i): factor for i in range(n)})
+
+    def transpose(self, matrix):
+        return matrix.transpose()
+
+    def kronecker(self, matrix_a, matrix_b):
+        return kronecker_product(matrix_a, matrix_b).as_immutable()
+
+    def block_diagonal(self, *blocks):
+        return diag(*blocks).as_immutable()
+
+    def add_entries(self, matrix, entries):
+        updated = matrix.as_mutable()
+        for (i, j), value in entries.items():
+            updated[i, j] += value
+        return updated.as_immutable()
+
+    def zero_entries(self, matrix, positions):
+        updated = matrix.as_mutable()
+        for i, j in positions:
+            updated[i, j] = 0
+        return updated.as_immutable()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name})"
+
+
+class DomainMatrixBackend(MatrixBackend):
+    # Exact DomainMatrix storage over QQ: fmt='sparse' keeps only the non-zero rationals
+    # (dict of keys), fmt='dense' keeps a flat list of rationals. No Expr objects are built.
+    def __init__(self, name, fmt):
+        self.name = name
+        self.fmt = fmt
+
+    def _format(self, matrix):
+        return matrix.to_sparse() if self.fmt == 'sparse' else matrix.to_dense()
+
+    def _from_dod(self, dod, shape):
+        return self._format(DomainMatrix.from_dod(dod, shape, QQ))
+
+    def _scalar(self, value):
+        return QQ.from_sympy(sympify(value))
+
+    def convert(self, matrix):
+        if isinstance(matrix, DomainMatrix):
+            return self._format(matrix.convert_to(QQ))
+        dok = {pos: self._scalar(value) for pos, value in matrix.todok().items()}
+        return self._format(DomainMatrix.from_dok(dok, matrix.shape, QQ))
+
+    def to_sympy(self, matrix):
+        return matrix.to_Matrix().as_immutable()
+
+    def eye(self, n):
+        return self._format(DomainMatrix.eye(n, QQ))
+
+    def scale(self, matrix, factor):
+        return matrix * self._scalar(factor)
+
+    def add_identity(self, matrix, factor):
+        n = min(matrix.shape)
+        return self.add_entries(matrix, {(i, i): factor for i in range(n)})
+
+    def transpose(self, matrix):
+        return matrix.transpose()
+
+    def kronecker(self, matrix_a, matrix_b):
+        rows_b, cols_b = matrix_b.shape
+        dod_b = matrix_b.to_dod()
+        result = {}
+        for i, row_a in matrix_a.to_dod().items():
+            for k, row_b in dod_b.items():
+                result[i * rows_b + k] = {
+                    j * cols_b + l: a_ij * b_kl
+                    for j, a_ij in row_a.items()
+                    for l, b_kl in row_b.items()
+                }
+        shape = (matrix_a.shape[0] * rows_b, matrix_a.shape[1] * cols_b)
+        return self._from_dod(result, shape)
+
+    def block_diagonal(self, *blocks):
+        result = {}
+        row_offset, col_offset = 0, 0
+        for block in blocks:
+            for i, row in block.to_dod().items():
+                result[row_offset + i] = {col_offset + j: value for j, value in row.items()}
+            row_offset += block.shape[0]
+            col_offset += block.shape[1]
+        return self._from_dod(result, (row_offset, col_offset))
+
+    def add_entries(self, matrix, entries):
+        dod = matrix.to_dod()
+        for (i, j), value in entries.items():
+            row = dod.setdefault(i, {})
+            updated = row.get(j, QQ.zero) + self._scalar(value)
+            if updated:
+                row[j] = updated
+            else:
+                row.pop(j, None)
+        return self._from_dod(dod, matrix.shape)
+
+    def zero_entries(self, matrix, positions):
+        dod = matrix.to_dod()
+        for i, j in positions:
+            dod.get(i, {}).pop(j, None)
+        return self._from_dod(dod, matrix.shape)
+
+
+# Registry of available storage backends, keyed by name
+MATRIX_BACKENDS = {
+    'dense': MatrixBackend(),
+    'sparse': DomainMatrixBackend('sparse', 'sparse'),
+    'domain': DomainMatrixBackend('domain', 'dense'),
+}
+
+def register_matrix_backend(backend):
+    MATRIX_BACKENDS[backend.name] = backend
+
+def get_matrix_backend(backend):
+    if isinstance(backend, MatrixBackend):
+        return backend
+    if backend not in MATRIX_BACKENDS:
+        raise ValueError(f"Unknown matrix backend: {backend}")
+    return MATRIX_BACKENDS[backend]
+
+def matrix_backend_for(matrix):
+    if isinstance(matrix, DomainMatrix):
+        return MATRIX_BACKENDS['sparse' if matrix.rep.fmt == 'sparse' else 'domain']
+    return MATRIX_BACKENDS['dense']
+
 # === DegenerationType Class with Stability Checks ===
 class DegenerationType:
     def __init__(self, name, parameters=None):
@@ -11,6 +165,9 @@ class DegenerationType:
         self.parameters = parameters or {}
 
     def apply_degeneration(self, motive_matrix, codim_correction):
+        if isinstance(motive_matrix, DomainMatrix):
+            return self.apply_backend_degeneration(motive_matrix, codim_correction, matrix_backend_for(motive_matrix))
+
         if self.name == 'logarithmic':
             scaling_factor = self.parameters.get('scaling_factor', Rational(1, 100))
             perturbed_matrix = (1 + scaling_factor) * Matrix.eye(motive_matrix.rows)
@@ -44,37 +201,83 @@ class DegenerationType:
         perturbed_matrix += codim_correction * Matrix.eye(perturbed_matrix.rows)
         return perturbed_matrix
 
+    def apply_backend_degeneration(self, motive_matrix, codim_correction, backend):
+        # Same degenerations expressed through the storage backend primitives
+        rows, cols = backend.shape(motive_matrix)
+        if self.name == 'logarithmic':
+            scaling_factor = self.parameters.get('scaling_factor', Rational(1, 100))
+            perturbed_matrix = backend.scale(backend.eye(rows), 1 + scaling_factor)
+
+        elif self.name == 'tropical':
+            perturb_positions = [
+                (i, j) for i, j in self.parameters.get('perturb_positions', [])
+                if 0 <= i < rows and 0 <= j < cols
+            ]
+            scaling_factor = self.parameters.get('scaling_factor', Rational(1, 200))
+            perturbed_matrix = backend.scale(backend.zero_entries(motive_matrix, perturb_positions), 1 + scaling_factor)
+
+        elif self.name == 'nodal':
+            nodal_factor = self.parameters.get('nodal_factor', Rational(2, 5))
+            perturbed_matrix = motive_matrix
+            if rows >= 2 and cols >= 2:
+                perturbed_matrix = backend.add_entries(motive_matrix, {(0, 1): nodal_factor, (1, 0): nodal_factor})
+
+        elif self.name == 'arithmetic':
+            arithmetic_factor = self.parameters.get('arithmetic_factor', Rational(1, 400))
+            perturbed_matrix = backend.scale(backend.eye(rows), 1 + arithmetic_factor)
+
+        else:
+            perturbed_matrix = motive_matrix
+
+        # Ensure codim corrections
+        if codim_correction:
+            perturbed_matrix = backend.add_identity(perturbed_matrix, codim_correction)
+        return perturbed_matrix
+
 # === Mixed Motive Class ===
 class MixedMotive:
-    def __init__(self, variety_name, dimension, matrix_rep, codim_correction=0, variety_parameters=None):
+    def __init__(self, variety_name, dimension, matrix_rep, codim_correction=0, variety_parameters=None, backend='dense'):
         self.variety_name = variety_name
         self.dimension = dimension
-        self.matrix_rep = matrix_rep.as_immutable()
+        # Storage backend: 'dense' (SymPy Matrix), 'sparse' or 'domain' (DomainMatrix over QQ)
+        self.backend = get_matrix_backend(backend)
+        self.matrix_data = self.backend.convert(matrix_rep)
         self.variety_parameters = variety_parameters or {}
         self.degenerations = []
         self.codim_correction = codim_correction
 
+    @property
+    def matrix_rep(self):
+        # Dense SymPy view, only materialized on request
+        return self.backend.to_sympy(self.matrix_data)
+
+    @matrix_rep.setter
+    def matrix_rep(self, matrix):
+        self.matrix_data = self.backend.convert(matrix)
+
     def tensor_product(self, other_motive):
         new_dimension = self.dimension * other_motive.dimension
-        tensor_matrix = kronecker_product(self.matrix_rep, other_motive.matrix_rep)
-        return MixedMotive(f"Tensor({self.variety_name}, {other_motive.variety_name})", new_dimension, tensor_matrix)
+        tensor_matrix = self.backend.kronecker(self.matrix_data, self.backend.convert(other_motive.matrix_data))
+        return MixedMotive(f"Tensor({self.variety_name}, {other_motive.variety_name})", new_dimension, tensor_matrix,
+                           backend=self.backend)
 
     def dual(self):
-        dual_matrix = self.matrix_rep.transpose()
-        return MixedMotive(f"Dual({self.variety_name})", self.dimension, dual_matrix)
+        dual_matrix = self.backend.transpose(self.matrix_data)
+        return MixedMotive(f"Dual({self.variety_name})", self.dimension, dual_matrix, backend=self.backend)
 
     def triangulate(self, other_motive):
         new_dimension = self.dimension + other_motive.dimension
-        triangulated_matrix = diag(self.matrix_rep, other_motive.matrix_rep)
-        return MixedMotive(f"Triangulate({self.variety_name}, {other_motive.variety_name})", new_dimension, triangulated_matrix)
+        triangulated_matrix = self.backend.block_diagonal(self.matrix_data, self.backend.convert(other_motive.matrix_data))
+        return MixedMotive(f"Triangulate({self.variety_name}, {other_motive.variety_name})", new_dimension,
+                           triangulated_matrix, backend=self.backend)
 
     def add_degeneration(self, degeneration_type):
         self.degenerations.append(degeneration_type)
 
     def apply_degenerations(self):
-        perturbed_matrix = self.matrix_rep
+        perturbed_matrix = self.matrix_data
         for degeneration in self.degenerations:
-            perturbed_matrix = degeneration.apply_degeneration(perturbed_matrix, self.codim_correction)
+            perturbed_matrix = degeneration.apply_backend_degeneration(perturbed_matrix, self.codim_correction, self.backend)
         return perturbed_matrix
 
 # === Automorphic L-function Class ===
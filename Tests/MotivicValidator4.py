@@ -5,8 +5,26 @@
 
 import numpy as np
 from numpy import linalg as LA
+from scipy import sparse
+from scipy.linalg import eigvals_banded, eigvalsh_tridiagonal, lu_factor, get_lapack_funcs, LinAlgWarning
+import abc
+import copy
+import warnings
 from fractions import Fraction
-from math import sqrt, pi, exp, log
+from functools import reduce
+from collections import OrderedDict
+import hashlib
+import weakref
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
+import threading
+import time
+import tracemalloc
+from math import sqrt, pi, exp, log, prod, isqrt, ceil
+import mpmath
 
 # Increase recursion limit and numpy print options for large outputs
 import sys
@@ -14,37 +32,613 @@ np.set_printoptions(threshold=sys.maxsize)
 sys.setrecursionlimit(1000000)
 
 # Import symbolic mathematics library
-from sympy import symbols, diff, sin, cos
+from sympy import symbols, diff, sin, cos, lambdify, Poly, QQ
+from sympy.polys.matrices import DomainMatrix
+
+# === Numeric Backends ===
+# Motive matrices are stored through a numeric backend, so the same tensor product, dual, triangulation
+# and degeneration code runs in float64/float32 NumPy, exact rationals or mpmath multiprecision.
+# Exact and mpmath matrices are NumPy object arrays of Fraction / mpf entries.
+
+class NumericBackend:
+    name = 'float64'
+    dtype = np.float64
+
+    def scalar(self, value):
+        return self.dtype(value)
+
+    def array(self, values):
+        return np.array(values, dtype=self.dtype)
+
+    def identity(self, n):
+        return np.identity(n, dtype=self.dtype)
+
+    def zeros(self, shape):
+        return np.zeros(shape, dtype=self.dtype)
+
+    def eigvals(self, matrix):
+        return self.eigvals_with_path(matrix)[0]
+
+    def eigvals_with_path(self, matrix):
+        return structured_eigenvalues(matrix)
+
+    def det(self, matrix):
+        return LA.det(matrix)
+
+    def all_finite(self, values):
+        return bool(np.all(np.isfinite(values)))
+
+    def __str__(self):
+        return f"NumericBackend({self.name})"
+
+class Float32Backend(NumericBackend):
+    name = 'float32'
+    dtype = np.float32
+
+class ObjectBackend(NumericBackend, metaclass=abc.ABCMeta):
+    # Entries are Python number objects; NumPy applies the arithmetic elementwise. Eigenvalues are only
+    # computed in the backend's own arithmetic up to max_eigen_dimension (beyond that they cannot finish
+    # in practice). Larger matrices raise unless float_fallback=True opts into float64 eigenvalues, in
+    # which case the solver path says so
+    dtype = object
+    max_eigen_dimension = 8
+
+    def __init__(self, float_fallback=False):
+        self.float_fallback = float_fallback
+
+    @abc.abstractmethod
+    def scalar(self, value):
+        # Convert a number to this backend's entry type
+        pass
+
+    @abc.abstractmethod
+    def object_eigvals(self, matrix):
+        # Eigenvalues in this backend's own arithmetic
+        pass
+
+    def array(self, values):
+        values = np.asarray(values, dtype=object)
+        return np.array([self.scalar(value) for value in values.flat], dtype=object).reshape(values.shape)
+
+    def identity(self, n):
+        matrix = self.zeros((n, n))
+        matrix[np.diag_indices(n)] = self.scalar(1)
+        return matrix
+
+    def zeros(self, shape):
+        return np.full(shape, self.scalar(0), dtype=object)
+
+    def eigvals_with_path(self, matrix):
+        if matrix.shape[0] <= self.max_eigen_dimension:
+            return self.object_eigvals(matrix), self.name
+        if not self.float_fallback:
+            raise ValueError(f"{self.name} eigenvalues are limited to dimension {self.max_eigen_dimension} "
+                             f"(got {matrix.shape[0]}); pass float_fallback=True to use float64 instead")
+        eigenvalues, path = structured_eigenvalues(np.array(matrix, dtype=float))
+        return eigenvalues, f"{path} (float64 fallback, dimension > {self.max_eigen_dimension})"
+
+    def __str__(self):
+        return f"NumericBackend({self.name}, float_fallback={self.float_fallback})"
+
+class ExactBackend(ObjectBackend):
+    # Exact rational entries (fractions.Fraction); eigenvalues are exact algebraic numbers
+    name = 'exact'
+
+    def scalar(self, value):
+        if isinstance(value, Fraction):
+            return value
+        # Floats go through their shortest decimal form, so 1.0 / 100 becomes exactly 1/100
+        return Fraction(str(value))
+
+    def domain_matrix(self, matrix):
+        return DomainMatrix([[QQ(entry.numerator, entry.denominator) for entry in row] for row in matrix],
+                            matrix.shape, QQ)
+
+    def object_eigvals(self, matrix):
+        # Roots (with multiplicity) of the characteristic polynomial over QQ
+        coefficients = self.domain_matrix(matrix).charpoly()
+        return np.array(Poly.from_list(coefficients, symbols('x'), domain=QQ).all_roots(), dtype=object)
+
+    def det(self, matrix):
+        value = self.domain_matrix(matrix).det()
+        return Fraction(int(value.numerator), int(value.denominator))
+
+    def all_finite(self, values):
+        # Algebraic numbers are always finite
+        if np.asarray(values).dtype != object:
+            return super().all_finite(values)
+        return True
+
+class MPMathBackend(ObjectBackend):
+    name = 'mpmath'
+    max_eigen_dimension = 16
+
+    def __init__(self, dps=50, float_fallback=False):
+        super().__init__(float_fallback)
+        # A private context, so the working precision belongs to this backend rather than to mpmath.mp
+        self.context = mpmath.MPContext()
+        self.context.dps = dps
+
+    def scalar(self, value):
+        if isinstance(value, self.context.mpf):
+            return value
+        if isinstance(value, Fraction):
+            return self.context.mpf(value.numerator) / value.denominator
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float):
+            value = str(value)  # Same decimal reading of floats as the exact backend
+        return self.context.mpf(value)
+
+    def object_eigvals(self, matrix):
+        eigenvalues = self.context.eig(self.context.matrix(matrix.tolist()), left=False, right=False)
+        return np.array(eigenvalues, dtype=object)
+
+    def det(self, matrix):
+        return self.context.det(self.context.matrix(matrix.tolist()))
+
+    def all_finite(self, values):
+        if np.asarray(values).dtype != object:
+            return super().all_finite(values)
+        return all(self.context.isfinite(value) for value in values)
+
+    def __str__(self):
+        return f"NumericBackend({self.name}, dps={self.context.dps}, float_fallback={self.float_fallback})"
+
+# === Structure-Aware Eigenvalues ===
+
+def structured_eigenvalues(matrix):
+    # Eigenvalues of a float matrix through the cheapest solver its (exact) zero pattern allows.
+    # Returns (eigenvalues, path) where path names the solver: 'diagonal', 'triangular', 'block(...)',
+    # 'tridiagonal', 'banded', 'symmetric' or 'general'.
+    n = matrix.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=matrix.dtype), 'diagonal'
+    rows, cols = np.nonzero(matrix)
+    offsets = cols - rows
+    lower = -int(offsets.min(initial=0))
+    upper = int(offsets.max(initial=0))
+    if lower == 0 or upper == 0:
+        # Diagonal or triangular: the eigenvalues are the diagonal entries
+        return np.diagonal(matrix).copy(), 'diagonal' if lower == upper == 0 else 'triangular'
+    blocks = diagonal_block_bounds(n, rows, cols)
+    if len(blocks) > 1:
+        results = [structured_eigenvalues(matrix[start:stop, start:stop]) for start, stop in blocks]
+        paths = sorted({path for _, path in results})
+        return np.concatenate([eigenvalues for eigenvalues, _ in results]), f"block({', '.join(paths)})"
+    if not np.iscomplexobj(matrix) and np.array_equal(matrix, matrix.T):
+        if lower == 1:
+            return eigvalsh_tridiagonal(np.diagonal(matrix).copy(), np.diagonal(matrix, -1).copy()), 'tridiagonal'
+        if lower < n // 4:
+            # Lower banded storage: band[k, j] = matrix[j + k, j]
+            band = np.zeros((lower + 1, n), dtype=matrix.dtype)
+            for k in range(lower + 1):
+                band[k, :n - k] = np.diagonal(matrix, -k)
+            return eigvals_banded(band, lower=True), 'banded'
+        return LA.eigvalsh(matrix), 'symmetric'
+    return LA.eigvals(matrix), 'general'
+
+def diagonal_block_bounds(n, rows, cols):
+    # Split [0, n) into the finest contiguous diagonal blocks that contain every non-zero (rows[k], cols[k])
+    reach = np.arange(n)
+    np.maximum.at(reach, rows, cols)
+    np.maximum.at(reach, cols, rows)
+    ends = np.nonzero(np.maximum.accumulate(reach) == np.arange(n))[0] + 1
+    return list(zip(np.concatenate(([0], ends[:-1])), ends))
+
+# === Tiered Stability Checks ===
+# A motive is stable when its eigenvalues are finite with min_modulus <= |lambda| <= radius (by default
+# this is just a finite spectrum). Tiers of increasing cost are tried in order, up to the selected mode,
+# and the first one that decides the verdict ends the check:
+#   'finite'      a non-finite entry -> unstable
+#   'gershgorin'  row/column Gershgorin discs bound |lambda| from above and below -> stable;
+#                 |trace| / n > radius -> unstable
+#   'condition'   heuristic, not a certificate: min |lambda| >= 1 / ||A^-1||_1 with ||A^-1||_1 replaced by
+#                 LAPACK's gecon estimate from the LU factors, which can underestimate it (so overstate
+#                 the separation); a zero pivot is read as lambda = 0
+#   'spectrum'    the full eigenvalues
+# Verdicts of the tiers in HEURISTIC_TIERS are flagged as such in the stability results.
+STABILITY_TIERS = ('finite', 'gershgorin', 'condition', 'spectrum')
+HEURISTIC_TIERS = ('condition',)
+
+def spectrum_verdict(eigenvalues, backend, radius=np.inf, min_modulus=0.0):
+    if not backend.all_finite(eigenvalues):
+        return False
+    moduli = np.abs(np.array(eigenvalues, dtype=complex))
+    return bool(moduli.max(initial=0.0) <= radius and moduli.min(initial=np.inf) >= min_modulus)
+
+def tiered_stability(matrix, mode='spectrum', radius=np.inf, min_modulus=0.0):
+    # Returns (stable, tier, eigenvalues): stable is None if no tier up to mode decided it, and the
+    # eigenvalues are only computed when the 'spectrum' tier is reached
+    last = STABILITY_TIERS.index(mode)
+    if not np.all(np.isfinite(matrix)):
+        return False, 'finite', None
+    if last < 1:
+        return None, 'finite', None
+    n = matrix.shape[0]
+    absolute = np.abs(matrix)
+    diagonal = np.diagonal(absolute)
+    row_sums = absolute.sum(axis=1)
+    column_sums = absolute.sum(axis=0)
+    upper = min(row_sums.max(initial=0.0), column_sums.max(initial=0.0))
+    lower = max((2 * diagonal - row_sums).min(initial=np.inf), (2 * diagonal - column_sums).min(initial=np.inf))
+    bounded = bool(np.isfinite(upper) and upper <= radius)
+    separated = bool(min_modulus <= 0 or lower >= min_modulus)
+    if n and abs(np.trace(matrix)) / n > radius:
+        return False, 'gershgorin', None
+    if bounded and separated:
+        return True, 'gershgorin', None
+    if last < 2:
+        return None, 'gershgorin', None
+    if not separated:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', LinAlgWarning)  # A singular matrix is a verdict, not a warning
+            lu, _ = lu_factor(matrix, check_finite=False)
+        if np.any(np.diagonal(lu) == 0):
+            return False, 'condition', None
+        gecon, = get_lapack_funcs(('gecon',), (lu,))
+        norm = column_sums.max()
+        reciprocal_condition, _ = gecon(lu, norm, norm='1')
+        separated = bool(reciprocal_condition * norm >= min_modulus)
+        if bounded and separated:
+            return True, 'condition', None
+    if last < 3:
+        return None, 'condition', None
+    eigenvalues, _ = structured_eigenvalues(matrix)
+    return spectrum_verdict(eigenvalues, NumericBackend(), radius, min_modulus), 'spectrum', eigenvalues
+
+NUMERIC_BACKENDS = {
+    'float64': NumericBackend,
+    'float32': Float32Backend,
+    'exact': ExactBackend,
+    'mpmath': MPMathBackend,
+}
+
+default_numeric_backend = NumericBackend()
+
+def get_numeric_backend(backend=None, **options):
+    # None -> the run's default backend; a name -> a new backend built with the given options
+    if backend is None:
+        return default_numeric_backend
+    if isinstance(backend, NumericBackend):
+        return backend
+    if backend not in NUMERIC_BACKENDS:
+        raise ValueError(f"Unknown numeric backend: {backend}")
+    return NUMERIC_BACKENDS[backend](**options)
+
+def set_numeric_backend(backend, **options):
+    # Switch the backend used by motives created from now on, e.g. set_numeric_backend('mpmath', dps=100)
+    global default_numeric_backend
+    default_numeric_backend = get_numeric_backend(backend, **options)
+    return default_numeric_backend
+
+# === Motive Expression DAG ===
+
+def matrix_content_key(matrix):
+    # Hashable digest of a matrix's shape, dtype and entries
+    if matrix.dtype == object:
+        content = '\x00'.join(repr(entry) for entry in matrix.flat).encode()
+    else:
+        content = np.ascontiguousarray(matrix).tobytes()
+    return (matrix.shape, matrix.dtype.str, hashlib.blake2b(content, digest_size=16).digest())
+
+class MotiveExpression:
+    # Node of the expression DAG recorded by motive operations: a leaf holding a read-only matrix, or
+    # ('dual' | 'tensor' | 'triangulate', children). Nodes are interned by MotiveExpressionTable, so
+    # structurally equal expressions are the same object and hash and compare by identity.
+    def __init__(self, op, children=(), dimension=0, backend=None, matrix=None):
+        self.op = op
+        self.children = children
+        self.dimension = dimension
+        self.backend = backend
+        self.matrix = matrix
+        self.symmetric = None
+
+    def __str__(self):
+        if self.op == 'leaf':
+            return f"Leaf({self.dimension})"
+        return f"{self.op.capitalize()}({', '.join(str(child) for child in self.children)})"
+
+class MotiveExpressionTable:
+    # Hash-consing table for expression nodes (held weakly, so unused nodes disappear) and an LRU cache
+    # of at most maxsize matrices of non-leaf nodes. Identities are applied when a node is built:
+    # Dual(Dual(M)) = M, Dual(M) = M for symmetric leaves, duals of tensor products and triangulations
+    # are taken factor by factor, and nested tensor products / triangulations are flattened.
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.nodes = weakref.WeakValueDictionary()
+        self.matrices = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def intern(self, key, build):
+        node = self.nodes.get(key)
+        if node is None:
+            node = build()
+            with self.lock:
+                node = self.nodes.setdefault(key, node)
+        return node
+
+    def leaf(self, matrix, backend):
+        def build():
+            frozen = np.array(matrix)
+            frozen.flags.writeable = False
+            return MotiveExpression('leaf', (), frozen.shape[0], backend, frozen)
+        return self.intern(('leaf', str(backend), matrix_content_key(matrix)), build)
+
+    def dual(self, node):
+        if node.op == 'dual':
+            return node.children[0]
+        if node.op in ('tensor', 'triangulate'):
+            return self.combine(node.op, [self.dual(child) for child in node.children])
+        if node.symmetric is None:
+            node.symmetric = bool(np.all(node.matrix == node.matrix.T))
+        if node.symmetric:
+            return node
+        return self.intern(('dual', node), lambda: MotiveExpression('dual', (node,), node.dimension, node.backend))
+
+    def tensor(self, *nodes):
+        return self.combine('tensor', nodes)
+
+    def triangulate(self, *nodes):
+        return self.combine('triangulate', nodes)
+
+    def combine(self, op, nodes):
+        children = []
+        for node in nodes:
+            children.extend(node.children if node.op == op else (node,))
+        children = tuple(children)
+        if op == 'tensor':
+            dimension = prod(child.dimension for child in children)
+        else:
+            dimension = sum(child.dimension for child in children)
+        return self.intern((op, children), lambda: MotiveExpression(op, children, dimension, children[0].backend))
+
+    def evaluate(self, node):
+        # Read-only matrix of a node, computed from its children on a cache miss
+        if node.op == 'leaf':
+            return node.matrix
+        with self.lock:
+            matrix = self.matrices.get(node)
+            if matrix is not None:
+                self.hits += 1
+                self.matrices.move_to_end(node)
+                return matrix
+            self.misses += 1
+        children = [self.evaluate(child) for child in node.children]
+        if node.op == 'dual':
+            matrix = children[0].T
+        elif node.op == 'tensor':
+            matrix = reduce(np.kron, children)
+        else:
+            matrix = node.backend.zeros((node.dimension, node.dimension))
+            offset = 0
+            for block in children:
+                size = block.shape[0]
+                matrix[offset:offset + size, offset:offset + size] = block
+                offset += size
+        matrix.flags.writeable = False
+        with self.lock:
+            matrix = self.matrices.setdefault(node, matrix)
+            self.matrices.move_to_end(node)
+            if len(self.matrices) > self.maxsize:
+                self.matrices.popitem(last=False)
+        return matrix
+
+    def clear(self):
+        with self.lock:
+            self.matrices.clear()
+            self.hits = 0
+            self.misses = 0
+
+motive_expressions = MotiveExpressionTable()
+
+# === Out-of-Core Matrix Storage ===
+
+OUT_OF_CORE_TILE_BYTES = 64 * 2 ** 20
+
+def row_tiles(rows, row_bytes, tile_bytes=OUT_OF_CORE_TILE_BYTES):
+    # Slices of consecutive rows holding about tile_bytes each
+    step = max(1, tile_bytes // max(row_bytes, 1))
+    for start in range(0, rows, step):
+        yield slice(start, min(start + step, rows))
+
+class MatrixStore:
+    # Scratch directory of np.memmap-backed matrices for motives that do not fit in RAM. Copies,
+    # transposes, Kronecker products and block assembly stream over tiles of about tile_bytes, so only
+    # one tile (plus the small factors or blocks) is resident at a time.
+    def __init__(self, directory=None, tile_bytes=OUT_OF_CORE_TILE_BYTES):
+        self.owns_directory = directory is None
+        self.directory = os.path.realpath(tempfile.mkdtemp(prefix='motives-') if directory is None else directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.tile_bytes = tile_bytes
+        self.count = 0
+
+    def zeros(self, shape, dtype=np.float64):
+        # New memmap files are zero-filled
+        self.count += 1
+        path = os.path.join(self.directory, f"matrix-{os.getpid()}-{self.count}.dat")
+        return np.memmap(path, dtype=dtype, mode='w+', shape=shape)
+
+    def owns(self, matrix):
+        return (isinstance(matrix, np.memmap) and matrix.filename is not None
+                and os.path.dirname(os.path.realpath(matrix.filename)) == self.directory)
+
+    def tiles(self, matrix):
+        return row_tiles(matrix.shape[0], matrix[:1].nbytes, self.tile_bytes)
+
+    def store(self, matrix, dtype=np.float64):
+        # Matrices already in this store are used as they are
+        if self.owns(matrix) and matrix.dtype == dtype:
+            return matrix
+        return self.copy(matrix, dtype)
+
+    def copy(self, matrix, dtype=None):
+        if not hasattr(matrix, 'shape'):
+            matrix = np.asarray(matrix)
+        stored = self.zeros(matrix.shape, dtype or matrix.dtype)
+        for rows in self.tiles(stored):
+            stored[rows] = matrix[rows]
+        stored.flush()
+        return stored
+
+    def transpose(self, matrix):
+        # Square tiles, so reads and writes each touch a bounded band of rows
+        n, m = matrix.shape
+        transposed = self.zeros((m, n), matrix.dtype)
+        side = max(1, int(sqrt(self.tile_bytes // matrix.itemsize)))
+        for i in range(0, n, side):
+            for j in range(0, m, side):
+                transposed[j:j + side, i:i + side] = matrix[i:i + side, j:j + side].T
+        transposed.flush()
+        return transposed
+
+    def kron(self, factors):
+        # Row r of A_1 ⊗ ... ⊗ A_k is the Kronecker product of one row of each factor
+        row_sizes = [factor.shape[0] for factor in factors]
+        columns = prod(factor.shape[1] for factor in factors)
+        dtype = np.result_type(*factors)
+        product = self.zeros((prod(row_sizes), columns), dtype)
+        for rows in self.tiles(product):
+            tile = np.empty((rows.stop - rows.start, columns), dtype=dtype)
+            for offset, row in enumerate(range(rows.start, rows.stop)):
+                indices = np.unravel_index(row, row_sizes)
+                tile[offset] = reduce(np.kron, [factor[index] for factor, index in zip(factors, indices)])
+            product[rows] = tile
+        product.flush()
+        return product
+
+    def block_diagonal(self, blocks):
+        dimension = sum(block.shape[0] for block in blocks)
+        dense = self.zeros((dimension, dimension), np.result_type(*blocks))
+        offset = 0
+        for block in blocks:
+            size = block.shape[0]
+            for rows in self.tiles(block):
+                dense[offset + rows.start:offset + rows.stop, offset:offset + size] = block[rows]
+            offset += size
+        dense.flush()
+        return dense
+
+    def close(self):
+        if self.owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 # === Algebraic Structures and Motives ===
 
 class Motive:
-    def __init__(self, name, dimension, matrix_representation):
-        # Ensure matrix elements are float type
-        matrix_numeric = np.array(matrix_representation, dtype=float)
+    def __init__(self, name, dimension, matrix_representation, backend=None, expression=None, storage=None):
+        # Matrix entries are converted to the backend's number type. With a MatrixStore the matrix lives
+        # in a memmap file instead of RAM (float backends only); such motives stay out of the
+        # expression DAG, whose leaves are in-memory copies.
+        self.backend = get_numeric_backend(backend)
+        self.storage = storage
         self.name = name
         self.dimension = dimension
-        self.matrix = matrix_numeric
+        if storage is not None:
+            if self.backend.dtype is object:
+                raise ValueError("Out-of-core storage needs a float backend.")
+            self.matrix = storage.store(matrix_representation, self.backend.dtype)
+        else:
+            self.matrix = self.backend.array(matrix_representation)
+        self._expression = expression
+        self.applied_degenerations = 0
+        self.shares_snapshot = False
         self.correspondences = []
         self.morphisms = []
         self.degenerations = []
 
+    @property
+    def expression(self):
+        # Node of this motive in the expression DAG; once the matrix is changed (degenerations, restore)
+        # the motive becomes a fresh leaf keyed on its content
+        if self._expression is None:
+            self._expression = self.build_expression()
+        return self._expression
+
+    def build_expression(self):
+        return motive_expressions.leaf(self.matrix, self.backend)
+
+    def invalidate_expression(self):
+        self._expression = None
+
     def tensor_product(self, other):
-        new_dimension = self.dimension * other.dimension
-        new_matrix = np.kron(self.matrix, other.matrix)
-        return Motive(f"Tensor({self.name}, {other.name})", new_dimension, new_matrix)
+        # Lazy tensor product: only the Kronecker factors are stored
+        storage = self.storage or other.storage
+        if storage is not None:
+            return TensorMotive(f"Tensor({self.name}, {other.name})",
+                                self.tensor_factors() + other.tensor_factors(), self.backend, storage=storage)
+        return TensorMotive(f"Tensor({self.name}, {other.name})",
+                            self.tensor_factors() + other.tensor_factors(), self.backend,
+                            motive_expressions.tensor(self.expression, other.expression))
+
+    def tensor_factors(self):
+        return [self.matrix.copy()]
 
     def dual(self):
-        new_matrix = self.matrix.transpose()
-        return Motive(f"Dual({self.name})", self.dimension, new_matrix)
+        if self.storage is not None:
+            return Motive(f"Dual({self.name})", self.dimension, self.storage.transpose(self.matrix),
+                          self.backend, storage=self.storage)
+        expression = motive_expressions.dual(self.expression)
+        return Motive(f"Dual({self.name})", self.dimension, motive_expressions.evaluate(expression),
+                      self.backend, expression)
 
     def triangulate(self, other):
-        new_dimension = self.dimension + other.dimension
-        triangulated_matrix = np.block([
-            [self.matrix, np.zeros((self.dimension, other.dimension))],
-            [np.zeros((other.dimension, self.dimension)), other.matrix]
-        ])
-        return Motive(f"Triangulate({self.name}, {other.name})", new_dimension, triangulated_matrix)
+        # Block diagonal motive: the zero off-diagonal blocks are never stored
+        storage = self.storage or other.storage
+        if storage is not None:
+            return BlockDiagonalMotive(f"Triangulate({self.name}, {other.name})",
+                                       self.diagonal_blocks() + other.diagonal_blocks(), self.backend, storage=storage)
+        return BlockDiagonalMotive(f"Triangulate({self.name}, {other.name})",
+                                   self.diagonal_blocks() + other.diagonal_blocks(), self.backend,
+                                   motive_expressions.triangulate(self.expression, other.expression))
+
+    def diagonal_blocks(self):
+        return [self.matrix.copy()]
+
+    def eigenvalues(self):
+        return self.eigenvalues_with_path()[0]
+
+    def eigenvalues_with_path(self):
+        # (eigenvalues, name of the solver path that produced them)
+        return self.backend.eigvals_with_path(self.matrix)
+
+    def snapshot(self):
+        # Copy-on-write snapshot: the matrix is shared until the next in-place update (see detach)
+        self.shares_snapshot = True
+        return self.matrix, self.applied_degenerations
+
+    def restore(self, snapshot):
+        matrix, self.applied_degenerations = snapshot
+        if matrix is not self.matrix:
+            self.matrix = matrix
+            self.invalidate_expression()
+        self.shares_snapshot = True
+
+    def detach(self):
+        # Called before an in-place update: a matrix shared with a snapshot is copied first
+        if self.shares_snapshot:
+            self.matrix = self.storage.copy(self.matrix) if self.storage is not None else self.matrix.copy()
+            self.shares_snapshot = False
+
+    def fork(self):
+        # Shallow copy sharing the matrix (or tensor factors / blocks) copy-on-write with this motive, so
+        # either one can be degenerated and rolled back while the other is tested in another thread.
+        # The degeneration, correspondence and morphism lists are the fork's own
+        self.shares_snapshot = True
+        forked = copy.copy(self)
+        forked.shares_snapshot = True
+        forked.degenerations = list(self.degenerations)
+        forked.correspondences = list(self.correspondences)
+        forked.morphisms = list(self.morphisms)
+        return forked
 
     def add_correspondence(self, other, correspondence_matrix):
         if correspondence_matrix.shape != (self.dimension, other.dimension):
@@ -60,12 +654,333 @@ class Motive:
         self.degenerations.append(degeneration)
 
     def apply_degenerations(self):
-        for degeneration in self.degenerations:
-            degeneration.apply(self)
+        # Degenerations added since the last call are fused into a single affine update applied in place;
+        # ones already applied are never applied again
+        pending = self.degenerations[self.applied_degenerations:]
+        if pending:
+            compile_degenerations(pending, self.dimension, self.backend).apply(self)
+            self.applied_degenerations = len(self.degenerations)
 
     def __str__(self):
         return f"Motive({self.name}, Dimension: {self.dimension})"
 
+class TensorMotive(Motive):
+    # Tensor product M_1 ⊗ ... ⊗ M_k kept as its list of factor matrices. Matrix-vector products,
+    # trace, determinant and eigenvalues are computed from the factors; the full Kronecker matrix
+    # is only built when .matrix is accessed (e.g. by a degeneration) and then cached.
+    def __init__(self, name, factors, backend=None, expression=None, storage=None):
+        self.backend = get_numeric_backend(backend)
+        self.storage = storage
+        self.name = name
+        self.factors = [self.backend.array(factor) for factor in factors]
+        self.dimension = prod(factor.shape[0] for factor in self.factors)
+        self._matrix = None
+        self._expression = expression
+        self.applied_degenerations = 0
+        self.shares_snapshot = False
+        self.correspondences = []
+        self.morphisms = []
+        self.degenerations = []
+
+    @property
+    def matrix(self):
+        if self._matrix is None:
+            self._matrix = self.materialize()
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, value):
+        if self.storage is not None:
+            self._matrix = self.storage.store(value, self.backend.dtype)
+        else:
+            self._matrix = self.backend.array(value)
+        self._expression = None
+
+    @property
+    def is_materialized(self):
+        return self._matrix is not None
+
+    def snapshot(self):
+        # An unmaterialized motive snapshots as None, so nothing is expanded
+        self.shares_snapshot = True
+        return self._matrix, self.applied_degenerations
+
+    def restore(self, snapshot):
+        matrix, self.applied_degenerations = snapshot
+        if matrix is not self._matrix:
+            self._matrix = matrix
+            self._expression = None
+        self.shares_snapshot = True
+
+    def detach(self):
+        if self.shares_snapshot and self._matrix is not None:
+            self._matrix = self.storage.copy(self._matrix) if self.storage is not None else self._matrix.copy()
+        self.shares_snapshot = False
+
+    def build_expression(self):
+        if self.is_materialized:
+            return motive_expressions.leaf(self._matrix, self.backend)
+        return motive_expressions.tensor(*[motive_expressions.leaf(factor, self.backend) for factor in self.factors])
+
+    def materialize(self):
+        if self.storage is not None:
+            return self.storage.kron(self.factors)
+        return self.backend.array(motive_expressions.evaluate(self.expression))
+
+    def tensor_factors(self):
+        if self.is_materialized:
+            return [self._matrix.copy()]
+        return list(self.factors)
+
+    def matvec(self, vector):
+        # (A_1 ⊗ ... ⊗ A_k) v: reshape v into a k-way tensor and apply each factor along its own axis
+        if self.is_materialized:
+            return self._matrix @ vector
+        tensor = self.backend.array(vector).reshape([factor.shape[1] for factor in self.factors])
+        for axis, factor in enumerate(self.factors):
+            tensor = np.moveaxis(np.tensordot(factor, tensor, axes=([1], [axis])), 0, axis)
+        return tensor.reshape(-1)
+
+    def trace(self):
+        if self.is_materialized:
+            return np.trace(self._matrix)
+        return prod(np.trace(factor) for factor in self.factors)
+
+    def determinant(self):
+        # det(A_1 ⊗ ... ⊗ A_k) = prod_i det(A_i)^(N / n_i)
+        if self.is_materialized:
+            return self.backend.det(self._matrix)
+        return prod(self.backend.det(factor) ** (self.dimension // factor.shape[0]) for factor in self.factors)
+
+    def eigenvalues_with_path(self):
+        # Eigenvalues of a Kronecker product are all products of factor eigenvalues (in np.kron order)
+        if self.is_materialized:
+            return self.backend.eigvals_with_path(self._matrix)
+        results = [self.backend.eigvals_with_path(factor) for factor in self.factors]
+        paths = sorted({path for _, path in results})
+        eigenvalues = reduce(np.multiply.outer, [eigenvalues for eigenvalues, _ in results]).reshape(-1)
+        return eigenvalues, f"tensor({', '.join(paths)})"
+
+    def dual(self):
+        if self.is_materialized:
+            return super().dual()
+        if self.storage is not None:
+            return TensorMotive(f"Dual({self.name})", [factor.T for factor in self.factors], self.backend,
+                                storage=self.storage)
+        expression = motive_expressions.dual(self.expression)
+        return TensorMotive(f"Dual({self.name})", [motive_expressions.evaluate(child) for child in expression.children],
+                            self.backend, expression)
+
+    def __str__(self):
+        return f"TensorMotive({self.name}, Dimension: {self.dimension}, Factors: {len(self.factors)})"
+
+class BlockDiagonalMotive(Motive):
+    # Block diagonal motive diag(B_1, ..., B_k) kept as its list of blocks. Degenerations, eigenvalues
+    # and stability checks run block by block. Accessing .matrix expands to a dense matrix and from
+    # then on the motive behaves like a plain Motive (blocks is set to None).
+    def __init__(self, name, blocks, backend=None, expression=None, storage=None):
+        self.backend = get_numeric_backend(backend)
+        self.storage = storage
+        self.name = name
+        self.blocks = [self.backend.array(block) for block in blocks]
+        self.dimension = sum(block.shape[0] for block in self.blocks)
+        self._matrix = None
+        self._expression = expression
+        self.applied_degenerations = 0
+        self.shares_snapshot = False
+        self.correspondences = []
+        self.morphisms = []
+        self.degenerations = []
+
+    @property
+    def matrix(self):
+        if self.blocks is not None:
+            self._matrix = self.to_dense()
+            self.blocks = None
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, value):
+        if self.storage is not None:
+            self._matrix = self.storage.store(value, self.backend.dtype)
+        else:
+            self._matrix = self.backend.array(value)
+        self.blocks = None
+        self._expression = None
+
+    @property
+    def is_block_structured(self):
+        return self.blocks is not None
+
+    def build_expression(self):
+        if self.blocks is None:
+            return motive_expressions.leaf(self._matrix, self.backend)
+        return motive_expressions.triangulate(*[motive_expressions.leaf(block, self.backend) for block in self.blocks])
+
+    def to_dense(self):
+        if self.storage is not None:
+            return self.storage.copy(self._matrix) if self.blocks is None else self.storage.block_diagonal(self.blocks)
+        if self.blocks is None:
+            return self._matrix.copy()
+        return self.backend.array(motive_expressions.evaluate(self.expression))
+
+    def locate(self, i, j):
+        # Map a global position to (block index, local row, local column), or None if off the blocks
+        offset = 0
+        for index, block in enumerate(self.blocks):
+            size = block.shape[0]
+            if offset <= i < offset + size:
+                if offset <= j < offset + size:
+                    return index, i - offset, j - offset
+                return None
+            offset += size
+        return None
+
+    def diagonal_blocks(self):
+        if self.blocks is None:
+            return [self._matrix.copy()]
+        return [block.copy() for block in self.blocks]
+
+    def eigenvalues_with_path(self):
+        if self.blocks is None:
+            return self.backend.eigvals_with_path(self._matrix)
+        results = [self.backend.eigvals_with_path(block) for block in self.blocks]
+        paths = sorted({path for _, path in results})
+        return np.concatenate([eigenvalues for eigenvalues, _ in results]), f"block({', '.join(paths)})"
+
+    def is_stable(self):
+        # Stop at the first block with a non-finite eigenvalue
+        if self.blocks is None:
+            return self.backend.all_finite(self.backend.eigvals(self._matrix))
+        return all(self.backend.all_finite(self.backend.eigvals(block)) for block in self.blocks)
+
+    def dual(self):
+        if self.blocks is None:
+            return super().dual()
+        if self.storage is not None:
+            return BlockDiagonalMotive(f"Dual({self.name})", [block.T for block in self.blocks], self.backend,
+                                       storage=self.storage)
+        expression = motive_expressions.dual(self.expression)
+        return BlockDiagonalMotive(f"Dual({self.name})", [motive_expressions.evaluate(child) for child in expression.children],
+                                   self.backend, expression)
+
+    def snapshot(self):
+        self.shares_snapshot = True
+        if self.blocks is None:
+            return self._matrix, self.applied_degenerations
+        return list(self.blocks), self.applied_degenerations
+
+    def restore(self, snapshot):
+        state, self.applied_degenerations = snapshot
+        if isinstance(state, list):
+            if self.blocks is None or any(block is not kept for block, kept in zip(self.blocks, state)):
+                self.blocks = state
+                self._matrix = None
+                self._expression = None
+        elif state is not self._matrix or self.blocks is not None:
+            self._matrix = state
+            self.blocks = None
+            self._expression = None
+        self.shares_snapshot = True
+
+    def detach(self):
+        if self.shares_snapshot:
+            if self.blocks is not None:
+                self.blocks = [block.copy() for block in self.blocks]
+            else:
+                self._matrix = self.storage.copy(self._matrix) if self.storage is not None else self._matrix.copy()
+            self.shares_snapshot = False
+
+    def __str__(self):
+        blocks = len(self.blocks) if self.blocks is not None else 1
+        return f"BlockDiagonalMotive({self.name}, Dimension: {self.dimension}, Blocks: {blocks})"
+
+class MotiveBatch:
+    # Motives of the same dimension stacked in one (batch, n, n) array. Degenerations, duals and
+    # eigenvalues run as stacked NumPy/LAPACK operations over the whole batch.
+    def __init__(self, names, matrices, backend=None):
+        self.backend = get_numeric_backend(backend)
+        self.names = list(names)
+        self.matrices = self.backend.array(matrices)
+        if self.matrices.ndim != 3 or self.matrices.shape[1] != self.matrices.shape[2]:
+            raise ValueError("A motive batch needs a (batch, n, n) array.")
+        if len(self.names) != self.matrices.shape[0]:
+            raise ValueError("Number of names does not match the batch size.")
+        self.dimension = self.matrices.shape[1]
+        self.applied_degenerations = 0
+        self.shares_snapshot = False
+        self.degenerations = []
+
+    @classmethod
+    def from_motives(cls, motives):
+        dimensions = {motive.dimension for motive in motives}
+        if len(dimensions) != 1:
+            raise ValueError("Motives in a batch must have the same dimension.")
+        backend = motives[0].backend
+        return cls([motive.name for motive in motives], np.stack([motive.matrix for motive in motives]), backend)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        return Motive(self.names[index], self.dimension, self.matrices[index], self.backend)
+
+    def motives(self):
+        return [self[index] for index in range(len(self))]
+
+    def dual(self):
+        return MotiveBatch([f"Dual({name})" for name in self.names], self.matrices.transpose(0, 2, 1), self.backend)
+
+    def add_degeneration(self, degeneration):
+        self.degenerations.append(degeneration)
+
+    def apply_degenerations(self):
+        # The pending chain is fused once and applied to the whole stack in place
+        pending = self.degenerations[self.applied_degenerations:]
+        if pending:
+            self.detach()
+            compile_degenerations(pending, self.dimension, self.backend).apply_to_matrix(self.matrices, self.dimension)
+            self.applied_degenerations = len(self.degenerations)
+
+    def snapshot(self):
+        self.shares_snapshot = True
+        return self.matrices, self.applied_degenerations
+
+    def restore(self, snapshot):
+        self.matrices, self.applied_degenerations = snapshot
+        self.shares_snapshot = True
+
+    def detach(self):
+        if self.shares_snapshot:
+            self.matrices = self.matrices.copy()
+            self.shares_snapshot = False
+
+    def eigenvalues(self):
+        return self.eigenvalues_with_path()[0]
+
+    def eigenvalues_with_path(self):
+        # (batch, n) eigenvalues from one stacked LAPACK call; symmetric batches use eigvalsh. Exact and
+        # mpmath batches solve motive by motive in their own arithmetic unless the backend opts into
+        # float64, which is one stacked call
+        matrices, note = self.matrices, ''
+        if self.backend.dtype is object and not self.backend.float_fallback:
+            return np.array([self.backend.eigvals(matrix) for matrix in matrices], dtype=object), self.backend.name
+        if self.backend.dtype is object:
+            matrices, note = np.array(matrices, dtype=float), f" (float64 fallback for {self.backend.name} batches)"
+        if np.array_equal(matrices, matrices.transpose(0, 2, 1)):
+            return LA.eigvalsh(matrices), 'symmetric' + note
+        return LA.eigvals(matrices), 'general' + note
+
+    def is_stable(self):
+        # One flag per motive
+        eigenvalues = self.eigenvalues()
+        if eigenvalues.dtype == object:
+            return np.array([self.backend.all_finite(row) for row in eigenvalues])
+        return np.all(np.isfinite(eigenvalues), axis=1)
+
+    def __str__(self):
+        return f"MotiveBatch(Size: {len(self)}, Dimension: {self.dimension})"
+
 # === Degenerations ===
 
 class Degeneration:
@@ -74,32 +989,317 @@ class Degeneration:
         self.parameters = parameters
 
     def apply(self, motive):
+        # All updates are in place; a matrix shared with a snapshot is copied once first. The expression
+        # node is dropped only afterwards, since reading the matrix may rebuild it from the operands
+        motive.detach()
+        self.update(motive)
+        motive.invalidate_expression()
+
+    def update(self, motive):
+        if isinstance(motive, BlockDiagonalMotive) and motive.is_block_structured:
+            if self.apply_blockwise(motive):
+                return
+        backend = motive.backend
         if self.name == 'logarithmic':
-            scaling_factor = float(self.parameters.get('scaling_factor', Fraction(1, 100)))
-            perturbation = scaling_factor * np.identity(motive.dimension)
-            motive.matrix = motive.matrix + perturbation
+            scaling_factor = backend.scalar(self.parameters.get('scaling_factor', Fraction(1, 100)))
+            motive.matrix[np.diag_indices(motive.dimension)] += scaling_factor
         elif self.name == 'tropical':
             perturb_positions = self.parameters.get('perturb_positions', [])
             for i, j in perturb_positions:
                 if 0 <= i < motive.dimension and 0 <= j < motive.dimension:
-                    motive.matrix[i, j] = 0.0
-            scaling_factor = float(self.parameters.get('scaling_factor', Fraction(1, 200)))
-            motive.matrix = (1 + scaling_factor) * motive.matrix
+                    motive.matrix[i, j] = backend.scalar(0)
+            scaling_factor = backend.scalar(self.parameters.get('scaling_factor', Fraction(1, 200)))
+            motive.matrix *= 1 + scaling_factor
         elif self.name == 'nodal':
-            nodal_factor = float(self.parameters.get('nodal_factor', Fraction(2, 5)))
+            nodal_factor = backend.scalar(self.parameters.get('nodal_factor', Fraction(2, 5)))
             if motive.dimension >= 2:
                 motive.matrix[0, 1] += nodal_factor
                 motive.matrix[1, 0] += nodal_factor
         elif self.name == 'arithmetic':
-            arithmetic_factor = float(self.parameters.get('arithmetic_factor', Fraction(1, 400)))
-            perturbation = arithmetic_factor * np.identity(motive.dimension)
-            motive.matrix = motive.matrix + perturbation
+            arithmetic_factor = backend.scalar(self.parameters.get('arithmetic_factor', Fraction(1, 400)))
+            motive.matrix[np.diag_indices(motive.dimension)] += arithmetic_factor
         else:
             pass  # No degeneration applied
 
+    def apply_blockwise(self, motive):
+        # Apply the degeneration to each diagonal block of a BlockDiagonalMotive.
+        # Returns False (leaving the motive untouched) if the degeneration couples two blocks.
+        backend = motive.backend
+        if self.name == 'logarithmic':
+            scaling_factor = backend.scalar(self.parameters.get('scaling_factor', Fraction(1, 100)))
+            for block in motive.blocks:
+                block[np.diag_indices(block.shape[0])] += scaling_factor
+        elif self.name == 'tropical':
+            perturb_positions = self.parameters.get('perturb_positions', [])
+            for i, j in perturb_positions:
+                if 0 <= i < motive.dimension and 0 <= j < motive.dimension:
+                    located = motive.locate(i, j)
+                    if located is not None:  # Off-block entries are already zero
+                        index, local_i, local_j = located
+                        motive.blocks[index][local_i, local_j] = backend.scalar(0)
+            scaling_factor = backend.scalar(self.parameters.get('scaling_factor', Fraction(1, 200)))
+            for block in motive.blocks:
+                block *= 1 + scaling_factor
+        elif self.name == 'nodal':
+            nodal_factor = backend.scalar(self.parameters.get('nodal_factor', Fraction(2, 5)))
+            if motive.dimension >= 2:
+                if motive.blocks[0].shape[0] < 2:
+                    return False
+                motive.blocks[0][0, 1] += nodal_factor
+                motive.blocks[0][1, 0] += nodal_factor
+        elif self.name == 'arithmetic':
+            arithmetic_factor = backend.scalar(self.parameters.get('arithmetic_factor', Fraction(1, 400)))
+            for block in motive.blocks:
+                block[np.diag_indices(block.shape[0])] += arithmetic_factor
+        return True
+
+    def fuse(self, fused, dimension):
+        # Fold this degeneration into a FusedDegeneration instead of applying it
+        if self.name == 'logarithmic':
+            fused.shift(fused.backend.scalar(self.parameters.get('scaling_factor', Fraction(1, 100))))
+        elif self.name == 'tropical':
+            for i, j in self.parameters.get('perturb_positions', []):
+                if 0 <= i < dimension and 0 <= j < dimension:
+                    fused.zero(i, j)
+            fused.scale(1 + fused.backend.scalar(self.parameters.get('scaling_factor', Fraction(1, 200))))
+        elif self.name == 'nodal':
+            if dimension >= 2:
+                nodal_factor = fused.backend.scalar(self.parameters.get('nodal_factor', Fraction(2, 5)))
+                fused.add(0, 1, nodal_factor)
+                fused.add(1, 0, nodal_factor)
+        elif self.name == 'arithmetic':
+            fused.shift(fused.backend.scalar(self.parameters.get('arithmetic_factor', Fraction(1, 400))))
+
     def __str__(self):
         return f"Degeneration({self.name})"
 
+class FusedDegeneration:
+    # A chain of degenerations folded into one affine update
+    #     M -> alpha * M (with the entries in `zeros` cleared) + beta * I + corrections
+    # where corrections is a sparse {(i, j): value} dict. Applying it costs one in-place pass over M.
+    # alpha, beta and the corrections are numbers of the given numeric backend.
+    def __init__(self, backend=None):
+        self.backend = get_numeric_backend(backend)
+        self.alpha = self.backend.scalar(1)
+        self.beta = self.backend.scalar(0)
+        self.zeros = set()
+        self.corrections = {}
+
+    def shift(self, amount):
+        self.beta += amount
+
+    def scale(self, factor):
+        self.alpha *= factor
+        self.beta *= factor
+        self.corrections = {position: value * factor for position, value in self.corrections.items()}
+
+    def zero(self, i, j):
+        # The entry becomes beta * delta_ij + correction, so cancel the identity part explicitly
+        self.zeros.add((i, j))
+        self.corrections[(i, j)] = -self.beta if i == j else self.backend.scalar(0)
+
+    def add(self, i, j, value):
+        self.corrections[(i, j)] = self.corrections.get((i, j), self.backend.scalar(0)) + value
+
+    def apply(self, motive):
+        motive.detach()
+        if not (isinstance(motive, BlockDiagonalMotive) and motive.is_block_structured and self.apply_blockwise(motive)):
+            self.apply_to_matrix(motive.matrix, motive.dimension)
+        motive.invalidate_expression()
+
+    def apply_to_matrix(self, matrix, dimension):
+        # Works on one (n, n) matrix or a stack of shape (..., n, n); out-of-core matrices are scaled
+        # one row tile at a time
+        if self.alpha != 1:
+            if isinstance(matrix, np.memmap):
+                for rows in row_tiles(matrix.shape[0], matrix[:1].nbytes):
+                    matrix[rows] *= self.alpha
+            else:
+                matrix *= self.alpha
+        if self.zeros:
+            rows, cols = zip(*self.zeros)
+            matrix[..., list(rows), list(cols)] = self.backend.scalar(0)
+        if self.beta:
+            diagonal = np.arange(dimension)
+            matrix[..., diagonal, diagonal] += self.beta
+        if self.corrections:
+            rows, cols = zip(*self.corrections)
+            matrix[..., list(rows), list(cols)] += list(self.corrections.values())
+
+    def apply_blockwise(self, motive):
+        # Returns False if a non-zero correction falls outside the diagonal blocks
+        located_zeros = [motive.locate(i, j) for i, j in self.zeros]
+        located_corrections = []
+        for (i, j), value in self.corrections.items():
+            located = motive.locate(i, j)
+            if located is None:
+                if value:
+                    return False
+                continue
+            located_corrections.append((located, value))
+        for block in motive.blocks:
+            if self.alpha != 1:
+                block *= self.alpha
+            if self.beta:
+                block[np.diag_indices(block.shape[0])] += self.beta
+        for located in located_zeros:
+            if located is not None:  # Off-block entries are already zero
+                index, i, j = located
+                motive.blocks[index][i, j] = self.beta if i == j else self.backend.scalar(0)
+        for (index, i, j), value in located_corrections:
+            motive.blocks[index][i, j] += value
+        return True
+
+def compile_degenerations(degenerations, dimension, backend=None):
+    fused = FusedDegeneration(backend)
+    for degeneration in degenerations:
+        degeneration.fuse(fused, dimension)
+    return fused
+
+# === Differential Operator Cache ===
+
+class DifferentialOperatorCache:
+    # Partial derivatives d/dx and d/dy keyed on the structural hash of the expression, computed once,
+    # plus lambdify-compiled NumPy evaluators for grids of (x, y) points. LRU-bounded to maxsize
+    # expressions like validator 2's cache; the lock keeps it consistent under the thread executor.
+    def __init__(self, maxsize=128):
+        self.x, self.y = symbols('x y')
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def entry(self, expression):
+        with self.lock:
+            entry = self.entries.get(expression)
+            if entry is not None:
+                self.hits += 1
+                self.entries.move_to_end(expression)
+                return entry
+            self.misses += 1
+        entry = {'partials': (diff(expression, self.x), diff(expression, self.y))}
+        with self.lock:
+            entry = self.entries.setdefault(expression, entry)
+            self.entries.move_to_end(expression)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return entry
+
+    def partials(self, expression):
+        return self.entry(expression)['partials']
+
+    def compiled_partials(self, expression):
+        entry = self.entry(expression)
+        if 'evaluators' not in entry:
+            entry['evaluators'] = tuple(lambdify((self.x, self.y), partial, 'numpy') for partial in entry['partials'])
+        return entry['evaluators']
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __repr__(self):
+        return f"DifferentialOperatorCache(size={len(self.entries)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+differential_operator_cache = DifferentialOperatorCache()
+
+# === Identity Plus Rank-One Matrices ===
+
+class IdentityPlusRankOne:
+    # The n x n matrix alpha * I + beta * J (J = all-ones) stored as (alpha, beta, n). Degenerations add
+    # a sparse {(i, j): value} corrections dict; while it is empty, eigenvalues, determinant, inverse
+    # and products are closed-form.
+    def __init__(self, alpha, beta, n, corrections=None):
+        self.alpha = float(alpha)
+        self.beta = float(beta)
+        self.n = n
+        self.corrections = {position: value for position, value in (corrections or {}).items() if value != 0.0}
+
+    @property
+    def shape(self):
+        return (self.n, self.n)
+
+    @property
+    def is_rank_one_update(self):
+        return not self.corrections
+
+    def __len__(self):
+        return self.n
+
+    def entry(self, i, j):
+        return (self.alpha if i == j else 0.0) + self.beta + self.corrections.get((i, j), 0.0)
+
+    def to_dense(self):
+        dense = np.full((self.n, self.n), self.beta)
+        dense[np.diag_indices(self.n)] += self.alpha
+        for (i, j), value in self.corrections.items():
+            dense[i, j] += value
+        return dense
+
+    def matvec(self, vector):
+        vector = np.asarray(vector, dtype=float)
+        result = self.alpha * vector + self.beta * vector.sum(axis=0)
+        for (i, j), value in self.corrections.items():
+            result[i] += value * vector[j]
+        return result
+
+    def eigenvalues(self):
+        # alpha + n * beta once (eigenvector of ones), alpha with multiplicity n - 1
+        if not self.is_rank_one_update:
+            return LA.eigvals(self.to_dense())
+        return np.concatenate(([self.alpha + self.n * self.beta], np.full(self.n - 1, self.alpha)))
+
+    def determinant(self):
+        if not self.is_rank_one_update:
+            return LA.det(self.to_dense())
+        return self.alpha ** (self.n - 1) * (self.alpha + self.n * self.beta)
+
+    def inverse(self):
+        # Sherman-Morrison: (alpha I + beta J)^-1 = I / alpha - beta / (alpha (alpha + n beta)) J
+        if not self.is_rank_one_update or self.alpha == 0.0:
+            return LA.inv(self.to_dense())
+        if self.alpha + self.n * self.beta == 0.0:
+            raise LA.LinAlgError("Singular matrix")
+        return IdentityPlusRankOne(1.0 / self.alpha,
+                                   -self.beta / (self.alpha * (self.alpha + self.n * self.beta)), self.n)
+
+    def __matmul__(self, other):
+        # (a1 I + b1 J)(a2 I + b2 J) = a1 a2 I + (a1 b2 + b1 a2 + n b1 b2) J since J^2 = n J
+        if isinstance(other, IdentityPlusRankOne):
+            if other.n != self.n:
+                raise ValueError("Matrix dimensions do not match.")
+            if self.is_rank_one_update and other.is_rank_one_update:
+                return IdentityPlusRankOne(self.alpha * other.alpha,
+                                           self.alpha * other.beta + self.beta * other.alpha
+                                           + self.n * self.beta * other.beta, self.n)
+            return self.to_dense() @ other.to_dense()
+        return self.matvec(other)
+
+    def __mul__(self, scalar):
+        return IdentityPlusRankOne(self.alpha * scalar, self.beta * scalar, self.n,
+                                   {position: value * scalar for position, value in self.corrections.items()})
+
+    __rmul__ = __mul__
+
+    def apply_degenerations(self, degenerations):
+        return self.apply_fused(compile_degenerations(degenerations, self.n, 'float64'))
+
+    def apply_fused(self, fused):
+        # alpha_f * B (with cleared entries) + beta_f * I + corrections_f, with B = alpha I + beta J + C
+        corrections = {position: fused.alpha * value for position, value in self.corrections.items()}
+        for i, j in fused.zeros:
+            corrections[(i, j)] = corrections.get((i, j), 0.0) - fused.alpha * self.entry(i, j)
+        for position, value in fused.corrections.items():
+            corrections[position] = corrections.get(position, 0.0) + value
+        return IdentityPlusRankOne(fused.alpha * self.alpha + fused.beta, fused.alpha * self.beta, self.n,
+                                   corrections)
+
+    def __str__(self):
+        return f"IdentityPlusRankOne(alpha={self.alpha}, beta={self.beta}, n={self.n})"
+
 # === Cohomology Groups and Operations ===
 
 class CohomologyGroup:
@@ -124,27 +1324,167 @@ class CohomologyGroup:
         return sqrt(self.dimension * self.degree + 0.1) * scaling_factor
 
     def apply_matrix_perturbation(self):
-        base_matrix = np.identity(self.dimension)
+        # I + diagonal_perturb on the diagonal and off_diagonal_perturb elsewhere
+        # = (1 + diagonal_perturb - off_diagonal_perturb) I + off_diagonal_perturb J
         diagonal_perturb = self.parameters.get('diagonal_perturb', 0.1)
         off_diagonal_perturb = self.parameters.get('off_diagonal_perturb', 0.05)
-        perturbed_matrix = base_matrix.copy()
-        for i in range(self.dimension):
-            perturbed_matrix[i, i] += diagonal_perturb
-            for j in range(self.dimension):
-                if i != j:
-                    perturbed_matrix[i, j] += off_diagonal_perturb
-        return perturbed_matrix
+        return IdentityPlusRankOne(1.0 + diagonal_perturb - off_diagonal_perturb, off_diagonal_perturb, self.dimension)
 
     def differential_operator(self, function):
         x, y = symbols('x y')
         diff_coeff_x = self.parameters.get('diff_coeff_x', 1.0)
         diff_coeff_y = self.parameters.get('diff_coeff_y', 1.0)
-        result = diff_coeff_x * diff(function(x, y), x) + diff_coeff_y * diff(function(x, y), y)
+        partial_x, partial_y = differential_operator_cache.partials(function(x, y))
+        result = diff_coeff_x * partial_x + diff_coeff_y * partial_y
         return result
 
+    def evaluate_differential_operator(self, function, x_values, y_values):
+        # Numerical evaluation of the operator over (broadcastable) arrays of x and y values
+        x, y = symbols('x y')
+        diff_coeff_x = self.parameters.get('diff_coeff_x', 1.0)
+        diff_coeff_y = self.parameters.get('diff_coeff_y', 1.0)
+        evaluate_x, evaluate_y = differential_operator_cache.compiled_partials(function(x, y))
+        return diff_coeff_x * evaluate_x(x_values, y_values) + diff_coeff_y * evaluate_y(x_values, y_values)
+
     def __str__(self):
         return f"CohomologyGroup({self.name}, Degree: {self.degree}, Dimension: {self.dimension})"
 
+# === Dirichlet Series ===
+
+DIRICHLET_CHUNK_TERMS = 1 << 16
+
+class DirichletPowerCache:
+    # n^{-s} over chunks of consecutive n, keyed on (s, start, stop) with LRU eviction, so every series
+    # evaluated at the same s shares them; the lock keeps it consistent under the thread executor
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.powers = OrderedDict()
+        self.lock = threading.Lock()
+
+    def chunk(self, s_value, start, stop):
+        key = (s_value, start, stop)
+        with self.lock:
+            powers = self.powers.get(key)
+            if powers is not None:
+                self.powers.move_to_end(key)
+                return powers
+        powers = np.power(np.arange(start, stop, dtype=float), -s_value)
+        with self.lock:
+            powers = self.powers.setdefault(key, powers)
+            self.powers.move_to_end(key)
+            if len(self.powers) > self.max_entries:
+                self.powers.popitem(last=False)
+        return powers
+
+    def clear(self):
+        with self.lock:
+            self.powers.clear()
+
+dirichlet_powers = DirichletPowerCache()
+
+def dirichlet_coefficients(coefficients, terms):
+    # Dense a_1..a_N from a sparse {n: a_n} dict, with N the largest n <= terms that has a coefficient
+    # (every later term of the series is zero)
+    indices = np.fromiter(coefficients.keys(), dtype=np.int64, count=len(coefficients))
+    values = np.array(list(coefficients.values()))
+    values = values.astype(np.result_type(values.dtype, float))
+    in_range = (indices >= 1) & (indices <= terms)
+    dense = np.zeros(int(indices[in_range].max(initial=0)), dtype=values.dtype)
+    dense[indices[in_range] - 1] = values[in_range]
+    return dense
+
+def dirichlet_series(dense_coefficients, s_value, chunk_terms=DIRICHLET_CHUNK_TERMS):
+    # sum_n a_n n^{-s} as one dot product per chunk of terms, bounding the n^{-s} buffers
+    total = 0
+    for start in range(0, len(dense_coefficients), chunk_terms):
+        stop = min(start + chunk_terms, len(dense_coefficients))
+        total += np.dot(dense_coefficients[start:stop], dirichlet_powers.chunk(s_value, start + 1, stop + 1))
+    return total.item() if isinstance(total, np.generic) else total
+
+def dirichlet_tail_bound(growth, sigma, terms):
+    # With |a_n| <= C n^k and sigma = Re(s) > k + 1:
+    # |sum_{n > N} a_n n^{-s}| <= C N^{k + 1 - sigma} / (sigma - k - 1)
+    constant, exponent = growth
+    if constant == 0:
+        return 0.0
+    if sigma <= exponent + 1:
+        return np.inf
+    return constant * float(terms) ** (exponent + 1 - sigma) / (sigma - exponent - 1)
+
+def rounding_bound(magnitude, terms, s_value):
+    # First-order bound on the floating-point error of a sum of `terms` terms x_n computed from n^{-s},
+    # with sum |x_n| = magnitude: each n^{-s} is off by up to about (|s| log n + 2) ulps and the
+    # summation adds at most `terms` ulps of the magnitude (O(eps^2) terms dropped)
+    if terms == 0:
+        return 0.0
+    return float(np.finfo(float).eps * (terms + abs(s_value) * log(terms) + 2) * magnitude)
+
+def dirichlet_tail_terms(growth, sigma, tolerance, max_terms):
+    # Fewest terms N <= max_terms whose tail bound is within tolerance (max_terms when none is)
+    constant, exponent = growth
+    if constant == 0:
+        return 0
+    if sigma <= exponent + 1:
+        return max_terms
+    excess = sigma - exponent - 1
+    log_terms = log(constant / (excess * tolerance)) / excess
+    if log_terms >= log(max_terms):
+        return max_terms
+    terms = max(1, ceil(exp(log_terms)))
+    if dirichlet_tail_bound(growth, sigma, terms) > tolerance:
+        terms += 1  # Rounding in exp / log
+    return min(terms, max_terms)
+
+def grid_rows(s_values, chunk_terms):
+    # Terms per chunk so that a (terms x len(s)) block holds at most chunk_terms entries
+    return max(1, chunk_terms // max(1, s_values.size))
+
+def dirichlet_series_grid(dense_coefficients, s_values, chunk_terms=DIRICHLET_CHUNK_TERMS):
+    # sum_n a_n n^{-s} at every s of an array of real or complex s in one pass over the coefficients:
+    # per chunk of n, exp of the outer product -log n x s contracted with a_n
+    s_values = np.asarray(s_values)
+    flat = s_values.ravel()
+    totals = np.zeros(flat.shape, dtype=np.result_type(dense_coefficients.dtype, flat.dtype, float))
+    rows = grid_rows(flat, chunk_terms)
+    for start in range(0, len(dense_coefficients), rows):
+        stop = min(start + rows, len(dense_coefficients))
+        log_n = np.log(np.arange(start + 1, stop + 1, dtype=float))
+        totals += dense_coefficients[start:stop] @ np.exp(-np.outer(log_n, flat))
+    return totals.reshape(s_values.shape)
+
+def euler_product_grid(primes, local_values, s_values, chunk_terms=DIRICHLET_CHUNK_TERMS):
+    # prod_p 1 / (1 - c_p p^{-s}) at every s of an array (or a scalar s), chunked over the primes like
+    # dirichlet_series_grid. Summed in log space as -sum log1p(-c_p p^{-s}), with the angle (complex)
+    # or the number of negative factors (real) tracked separately. A vanishing factor counts as 1e-10
+    s_values = np.asarray(s_values)
+    flat = s_values.ravel()
+    is_complex = np.iscomplexobj(local_values) or np.iscomplexobj(flat)
+    log_modulus = np.zeros(flat.shape)
+    phase = np.zeros(flat.shape)
+    negatives = np.zeros(flat.shape, dtype=np.int64)
+    rows = grid_rows(flat, chunk_terms)
+    for start in range(0, len(primes), rows):
+        stop = min(start + rows, len(primes))
+        local_terms = local_values[start:stop, None] * np.power(primes[start:stop, None].astype(float), -flat)
+        vanishing = local_terms == 1
+        if is_complex:
+            logs = np.log1p(-local_terms, where=~vanishing, out=np.zeros_like(local_terms))
+            phase -= logs.imag.sum(axis=0)
+            logs = logs.real
+        else:
+            below = local_terms < 1
+            above = ~below & ~vanishing
+            logs = np.log1p(-local_terms, where=below, out=np.zeros_like(local_terms))
+            np.log(local_terms - 1, where=above, out=logs)
+            negatives += np.count_nonzero(above, axis=0)
+        logs[vanishing] = log(1e-10)  # Avoid division by zero
+        log_modulus -= logs.sum(axis=0)
+    if is_complex:
+        products = np.exp(log_modulus + 1j * phase)
+    else:
+        products = np.where(negatives % 2, -1.0, 1.0) * np.exp(log_modulus)
+    return products.reshape(s_values.shape)
+
 # === Automorphic Forms and L-functions ===
 
 class AutomorphicForm:
@@ -155,19 +1495,115 @@ class AutomorphicForm:
         self.coefficients = coefficients
         self.parameters = parameters or {}
 
+    @property
+    def coefficients(self):
+        return self._coefficients
+
+    @coefficients.setter
+    def coefficients(self, coefficients):
+        self._coefficients = coefficients
+        self.invalidate_coefficients()
+
+    def invalidate_coefficients(self):
+        # Call after editing the coefficients dict in place
+        self.coefficient_arrays = {}
+
+    def coefficient_array(self, terms):
+        # Dense a_n for n <= terms, built once per term count
+        if terms not in self.coefficient_arrays:
+            self.coefficient_arrays[terms] = dirichlet_coefficients(self.coefficients, terms)
+        return self.coefficient_arrays[terms]
+
     def hecke_eigenvalue(self, n):
         return self.coefficients.get(n, 0)
 
     def compute_l_function(self, s_value, terms=100000):
-        l_value = 0
-        for n in range(1, terms + 1):
-            a_n = self.hecke_eigenvalue(n)
-            l_value += a_n / n ** s_value
-        return l_value
+        return dirichlet_series(self.coefficient_array(terms), s_value)
+
+    def coefficient_growth(self, terms=100000):
+        # (C, k) with |a_n| <= C n^k for n <= terms: parameters['coefficient_growth'] if given, else
+        # k = 0 and C the largest stored |a_n|. The default only covers the stored coefficients up to
+        # `terms`, so tail bounds built on it are relative to the series truncated there
+        if 'coefficient_growth' in self.parameters:
+            return self.parameters['coefficient_growth']
+        return float(np.abs(self.coefficient_array(terms)).max(initial=0.0)), 0
+
+    def compute_l_function_adaptive(self, s_value, tolerance=1e-10, terms=100000):
+        # Sums only as many of the first `terms` terms as the tail bound needs for the tolerance.
+        # Returns (value, error bound, terms used). The bound is the tail bound plus the rounding of
+        # the sum, relative to the series truncated at `terms` (the default growth only covers the
+        # a_n up to there); once every nonzero coefficient is summed only the rounding is left.
+        # The tail gets what the rounding leaves of the tolerance, so the bound is within tolerance
+        # unless `terms` runs out or the rounding alone exceeds it
+        coefficients = self.coefficient_array(terms)
+        growth = self.coefficient_growth(terms)
+        sigma = np.real(s_value)
+        budget = tolerance
+        while True:
+            used = min(dirichlet_tail_terms(growth, sigma, budget, terms), len(coefficients))
+            tail = dirichlet_tail_bound(growth, sigma, used) if used < len(coefficients) else 0.0
+            rounding = rounding_bound(dirichlet_series(np.abs(coefficients[:used]), sigma), used, s_value)
+            if tail + rounding <= tolerance or used == len(coefficients) or rounding >= tolerance:
+                break
+            budget = tolerance - rounding  # More terms raise the rounding, so this may take another pass
+        return dirichlet_series(coefficients[:used], s_value), tail + rounding, used
+
+    def compute_l_function_grid(self, s_values, terms=100000):
+        # L(s) at every s of an array (same shape) in one pass over the coefficients
+        return dirichlet_series_grid(self.coefficient_array(terms), s_values)
 
     def __str__(self):
         return f"AutomorphicForm({self.name}, Weight: {self.weight}, Level: {self.level})"
 
+# === Prime Sieve ===
+
+class PrimeSieve:
+    # Process-wide uint8 primality flags for 0 <= n < limit and the primes among them. A larger bound
+    # extends the sieve by one segment (at least doubling it), crossed off with the known primes up
+    # to the square root of the new bound
+    def __init__(self, limit=1 << 16):
+        self.lock = threading.Lock()
+        self.flags = np.zeros(0, dtype=np.uint8)
+        self.primes = np.zeros(0, dtype=np.int64)
+        self.extend(limit)
+
+    @property
+    def limit(self):
+        return len(self.flags)
+
+    def extend(self, limit):
+        with self.lock:
+            if limit <= self.limit:
+                return
+            start, limit = self.limit, max(limit, 2 * self.limit)
+            root = isqrt(limit - 1)
+            if root >= start:
+                # Base segment: plain sieve of Eratosthenes
+                start, segment = 0, np.ones(limit, dtype=np.uint8)
+                segment[:2] = 0
+                for p in range(2, root + 1):
+                    if segment[p]:
+                        segment[p * p::p] = 0
+                flags, primes = segment, np.flatnonzero(segment)
+            else:
+                segment = np.ones(limit - start, dtype=np.uint8)
+                for p in self.primes[:np.searchsorted(self.primes, root, side='right')].tolist():
+                    segment[max(p * p, -(-start // p) * p) - start::p] = 0
+                flags = np.concatenate((self.flags, segment))
+                primes = np.concatenate((self.primes, start + np.flatnonzero(segment)))
+            self.flags, self.primes = flags, primes
+
+    def primes_up_to(self, bound):
+        self.extend(bound + 1)
+        primes = self.primes
+        return primes[:np.searchsorted(primes, bound, side='right')]
+
+    def is_prime(self, n):
+        self.extend(n + 1)
+        return bool(self.flags[n])
+
+prime_sieve = PrimeSieve()
+
 # === Galois Representations ===
 
 class GaloisRepresentation:
@@ -176,21 +1612,84 @@ class GaloisRepresentation:
         self.dimension = dimension
         self.character_values = character_values
 
+    @property
+    def character_values(self):
+        return self._character_values
+
+    @character_values.setter
+    def character_values(self, character_values):
+        self._character_values = character_values
+        self.invalidate_character_values()
+
+    def invalidate_character_values(self):
+        # Call after editing the character_values dict in place
+        self.local_factors = {}
+
     def compute_artin_l_function(self, s_value, terms=100000):
-        l_value = 1.0
-        for p in range(2, terms + 2):
-            if self.is_prime(p):
-                chi_p = self.character_values.get(p, 1.0)
-                denom = 1 - chi_p / p ** s_value
-                if denom == 0:
-                    denom = 1e-10  # Avoid division by zero
-                l_value *= 1 / denom
-        return l_value
+        # Euler product over the primes 2 <= p <= terms + 1, in log space
+        primes, character = self.local_factor_arrays(terms)
+        return euler_product_grid(primes, character, s_value).item()
+
+    def compute_artin_l_function_adaptive(self, s_value, tolerance=1e-10, terms=100000):
+        # Euler product over a doubling number of the primes p <= terms + 1, stopping once the tail is
+        # within tolerance. With |chi_p| <= C and x = C P^{-sigma} < 1 for the last prime P used,
+        # |log L - log L_P| <= T = C P^{1 - sigma} / ((sigma - 1) (1 - x)), so |L - L_P| <= |L_P| (e^T - 1).
+        # C is the largest |chi_p| for p <= terms + 1, so like the default growth of
+        # AutomorphicForm.coefficient_growth the bound is relative to the product truncated there.
+        # Returns (value, error bound, primes used). The bound includes the rounding of the product and
+        # the loop stops once the total is within tolerance, so it only exceeds the tolerance when the
+        # primes up to terms + 1 run out
+        primes, character = self.local_factor_arrays(terms)
+        constant = float(np.abs(character).max(initial=0.0))
+        sigma = float(np.real(s_value))
+        l_value, used, chunks, bound, log_magnitude = 1.0, 0, 0, 0.0, 0.0
+        while used < len(primes):
+            stop = min(len(primes), max(2 * used, 1024))
+            # Rounding: the sum of the used log factors, then exp and one product per chunk, relative to |L_P|
+            local_terms = character[used:stop] * np.power(primes[used:stop].astype(float), -s_value)
+            log_magnitude += float(np.abs(np.log(np.abs(1 - local_terms), where=local_terms != 1,
+                                                 out=np.full(local_terms.shape, log(1e-10)))).sum())
+            l_value *= euler_product_grid(primes[used:stop], character[used:stop], s_value).item()
+            used, chunks = stop, chunks + 1
+            rounding = abs(l_value) * (rounding_bound(log_magnitude, used, s_value) + np.finfo(float).eps * (chunks + 2))
+            if used == len(primes):
+                bound = rounding
+                break
+            bound = np.inf
+            last_prime = float(primes[used - 1])
+            x = constant * last_prime ** -sigma
+            if sigma > 1 and x < 1:
+                bound = abs(l_value) * np.expm1(constant * last_prime ** (1 - sigma) / ((sigma - 1) * (1 - x))) + rounding
+                if bound <= tolerance:
+                    break
+        return l_value, bound, used
+
+    def local_factor_arrays(self, terms):
+        # Primes 2 <= p <= terms + 1 from the shared sieve and their character values (1 where none is
+        # given), built once per term count
+        if terms not in self.local_factors:
+            primes = prime_sieve.primes_up_to(terms + 1)
+            keys = np.fromiter(self.character_values.keys(), dtype=np.int64, count=len(self.character_values))
+            values = np.array(list(self.character_values.values()))
+            character = np.ones(len(primes), dtype=np.result_type(values.dtype, float))
+            positions = np.searchsorted(primes, keys)
+            listed = positions < len(primes)
+            listed[listed] = primes[positions[listed]] == keys[listed]
+            character[positions[listed]] = values[listed]
+            self.local_factors[terms] = (primes, character)
+        return self.local_factors[terms]
+
+    def compute_artin_l_function_grid(self, s_values, terms=100000):
+        # Artin L(s) at every s of an array (same shape) in one pass over the primes
+        primes, character = self.local_factor_arrays(terms)
+        return euler_product_grid(primes, character, s_values)
 
     @staticmethod
     def is_prime(n):
         if n <= 1:
             return False
+        if n < prime_sieve.limit:
+            return bool(prime_sieve.flags[n])
         if n <= 3:
             return True
         if n % 2 == 0 or n % 3 == 0:
@@ -209,21 +1708,35 @@ class GaloisRepresentation:
 
 class CodimensionCycle:
     def __init__(self, variety, codimension, cycle_matrix):
+        # scipy.sparse cycle matrices are kept sparse (CSR)
         self.variety = variety
         self.codimension = codimension
-        self.cycle_matrix = np.array(cycle_matrix, dtype=float)
+        if sparse.issparse(cycle_matrix):
+            self.cycle_matrix = sparse.csr_matrix(cycle_matrix, dtype=float)
+        else:
+            self.cycle_matrix = np.array(cycle_matrix, dtype=float)
+
+    @property
+    def is_sparse(self):
+        return sparse.issparse(self.cycle_matrix)
 
     def intersect(self, other):
-        # Resize matrices to the same shape by padding with zeros if necessary
-        max_rows = max(self.cycle_matrix.shape[0], other.cycle_matrix.shape[0])
-        max_cols = max(self.cycle_matrix.shape[1], other.cycle_matrix.shape[1])
-        mat1_padded = np.pad(self.cycle_matrix, ((0, max_rows - self.cycle_matrix.shape[0]),
-                                                 (0, max_cols - self.cycle_matrix.shape[1])),
-                             mode='constant', constant_values=0)
-        mat2_padded = np.pad(other.cycle_matrix, ((0, max_rows - other.cycle_matrix.shape[0]),
-                                                  (0, max_cols - other.cycle_matrix.shape[1])),
-                             mode='constant', constant_values=0)
-        intersection_matrix = mat1_padded * mat2_padded
+        # The intersection has the larger (zero-padded) shape, but every entry outside the overlapping
+        # submatrix is zero, so only the overlap is multiplied. With a sparse operand the product is
+        # sparse and costs in proportion to its non-zeros.
+        rows = min(self.cycle_matrix.shape[0], other.cycle_matrix.shape[0])
+        cols = min(self.cycle_matrix.shape[1], other.cycle_matrix.shape[1])
+        shape = (max(self.cycle_matrix.shape[0], other.cycle_matrix.shape[0]),
+                 max(self.cycle_matrix.shape[1], other.cycle_matrix.shape[1]))
+        overlap1 = self.cycle_matrix[:rows, :cols]
+        overlap2 = other.cycle_matrix[:rows, :cols]
+        if self.is_sparse or other.is_sparse:
+            product = overlap1.multiply(overlap2) if self.is_sparse else overlap2.multiply(overlap1)
+            intersection_matrix = sparse.csr_matrix(product)
+            intersection_matrix.resize(shape)
+        else:
+            intersection_matrix = np.zeros(shape)
+            intersection_matrix[:rows, :cols] = overlap1 * overlap2
         return CodimensionCycle(f"Intersection({self.variety}, {other.variety})",
                                  self.codimension + other.codimension, intersection_matrix)
 
@@ -232,9 +1745,74 @@ class CodimensionCycle:
 
 # === Testing Modules ===
 
-class TestModule:
+def stability_worker(memory_name, shape, dtype):
+    # Runs in a pool process: eigenvalues of a matrix passed through shared memory
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        matrix = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+        result = structured_eigenvalues(matrix)
+        del matrix  # Release the buffer before closing
+    finally:
+        memory.close()
+    return result
+
+class MemoryWatermarks:
+    # Per-task peaks of tracemalloc's process-wide traced memory. tracemalloc keeps a single peak, so
+    # before it is reset the peak is folded into the mark of every running task; a task's mark is then
+    # the highest traced memory over its lifetime (including tasks running alongside it)
     def __init__(self):
+        self.lock = threading.Lock()
+        self.marks = {}
+
+    def fold(self):
+        peak = tracemalloc.get_traced_memory()[1]
+        for token in self.marks:
+            self.marks[token] = max(self.marks[token], peak)
+        tracemalloc.reset_peak()
+
+    def start(self):
+        with self.lock:
+            self.fold()
+            token = object()
+            self.marks[token] = tracemalloc.get_traced_memory()[0]
+            return token, self.marks[token]
+
+    def stop(self, token):
+        with self.lock:
+            self.fold()
+            return self.marks.pop(token)
+
+def run_profiled_task(function, args, track_memory=True, watermarks=None):
+    # Runs one scheduled task and returns (result, profile) with its wall time and peak traced memory
+    # in bytes above the level at its start. Without shared watermarks (a process-pool worker runs
+    # one task at a time) the peak is the task's own
+    started_tracing = track_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        if track_memory:
+            watermarks = watermarks or MemoryWatermarks()
+            token, baseline = watermarks.start()
+        start = time.perf_counter()
+        try:
+            result = function(*args)
+        finally:
+            wall_time = time.perf_counter() - start
+            peak_memory = watermarks.stop(token) - baseline if track_memory else None
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return result, {'wall_time': wall_time, 'peak_memory': peak_memory}
+
+class TestModule:
+    def __init__(self, precision=None):
+        # precision: None computes eigenvalues in each motive's own backend; 'float32' or 'float64'
+        # casts dense float matrices to that precision for the stability tests
+        if precision not in (None, 'float32', 'float64'):
+            raise ValueError(f"Unsupported precision: {precision}")
+        self.precision = precision
         self.motives = []
+        self.motive_batches = []
         self.cohomology_groups = []
         self.forms = []
         self.representations = []
@@ -244,6 +1822,9 @@ class TestModule:
     def add_motive(self, motive):
         self.motives.append(motive)
 
+    def add_motive_batch(self, batch):
+        self.motive_batches.append(batch)
+
     def add_cohomology_group(self, group):
         self.cohomology_groups.append(group)
 
@@ -259,21 +1840,160 @@ class TestModule:
     def add_codimension_cycle(self, cycle):
         self.cycles.append(cycle)
 
-    def perform_stability_tests(self):
+    def perform_stability_tests(self, parallel=False, max_workers=None, mode=None, radius=np.inf, min_modulus=0.0):
+        # Each motive is tested with all its degenerations: ones not yet applied are applied on a
+        # copy-on-write snapshot and rolled back, ones already applied are not applied again.
+        # mode=None computes every spectrum; a tier name from STABILITY_TIERS runs the tiered checks
+        # (in this process) and stops each motive at the first tier that decides it
+        if mode is not None:
+            return self.perform_tiered_stability_tests(mode, radius, min_modulus)
+        if parallel:
+            results = dict(self.iter_stability_results(max_workers))
+            return {motive.name: results[motive.name] for motive in self.motives}
         results = {}
         for motive in self.motives:
-            initial_matrix = motive.matrix.copy()
-            for degeneration in motive.degenerations:
-                degeneration.apply(motive)
-            eigenvalues = LA.eigvals(motive.matrix)
-            stable = np.all(np.isfinite(eigenvalues))
+            initial_state = motive.snapshot()
+            motive.apply_degenerations()
+            eigenvalues, solver = self.motive_eigenvalues(motive)
+            stable = motive.backend.all_finite(eigenvalues)
             results[motive.name] = {
                 'eigenvalues': eigenvalues,
-                'stable': stable
+                'stable': stable,
+                'solver': solver
             }
-            motive.matrix = initial_matrix  # Reset matrix
+            motive.restore(initial_state)  # Roll back pending degenerations
+        return results
+
+    def perform_batch_stability_tests(self):
+        # Same verdict as perform_stability_tests, one stacked eigenvalue call per batch
+        results = {}
+        for batch in self.motive_batches:
+            initial_state = batch.snapshot()
+            batch.apply_degenerations()
+            eigenvalues, solver = batch.eigenvalues_with_path()
+            for name, values in zip(batch.names, eigenvalues):
+                results[name] = {'eigenvalues': values, 'stable': batch.backend.all_finite(values), 'solver': solver}
+            batch.restore(initial_state)
         return results
 
+    def perform_tiered_stability_tests(self, mode='spectrum', radius=np.inf, min_modulus=0.0, motives=None):
+        # motives defaults to the registered motives; validation_tasks passes forks of them
+        results = {}
+        for motive in self.motives if motives is None else motives:
+            initial_state = motive.snapshot()
+            motive.apply_degenerations()
+            results[motive.name] = self.check_stability(motive, mode, radius, min_modulus)
+            motive.restore(initial_state)
+        return results
+
+    def check_stability(self, motive, mode='spectrum', radius=np.inf, min_modulus=0.0):
+        # Tiered verdict for one motive; block motives are checked block by block, stopping at the first
+        # unstable block. Lazy tensor and exact/multiprecision motives go straight to their spectrum.
+        if motive.backend.dtype is object or (isinstance(motive, TensorMotive) and not motive.is_materialized):
+            eigenvalues = motive.eigenvalues()
+            return {'eigenvalues': eigenvalues, 'tier': 'spectrum', 'heuristic': False,
+                    'stable': spectrum_verdict(eigenvalues, motive.backend, radius, min_modulus)}
+        if isinstance(motive, BlockDiagonalMotive) and motive.is_block_structured:
+            matrices = motive.blocks
+        else:
+            matrices = [motive.matrix]
+        verdicts = []
+        for matrix in matrices:
+            verdicts.append(tiered_stability(matrix, mode, radius, min_modulus))
+            if verdicts[-1][0] is False:
+                break
+        stable = [verdict for verdict, _, _ in verdicts]
+        eigenvalues = [values for _, _, values in verdicts]
+        return {
+            'eigenvalues': np.concatenate(eigenvalues) if all(values is not None for values in eigenvalues) else None,
+            'tier': max((tier for _, tier, _ in verdicts), key=STABILITY_TIERS.index),
+            'heuristic': any(verdict is not None and tier in HEURISTIC_TIERS for verdict, tier, _ in verdicts),
+            'stable': False if False in stable else None if None in stable else True
+        }
+
+    def iter_stability_results(self, max_workers=None):
+        # Parallel stability tests, yielding (name, result) as each motive finishes. Dense float matrices
+        # are copied into shared memory and their eigenvalues computed in a process pool; structured
+        # motives and exact/multiprecision backends are handled here while the pool works.
+        pending = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                for motive in self.motives:
+                    initial_state = motive.snapshot()
+                    motive.apply_degenerations()
+                    if not self.is_pool_eligible(motive):
+                        eigenvalues, solver = motive.eigenvalues_with_path()
+                        motive.restore(initial_state)
+                        yield motive.name, {'eigenvalues': eigenvalues, 'stable': motive.backend.all_finite(eigenvalues),
+                                            'solver': solver}
+                        continue
+                    matrix = self.stability_matrix(motive)
+                    memory = shared_memory.SharedMemory(create=True, size=max(matrix.nbytes, 1))
+                    np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=memory.buf)[...] = matrix
+                    motive.restore(initial_state)
+                    future = pool.submit(stability_worker, memory.name, matrix.shape, matrix.dtype.str)
+                    pending[future] = (motive, memory)
+                for future in as_completed(list(pending)):
+                    motive, memory = pending.pop(future)
+                    memory.close()
+                    memory.unlink()
+                    eigenvalues, solver = future.result()
+                    yield motive.name, {'eigenvalues': eigenvalues, 'stable': motive.backend.all_finite(eigenvalues),
+                                        'solver': solver}
+            finally:
+                for motive, memory in pending.values():
+                    memory.close()
+                    memory.unlink()
+
+    def stability_matrix(self, motive):
+        if self.precision is None:
+            return motive.matrix
+        return motive.matrix.astype(self.precision, copy=False)
+
+    def motive_eigenvalues(self, motive):
+        # Eigenvalues (and solver path) at the module's precision; structured and exact/multiprecision
+        # motives always use their own backend
+        if self.precision is None or not self.is_pool_eligible(motive):
+            return motive.eigenvalues_with_path()
+        return structured_eigenvalues(self.stability_matrix(motive))
+
+    def estimate_precision_error(self, precision='float32', sample_size=3, seed=None):
+        # Eigenvalue error of `precision` against a float64 reference on a random sample of dense motives:
+        # the largest distance from an eigenvalue to the nearest eigenvalue of the other spectrum,
+        # relative to max(1, spectral radius). Returns {motive name: error}.
+        candidates = [motive for motive in self.motives if self.is_pool_eligible(motive)]
+        rng = np.random.default_rng(seed)
+        sample = rng.choice(len(candidates), size=min(sample_size, len(candidates)), replace=False)
+        errors = {}
+        for index in sample:
+            motive = candidates[index]
+            initial_state = motive.snapshot()
+            motive.apply_degenerations()
+            reduced, _ = structured_eigenvalues(motive.matrix.astype(precision))
+            reference, _ = structured_eigenvalues(motive.matrix.astype(np.float64))
+            motive.restore(initial_state)
+            distances = np.abs(np.subtract.outer(reduced.astype(complex), reference.astype(complex)))
+            scale = max(1.0, float(np.abs(reference).max(initial=0.0)))
+            errors[motive.name] = max(distances.min(axis=1).max(initial=0.0), distances.min(axis=0).max(initial=0.0)) / scale
+        return errors
+
+    def select_precision(self, tolerance=1e-4, precision='float32', sample_size=3, seed=None):
+        # Use the reduced precision for the stability tests when its estimated error is within tolerance.
+        # With nothing eligible to sample there is no estimate (max_error is None) and float64 is kept
+        errors = self.estimate_precision_error(precision, sample_size, seed)
+        max_error = max(errors.values(), default=None)
+        self.precision = precision if max_error is not None and max_error <= tolerance else 'float64'
+        return {'precision': self.precision, 'max_error': max_error, 'errors': errors}
+
+    def is_pool_eligible(self, motive):
+        if motive.backend.dtype is object:
+            return False
+        if isinstance(motive, BlockDiagonalMotive) and motive.is_block_structured:
+            return False
+        if isinstance(motive, TensorMotive) and not motive.is_materialized:
+            return False
+        return True
+
     def compute_l_functions(self, s_value):
         l_function_results = {}
         for form in self.forms:
@@ -284,6 +2004,24 @@ class TestModule:
             l_function_results[rep.name] = l_value
         return l_function_results
 
+    def compute_l_functions_adaptive(self, s_value, tolerance=1e-10):
+        # (value, error bound, terms used) for each L-function, truncated once the tail is within tolerance
+        adaptive_results = {}
+        for form in self.forms:
+            adaptive_results[form.name] = form.compute_l_function_adaptive(s_value, tolerance)
+        for rep in self.representations:
+            adaptive_results[rep.name] = rep.compute_artin_l_function_adaptive(s_value, tolerance)
+        return adaptive_results
+
+    def compute_l_function_grids(self, s_values):
+        # Each L-function at every s of an array, one pass over its coefficients or primes
+        l_function_grids = {}
+        for form in self.forms:
+            l_function_grids[form.name] = form.compute_l_function_grid(s_values)
+        for rep in self.representations:
+            l_function_grids[rep.name] = rep.compute_artin_l_function_grid(s_values)
+        return l_function_grids
+
     def test_exact_sequences(self):
         results = {}
         for group in self.cohomology_groups:
@@ -291,19 +2029,131 @@ class TestModule:
             results[group.name] = euler_char
         return results
 
+    def validation_tasks(self, s_value=2, radius=np.inf, min_modulus=0.0):
+        # Task graph over the registered objects: name -> (function, args, dependencies). Tiered
+        # stability degenerates and rolls back copy-on-write forks of the motives, so it runs alongside
+        # stability instead of waiting for it. Stability runs serially inside its task: a task must not
+        # start its own process pool (forking from a pool thread, with other threads and tracemalloc
+        # live, is unsafe)
+        tasks = {}
+        if self.motives:
+            tasks['stability'] = (self.perform_stability_tests, (False,), ())
+            forks = [motive.fork() for motive in self.motives]
+            tasks['tiered_stability'] = (self.perform_tiered_stability_tests, ('spectrum', radius, min_modulus, forks), ())
+        if self.motive_batches:
+            tasks['batch_stability'] = (self.perform_batch_stability_tests, (), ())
+        if self.forms or self.representations:
+            tasks['l_functions'] = (self.compute_l_functions, (s_value,), ())
+        if self.cohomology_groups:
+            tasks['exact_sequences'] = (self.test_exact_sequences, (), ())
+        if self.cycles:
+            tasks['codimension_cycles'] = (self.test_codimension_cycles, (), ())
+        return tasks
+
+    def run_validation(self, executor='thread', max_workers=None, s_value=2, track_memory=True,
+                       radius=np.inf, min_modulus=0.0):
+        # Runs the task graph on a thread or process pool, submitting each task once its dependencies
+        # are done. Returns the results and per-task wall time / peak memory by task name. Process
+        # workers get a pickled copy of the module. radius / min_modulus are the tiered stability bounds
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"Unsupported executor: {executor}")
+        tasks = self.validation_tasks(s_value, radius, min_modulus)
+        started_tracing = track_memory and executor == 'thread' and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        watermarks = MemoryWatermarks() if track_memory and executor == 'thread' else None
+        pool_class = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+        results, profile, pending = {}, {}, {}
+        start = time.perf_counter()
+        try:
+            with pool_class(max_workers=max_workers) as pool:
+                while True:
+                    for name, (function, args, dependencies) in tasks.items():
+                        if (name not in results and name not in pending.values()
+                                and all(dependency in results for dependency in dependencies)):
+                            future = pool.submit(run_profiled_task, function, args, track_memory, watermarks)
+                            pending[future] = name
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = pending.pop(future)
+                        results[name], profile[name] = future.result()
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+        return {
+            'results': {name: results[name] for name in tasks},
+            'profile': {name: profile[name] for name in tasks},
+            'wall_time': time.perf_counter() - start
+        }
+
     def test_codimension_cycles(self):
-        results = {}
-        for i, cycle1 in enumerate(self.cycles):
-            for j, cycle2 in enumerate(self.cycles):
-                if i < j:
-                    intersection = cycle1.intersect(cycle2)
-                    total_codimension = intersection.codimension
-                    results[f"{cycle1.variety} ∩ {cycle2.variety}"] = total_codimension
-        return results
+        # Only the codimensions are reported, so no intersection matrix is built
+        return dict(self.iter_cycle_intersections(codimension_only=True))
+
+    def iter_cycle_intersections(self, codimension_only=False, max_workers=None):
+        # All pairs i < j of registered cycles, yielded as (label, intersection). With codimension_only the
+        # intersection is just its total codimension and no matrix is built (pairs come in order);
+        # otherwise pairs run on a thread pool (NumPy releases the GIL) with a bounded number in flight
+        # and are yielded as they complete.
+        pairs = ((self.cycles[i], self.cycles[j]) for i in range(len(self.cycles)) for j in range(i + 1, len(self.cycles)))
+        if codimension_only:
+            for cycle1, cycle2 in pairs:
+                yield f"{cycle1.variety} ∩ {cycle2.variety}", cycle1.codimension + cycle2.codimension
+            return
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = {}
+            for cycle1, cycle2 in pairs:
+                pending[pool.submit(cycle1.intersect, cycle2)] = f"{cycle1.variety} ∩ {cycle2.variety}"
+                if len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+            for future in as_completed(list(pending)):
+                yield pending.pop(future), future.result()
+
+    def iter_k_way_intersections(self, k, dimension, codimension_only=True):
+        # Intersections of k distinct cycles whose total codimension does not exceed the variety dimension.
+        # Cycles are visited in order of codimension, so once the cheapest completion of a partial
+        # intersection passes `dimension` the remaining candidates are pruned; intersection matrices of
+        # shared prefixes are computed once.
+        order = sorted(range(len(self.cycles)), key=lambda index: self.cycles[index].codimension)
+        codimensions = [self.cycles[index].codimension for index in order]
+        prefix_sums = np.concatenate(([0], np.cumsum(codimensions)))
+
+        def extend(start, chosen, codimension, intersection):
+            if len(chosen) == k:
+                label = " ∩ ".join(self.cycles[index].variety for index in sorted(chosen))
+                yield label, codimension if codimension_only else intersection
+                return
+            remaining = k - len(chosen) - 1
+            for position in range(start, len(order) - remaining):
+                total = codimension + codimensions[position]
+                if total + prefix_sums[position + 1 + remaining] - prefix_sums[position + 1] > dimension:
+                    break
+                cycle = self.cycles[order[position]]
+                if codimension_only:
+                    extended = None
+                else:
+                    extended = cycle if intersection is None else intersection.intersect(cycle)
+                yield from extend(position + 1, chosen + [order[position]], total, extended)
+
+        yield from extend(0, [], 0, None)
 
 # === Main Execution ===
 
-def main():
+def main(backend='float64', **options):
+    # Numeric backend for every motive in this run ('float64', 'float32', 'exact' or 'mpmath'). The
+    # high-dimensional motives below are past the exact / mpmath eigenvalue limits, so those runs take
+    # their eigenvalues in float64 unless float_fallback=False is passed
+    if backend in ('exact', 'mpmath'):
+        options.setdefault('float_fallback', True)
+    run_backend = set_numeric_backend(backend, **options)
+    if getattr(run_backend, 'float_fallback', False):
+        print(f"Note: {run_backend.name} eigenvalues above dimension {run_backend.max_eigen_dimension} are computed in float64")
+
     # Initialize test module
     test_module = TestModule()
 
@@ -393,8 +2243,30 @@ def main():
         motive.apply_degenerations()
         test_module.add_motive(motive)
 
-    # Perform Stability Tests
-    stability_results = test_module.perform_stability_tests()
+    # Define a Batch of Small Random Motives (one stacked array)
+    batch_size, batch_dimension = 2000, 8
+    motive_batch = MotiveBatch([f"Batch Motive {i+1}" for i in range(batch_size)],
+                               np.random.rand(batch_size, batch_dimension, batch_dimension))
+    motive_batch.add_degeneration(degeneration_log)
+    motive_batch.add_degeneration(degeneration_trop)
+    motive_batch.add_degeneration(degeneration_nodal)
+    motive_batch.add_degeneration(degeneration_arith)
+    motive_batch.apply_degenerations()
+    test_module.add_motive_batch(motive_batch)
+
+    # Out-of-Core Tensor Product (memmap scratch store; the Kronecker product is assembled tile by tile
+    # from factors held in memory). Memmaps hold floats, so this part always runs in float64
+    with MatrixStore() as store:
+        stored_k3 = Motive("K3 Surface (Out-of-Core)", 22, k3_surface.matrix, backend='float64', storage=store)
+        stored_tensor = stored_k3.tensor_product(Motive("High-Dim Variety 50D", 50, np.identity(50), backend='float64'))
+        stored_tensor.add_degeneration(degeneration_log)
+        stored_tensor.add_degeneration(degeneration_arith)
+        stored_tensor.apply_degenerations()
+        out_of_core_result = (str(stored_tensor), np.trace(stored_tensor.matrix))
+        del stored_k3, stored_tensor
+
+    # Choose the stability precision from a float32 / float64 comparison on a sample of motives
+    precision_report = test_module.select_precision(tolerance=1e-4, sample_size=3)
 
     # === Automorphic L-functions ===
     # Define Automorphic Forms with varying parameters
@@ -409,9 +2281,6 @@ def main():
         form = AutomorphicForm(variety, weight, level, coeffs)
         test_module.add_automorphic_form(form)
 
-    # Compute L-functions
-    l_function_results = test_module.compute_l_functions(s_value=2)
-
     # === Cohomology Types ===
     # Define Cohomology Groups
     degrees = [1, 2, 3, 4, 5]
@@ -430,9 +2299,6 @@ def main():
         cohom_group = CohomologyGroup(f"Cohomology Group {i+1}", degree, dimension, coefficients, cohomology_parameters)
         test_module.add_cohomology_group(cohom_group)
 
-    # Test Exact Sequences
-    exact_sequence_results = test_module.test_exact_sequences()
-
     # Compute Cohomology Values, Apply Perturbations, and Differential Operators
     cohomology_results = {}
     for cohom in test_module.cohomology_groups:
@@ -458,23 +2324,74 @@ def main():
         cycle = CodimensionCycle(f"Cycle {i+1}", codim, matrix)
         test_module.add_codimension_cycle(cycle)
 
-    # Test Codimension Cycles
-    codimension_results = test_module.test_codimension_cycles()
+    # Run Stability Tests, L-functions, Exact Sequences and Codimension Cycles concurrently
+    # Tiered stability bounds: eigenvalues with 1e-3 <= |lambda| <= 200, tight enough that the
+    # condition and spectrum tiers are reached for the random motives
+    stability_radius, stability_min_modulus = 200, 1e-3
+    validation = test_module.run_validation(executor='thread', s_value=2, radius=stability_radius,
+                                            min_modulus=stability_min_modulus)
+    stability_results = validation['results']['stability']
+    tiered_stability_results = validation['results']['tiered_stability']
+    batch_stability_results = validation['results']['batch_stability']
+    l_function_results = validation['results']['l_functions']
+    exact_sequence_results = validation['results']['exact_sequences']
+    codimension_results = validation['results']['codimension_cycles']
+
+    # Scan the L-functions along a line of s (one pass over each form's coefficients)
+    l_scan_points = np.linspace(1.5, 4.0, 6)
+    l_function_scans = test_module.compute_l_function_grids(l_scan_points)
+
+    # Adaptive truncation: only as many terms as the tail bound needs
+    adaptive_s_value, adaptive_tolerance = 4, 1e-10
+    adaptive_l_results = test_module.compute_l_functions_adaptive(adaptive_s_value, adaptive_tolerance)
+    triple_intersections = sum(1 for _ in test_module.iter_k_way_intersections(3, dimension=8))
 
     # === Print Comprehensive Results ===
-        # Stability Results
-        print("=== Stability Results ===")
+    # Stability Results
+    print("=== Stability Results ===")
+    if precision_report['max_error'] is None:
+        print(f"Precision = {precision_report['precision']} (no eligible motives sampled)")
+    else:
+        print(f"Precision = {precision_report['precision']} (estimated relative eigenvalue error "
+              f"{precision_report['max_error']:.2e} on {len(precision_report['errors'])} sampled motives)")
     for motive_name, result in stability_results.items():
         eigenvalues = result['eigenvalues']
         stable = result['stable']
         eigenvalues_sum = np.sum(eigenvalues)
-        print(f"{motive_name}: Stable = {stable}, Sum of Eigenvalues = {eigenvalues_sum}")
+        print(f"{motive_name}: Stable = {stable}, Sum of Eigenvalues = {eigenvalues_sum}, Solver = {result['solver']}")
+
+    # Out-of-Core Results
+    print("\n=== Out-of-Core Motives ===")
+    print(f"{out_of_core_result[0]}: Trace = {out_of_core_result[1]}")
+
+    # Batched Stability Results
+    print("\n=== Batched Stability Results ===")
+    for batch in test_module.motive_batches:
+        stable_count = sum(batch_stability_results[name]['stable'] for name in batch.names)
+        print(f"{batch}: Stable = {stable_count}/{len(batch)}")
+
+    # Tiered Stability Results (no full spectrum)
+    print("\n=== Tiered Stability Results ===")
+    print(f"Bounds: {stability_min_modulus} <= |lambda| <= {stability_radius}")
+    for motive_name, result in tiered_stability_results.items():
+        heuristic = " (heuristic)" if result['heuristic'] else ""
+        print(f"{motive_name}: Stable = {result['stable']}, Decided by = {result['tier']}{heuristic}")
 
     # L-function Results
     print("\n=== L-function Results ===")
     for form_name, l_value in l_function_results.items():
         print(f"{form_name}: L(s) = {l_value}")
 
+    # Adaptive L-function Results
+    print(f"\n=== Adaptive L-function Results (s = {adaptive_s_value}, tolerance = {adaptive_tolerance}) ===")
+    for form_name, (l_value, error_bound, terms_used) in adaptive_l_results.items():
+        print(f"{form_name}: L(s) = {l_value} (error <= {error_bound:.2e}, {terms_used} terms)")
+
+    # L-function Scan
+    print(f"\n=== L-function Scan (s = {', '.join(f'{s:.2f}' for s in l_scan_points)}) ===")
+    for form_name, l_values in l_function_scans.items():
+        print(f"{form_name}: L(s) = {', '.join(f'{l_value:.6f}' for l_value in l_values)}")
+
     # Exact Sequence Euler Characteristics
     print("\n=== Exact Sequence Euler Characteristics ===")
     for cohom_name, euler_char in exact_sequence_results.items():
@@ -493,6 +2410,14 @@ def main():
     print("=== Codimension Cycle Intersections ===")
     for intersection, codim in codimension_results.items():
         print(f"{intersection}: Total Codimension = {codim}")
+    print(f"Triple intersections with total codimension <= 8: {triple_intersections}")
+
+    # Validation Schedule
+    print("\n=== Validation Schedule ===")
+    for task_name, task_profile in validation['profile'].items():
+        print(f"{task_name}: Wall Time = {task_profile['wall_time']:.3f}s, "
+              f"Peak Memory = {task_profile['peak_memory'] / 2**20:.1f} MiB")
+    print(f"Total Wall Time = {validation['wall_time']:.3f}s")
 
 if __name__ == "__main__":
-    main()
+    main(*sys.argv[1:2])
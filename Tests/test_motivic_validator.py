@@ -0,0 +1,74 @@
+import mpmath
+import pytest
+from sympy import Matrix, Rational, diag, kronecker_product
+
+import MotivicValidator as mv1
+
+
+# === Mixed Motives ===
+
+@pytest.mark.parametrize('backend', ['dense', 'sparse', 'domain'])
+def test_backends_match_sympy_operations(backend):
+    first = Matrix([[1, Rational(1, 2)], [0, 3]])
+    second = Matrix([[0, 2, 0], [Rational(-1, 3), 0, 0], [0, 0, 5]])
+    motive, other = mv1.MixedMotive("A", 2, first, backend=backend), mv1.MixedMotive("B", 3, second, backend=backend)
+    assert motive.tensor_product(other).matrix_rep == kronecker_product(first, second)
+    assert motive.dual().matrix_rep == first.T
+    assert motive.triangulate(other).matrix_rep == diag(first, second)
+
+
+# === Automorphic L-functions ===
+
+@pytest.mark.parametrize('period, ratio, s_value, expected', [
+    (None, None, 3, mpmath.zeta(3)),
+    ([2], None, 2, 2 * mpmath.zeta(2)),
+    ([1, -1], None, 2, mpmath.pi ** 2 / 12),
+    ([1, -1], None, 1, mpmath.log(2)),
+    ([1, 0, -1, 0], None, 1, mpmath.pi / 4),
+    (None, 0.5, 2, mpmath.polylog(2, 0.5)),
+    ([0, 0], None, 2, 0),
+])
+def test_closed_form_matches_known_values(period, ratio, s_value, expected):
+    value, digits = mv1.AutomorphicLFunction("L", period, ratio).compute_l_function_accelerated(s_value)
+    assert digits == 30
+    assert abs(value - expected) <= 1e-14 * max(1, abs(expected))
+
+
+@pytest.mark.parametrize('period, ratio', [([1, -1], None), ([1, 2, 3], None), (None, 0.7), ([1, -1], 0.5j)])
+@pytest.mark.parametrize('s_value', [3, 2.5, 2 + 1j])
+def test_closed_form_matches_partial_sum(period, ratio, s_value):
+    l_function = mv1.AutomorphicLFunction("L", period, ratio)
+    value, _ = l_function.compute_l_function_accelerated(s_value)
+    partial_sum, bound, _ = l_function.compute_l_function_adaptive(s_value, tolerance=1e-6)
+    assert abs(complex(value) - partial_sum) <= bound
+
+
+def test_adaptive_zeta_bound_holds():
+    l_function = mv1.AutomorphicLFunction("L")
+    for s_value in (2, 3, 4, 6):
+        value, bound, terms = l_function.compute_l_function_adaptive(s_value, tolerance=1e-8)
+        assert bound <= 1e-8 or terms == 10 ** 6
+        assert abs(value - float(mpmath.zeta(s_value))) <= bound
+
+
+@pytest.mark.parametrize('period, ratio, s_value', [
+    (None, 1.5, 2),
+    (None, None, 0.5),
+    (None, None, 1),
+    ([1, 2], None, 1 + 3j),
+    (None, 1j, 0),
+    ([1, -1], -1, 0.5),
+])
+def test_closed_form_rejects_divergent_series(period, ratio, s_value):
+    with pytest.raises(ValueError, match='diverges'):
+        mv1.AutomorphicLFunction("L", period, ratio).compute_l_function_accelerated(s_value)
+
+
+@pytest.mark.parametrize('period, ratio, s_value, expected', [
+    ([1, -1], None, 0.5, (1 - mpmath.sqrt(2)) * mpmath.zeta(0.5)),
+    (None, -1, 0.5, (mpmath.sqrt(2) - 1) * mpmath.zeta(0.5)),
+    (None, 0.5, -3, 26),
+])
+def test_closed_form_keeps_convergent_boundary_cases(period, ratio, s_value, expected):
+    value, digits = mv1.AutomorphicLFunction("L", period, ratio).compute_l_function_accelerated(s_value)
+    assert digits == 30 and abs(value - expected) <= 1e-14
@@ -0,0 +1,192 @@
+import random
+
+import pytest
+from sympy import Matrix, Rational, diag, diff, eye, kronecker_product, pi, sin, sqrt
+
+import MotivicValidator2 as mv2
+
+
+def random_rational_matrix(rows, cols, rank, seed):
+    # Product of random rows x rank and rank x cols integer/rational factors: rank <= rank
+    generator = random.Random(seed)
+    left = Matrix(rows, rank, lambda i, j: Rational(generator.randint(-9, 9), generator.randint(1, 5)))
+    right = Matrix(rank, cols, lambda i, j: generator.randint(-9, 9))
+    return left * right
+
+
+def degenerations():
+    return [mv2.DegenerationType('tropical', {'perturb_positions': [(0, 0), (1, 2)], 'scaling_factor': Rational(1, 7)}),
+            mv2.DegenerationType('nodal', {'nodal_factor': Rational(2, 5)})]
+
+
+# === Storage Backends ===
+
+@pytest.mark.parametrize('backend', ['sparse', 'domain'])
+def test_backends_match_dense(backend):
+    first, second = random_rational_matrix(2, 2, 2, 5), random_rational_matrix(3, 3, 2, 6)
+    results = {}
+    for name in ('dense', backend):
+        motive = mv2.MixedMotive("A", 2, first, {'duality_factor': Rational(3)}, backend=name)
+        other = mv2.MixedMotive("B", 3, second, backend=name)
+        tensor = motive.tensor_product(other).materialize()
+        degenerated = mv2.MixedMotive("T", 6, tensor, backend=name)
+        for degeneration in degenerations():
+            degenerated.add_degeneration(degeneration)
+        results[name] = [mv2.get_matrix_backend(name).to_sympy(matrix) for matrix in
+                         (tensor, motive.dual().matrix_data, motive.triangulate(other).materialize(),
+                          degenerated.apply_degenerations())]
+    assert results[backend] == results['dense']
+    # The dense results against the original formulas, degenerations applied one at a time
+    sequential = kronecker_product(first, second)
+    for degeneration in degenerations():
+        sequential = degeneration.apply_degeneration(sequential)
+    assert results['dense'] == [kronecker_product(first, second), 3 * first.T,
+                                2 * kronecker_product(eye(2), diag(first, second)), sequential]
+
+
+# === Lazy Tensor Products ===
+
+@pytest.mark.parametrize('backend', ['dense', 'sparse'])
+def test_tensor_motive_matches_kronecker_product(backend):
+    factors = [Matrix([[2, 1], [0, 3]]), Matrix([[1, Rational(1, 2)], [0, -1]]), Matrix([[4]])]
+    motives = [mv2.MixedMotive(f"F{i}", factor.rows, factor, backend=backend) for i, factor in enumerate(factors)]
+    motives[0].variety_parameters['tensor_scaling'] = Rational(1, 2)
+    tensor = motives[0].tensor_product(motives[1]).tensor_product(motives[2])
+    dual = tensor.dual()
+    expected = kronecker_product(*factors) / 2
+    vector = Matrix([1, -2, 3, Rational(1, 3)])
+    assert tensor.matvec(vector) == expected * vector
+    assert (tensor.trace(), tensor.determinant()) == (expected.trace(), expected.det())
+    assert tensor.eigenvalues() == expected.eigenvals()
+    assert not tensor.is_materialized and not dual.is_materialized
+    assert dual.matrix_rep == expected.T and tensor.matrix_rep == expected
+
+
+# === Fused Degenerations ===
+
+@pytest.mark.parametrize('backend', ['dense', 'sparse'])
+@pytest.mark.parametrize('names', [('tropical', 'nodal'), ('nodal', 'logarithmic', 'tropical', 'nodal'),
+                                   ('arithmetic', 'tropical', 'tropical'), ('nodal', 'unknown')])
+def test_fused_degenerations_match_sequential(backend, names):
+    parameters = {'tropical': {'perturb_positions': [(0, 0), (0, 1), (2, 1)], 'scaling_factor': Rational(1, 3)},
+                  'nodal': {'nodal_factor': Rational(2, 7)}}
+    chain = [mv2.DegenerationType(name, parameters.get(name)) for name in names]
+    matrix = random_rational_matrix(3, 3, 3, 9)
+    motive = mv2.MixedMotive("F", 3, matrix, backend=backend)
+    sequential = matrix
+    for degeneration in chain:
+        motive.add_degeneration(degeneration)
+        sequential = degeneration.apply_degeneration(sequential)
+    assert motive.backend.to_sympy(motive.apply_degenerations()) == sequential
+
+
+# === Block Diagonal Motives ===
+
+@pytest.mark.parametrize('sizes', [(2, 3), (1, 3)])
+def test_block_diagonal_motive_matches_dense(sizes):
+    # With a 1 x 1 first block the nodal degeneration couples two blocks and takes the dense path
+    first, second = random_rational_matrix(sizes[0], sizes[0], sizes[0], 7), random_rational_matrix(sizes[1], sizes[1], 2, 8)
+    triangulated = mv2.MixedMotive("A", sizes[0], first).triangulate(mv2.MixedMotive("B", sizes[1], second))
+    expected = 2 * diag(first, second, first, second)
+    assert triangulated.eigenvalues() == expected.eigenvals()
+    assert triangulated.dual().matrix_rep == expected.T
+    sequential = expected
+    for degeneration in degenerations():
+        triangulated.add_degeneration(degeneration)
+        sequential = degeneration.apply_degeneration(sequential)
+    assert (triangulated.degenerate() is None) == (sizes[0] == 1)
+    assert triangulated.apply_degenerations() == sequential
+    assert triangulated.is_materialized == (sizes[0] == 1)
+
+
+# === Identity Plus Rank-One Matrices ===
+
+def test_identity_plus_rank_one_matches_dense():
+    matrix = mv2.IdentityPlusRankOneMatrix(Rational(21, 20), Rational(1, 20), 5)
+    other = mv2.IdentityPlusRankOneMatrix(Rational(-2), Rational(3, 10), 5)
+    dense = matrix.to_matrix()
+    assert matrix.eigenvalues() == dense.eigenvals()
+    assert matrix.det() == dense.det()
+    assert matrix.inverse().to_matrix() == dense.inv()
+    assert (matrix * other).to_matrix() == dense * other.to_matrix()
+    assert (matrix * 3).to_matrix() == 3 * dense
+
+
+def test_identity_plus_rank_one_degenerations_match_sequential():
+    cohomology = mv2.CohomologyType("V", "de Rham", 2, 4, {'degenerations': degenerations()})
+    perturbed = cohomology.matrix_perturbation_structured()
+    sequential = mv2.IdentityPlusRankOneMatrix(Rational(21, 20), Rational(1, 20), 4).to_matrix()
+    for degeneration in degenerations():
+        sequential = degeneration.apply_degeneration(sequential)
+    assert perturbed.to_matrix() == sequential
+    dense = cohomology.apply_matrix_perturbation()
+    assert isinstance(dense, Matrix) and dense == sequential
+    assert perturbed.det() == sequential.det() and perturbed.inverse() == sequential.inv()
+
+
+# === Differential Operator Cache ===
+
+def test_differential_operator_cache_is_bounded_lru():
+    cache = mv2.DifferentialOperatorCache(maxsize=2)
+    expressions = [mv2.x ** 2 * mv2.y, sin(mv2.x * mv2.y), mv2.x + mv2.y ** 3]
+    for expression in expressions:
+        assert cache.partials(expression) == (diff(expression, mv2.x), diff(expression, mv2.y))
+    assert len(cache.entries) == 2 and expressions[0] not in cache.entries
+    cache.partials(expressions[1])
+    cache.partials(expressions[0])
+    assert list(cache.entries) == [expressions[1], expressions[0]]
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+# === Exact Rank Engine ===
+
+@pytest.mark.parametrize('method', ['fraction_free', 'modular', 'sympy'])
+@pytest.mark.parametrize('shape, rank, seed', [((4, 4), 4, 0), ((5, 7), 3, 1), ((6, 3), 2, 2), ((3, 3), 0, 3)])
+def test_exact_rank_matches_sympy_rank(method, shape, rank, seed):
+    matrix = random_rational_matrix(*shape, max(rank, 1), seed) * (1 if rank else 0)
+    assert mv2.exact_rank(matrix, method) == matrix.rank()
+
+
+@pytest.mark.parametrize('method', ['fraction_free', 'modular'])
+def test_exact_rank_falls_back_for_irrational_entries(method):
+    assert mv2.exact_rank(Matrix([[sqrt(2), 1], [1, pi]]), method) == 2
+    assert mv2.exact_rank(Matrix([[sqrt(2), 2], [1, sqrt(2)]]), method) == 1
+
+
+def test_verify_exact_sequence_with_irrational_entries():
+    sequence = (Matrix([[sqrt(2)], [1]]), Matrix([[1, -sqrt(2)]]), None)
+    cache = mv2.FactorizationCache()
+    assert mv2.verify_exact_sequence(sequence, cache=cache) == mv2.verify_exact_sequence(sequence, method='sympy') is True
+    assert cache.nullspace(sequence[1]) == [Matrix([[sqrt(2)], [1]])]
+
+
+@pytest.mark.parametrize('method', ['fraction_free', 'modular'])
+@pytest.mark.parametrize('seed', range(4))
+def test_verify_exact_sequence_matches_sympy(method, seed):
+    f = random_rational_matrix(5, 3, 1 + seed % 3, seed)
+    g = random_rational_matrix(2 + seed % 3, 5, 2, seed + 10)
+    sequence = (f, g, None)
+    assert mv2.verify_exact_sequence(sequence, method, mv2.FactorizationCache()) == mv2.verify_exact_sequence(sequence, 'sympy')
+
+
+def test_factorization_cache_matches_uncached():
+    cache = mv2.FactorizationCache()
+    matrix = random_rational_matrix(4, 5, 3, 4)
+    for _ in range(2):
+        assert cache.rank(matrix) == matrix.rank()
+        assert cache.rref(matrix) == tuple(matrix.rref())
+        assert len(cache.nullspace(matrix)) == len(matrix.nullspace())
+    assert cache.hits > 0
+
+
+def test_factorization_cache_is_keyed_on_content():
+    cache = mv2.FactorizationCache(maxsize=2)
+    matrix = random_rational_matrix(3, 4, 2, 5)
+    cache.rank(matrix)
+    assert cache.rank(Matrix(matrix)) == 2 and cache.hits == 1
+    domain = mv2.MATRIX_BACKENDS['sparse'].convert(matrix)
+    assert cache.rank(domain) == 2 and cache.rank(mv2.MATRIX_BACKENDS['sparse'].convert(Matrix(matrix))) == 2
+    assert (cache.hits, cache.misses) == (2, 2)
+    reduced, pivots = cache.rref(random_rational_matrix(3, 3, 3, 6))
+    assert len(cache) == 2 and mv2.matrix_content_key(matrix) not in cache.entries
+    assert cache.rank(reduced) == len(pivots) == 3
@@ -0,0 +1,802 @@
+import itertools
+import time
+from functools import reduce
+
+import mpmath
+import numpy as np
+import pytest
+from scipy import sparse
+from sympy import cos, diff, isprime, primerange, sin, symbols
+
+import MotivicValidator4 as mv4
+
+
+def random_motive(name, dimension, seed):
+    return mv4.Motive(name, dimension, np.random.default_rng(seed).random((dimension, dimension)))
+
+
+def degenerate(motive):
+    motive.add_degeneration(mv4.Degeneration('nodal', {'nodal_factor': 2.0 / 5}))
+    motive.add_degeneration(mv4.Degeneration('logarithmic', {'scaling_factor': 1.0 / 2}))
+    motive.apply_degenerations()
+    return motive
+
+
+# === Differential Operator Cache ===
+
+def test_differential_operator_cache_is_bounded_lru():
+    x, y = symbols('x y')
+    cache = mv4.DifferentialOperatorCache(maxsize=2)
+    expressions = [x ** 2 * y, sin(x * y), x + y ** 3]
+    for expression in expressions:
+        assert cache.partials(expression) == (diff(expression, x), diff(expression, y))
+    assert len(cache.entries) == 2 and expressions[0] not in cache.entries
+    cache.partials(expressions[1])
+    cache.partials(expressions[0])
+    assert list(cache.entries) == [expressions[1], expressions[0]]
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_differential_operator_matches_direct_derivatives():
+    x, y = symbols('x y')
+    group = mv4.CohomologyGroup("H", 1, 3, None, {'diff_coeff_x': 2.0, 'diff_coeff_y': 0.5})
+    function = lambda u, v: sin(u) * v ** 2
+    assert group.differential_operator(function) == 2.0 * cos(x) * y ** 2 + 0.5 * 2 * sin(x) * y
+    points = np.linspace(0, 1, 5)
+    np.testing.assert_allclose(group.evaluate_differential_operator(function, points, points[::-1]),
+                               2.0 * np.cos(points) * points[::-1] ** 2 + np.sin(points) * points[::-1])
+
+
+
+def test_compiled_partials_are_built_once():
+    x, y = symbols('x y')
+    cache = mv4.DifferentialOperatorCache()
+    expression = sin(x * y) + x ** 2
+    evaluators = cache.compiled_partials(expression)
+    assert cache.compiled_partials(expression) is evaluators
+    assert (cache.hits, cache.misses) == (1, 1)
+    points = np.linspace(0, 1, 4)
+    np.testing.assert_allclose(evaluators[0](points, points), points * np.cos(points ** 2) + 2 * points)
+    cache.clear()
+    assert not cache.entries and (cache.hits, cache.misses) == (0, 0)
+
+
+def test_cohomology_groups_share_the_module_cache(monkeypatch):
+    cache = mv4.DifferentialOperatorCache()
+    monkeypatch.setattr(mv4, 'differential_operator_cache', cache)
+    function = lambda u, v: sin(u * v)
+    for name in ("H1", "H2", "H3"):
+        mv4.CohomologyGroup(name, 1, 3, None, {}).differential_operator(function)
+    assert len(cache.entries) == 1 and (cache.hits, cache.misses) == (2, 1)
+
+
+# === Expression DAG ===
+
+@pytest.mark.parametrize('operation', ['tensor_product', 'triangulate'])
+def test_dual_after_degeneration_matches_transpose(operation):
+    # The nodal update couples the 1 x 1 and 3 x 3 blocks, so the triangulation takes the dense path
+    first, second = random_motive("A", 1, 0), random_motive("B", 3, 1)
+    motive = degenerate(getattr(first, operation)(second))
+    np.testing.assert_array_equal(motive.dual().matrix, motive.matrix.T)
+
+
+def test_expression_identities():
+    table = mv4.MotiveExpressionTable()
+    a, b = np.random.default_rng(0).random((2, 2)), np.random.default_rng(1).random((3, 3))
+    backend = mv4.get_numeric_backend('float64')
+    leaf_a, leaf_b = table.leaf(a, backend), table.leaf(b, backend)
+    assert table.leaf(a.copy(), backend) is leaf_a
+    assert table.dual(table.dual(leaf_a)) is leaf_a
+    symmetric = table.leaf(a + a.T, backend)
+    assert table.dual(symmetric) is symmetric
+    tensor = table.tensor(table.tensor(leaf_a, leaf_b), leaf_a)
+    assert tensor is table.tensor(leaf_a, table.tensor(leaf_b, leaf_a)) and len(tensor.children) == 3
+    np.testing.assert_allclose(table.evaluate(table.dual(tensor)), np.kron(np.kron(a, b), a).T)
+    triangulated = table.triangulate(leaf_a, leaf_b)
+    np.testing.assert_allclose(table.evaluate(table.dual(triangulated)),
+                               np.block([[a.T, np.zeros((2, 3))], [np.zeros((3, 2)), b.T]]))
+    matrix = table.evaluate(tensor)
+    misses = table.misses
+    assert table.evaluate(tensor) is matrix and table.misses == misses and not matrix.flags.writeable
+
+
+def test_degeneration_does_not_touch_operands():
+    first, second = random_motive("A", 2, 0), random_motive("B", 3, 1)
+    expected = np.kron(first.matrix, second.matrix)
+    degenerate(first.tensor_product(second))
+    np.testing.assert_array_equal(first.tensor_product(second).matrix, expected)
+
+
+# === Lazy Tensor Products ===
+
+def test_tensor_motive_matches_kron():
+    first, second, third = random_motive("A", 2, 0), random_motive("B", 3, 1), random_motive("C", 2, 2)
+    tensor = first.tensor_product(second).tensor_product(third)
+    expected = np.kron(np.kron(first.matrix, second.matrix), third.matrix)
+    vector = np.random.default_rng(3).random(12)
+    np.testing.assert_allclose(tensor.matvec(vector), expected @ vector)
+    np.testing.assert_allclose([tensor.trace(), tensor.determinant()], [np.trace(expected), np.linalg.det(expected)],
+                               atol=1e-12)
+    np.testing.assert_allclose(np.sort_complex(tensor.eigenvalues()), np.sort_complex(np.linalg.eigvals(expected)))
+    dual = tensor.dual()
+    assert not tensor.is_materialized and not dual.is_materialized
+    np.testing.assert_allclose(dual.matrix, expected.T)
+    np.testing.assert_allclose(tensor.matrix, expected)
+
+
+# === Block Diagonal Motives ===
+
+@pytest.mark.parametrize('sizes', [(2, 3), (1, 3)])
+def test_block_diagonal_degenerations_match_dense(sizes):
+    first, second = random_motive("A", sizes[0], 4), random_motive("B", sizes[1], 5)
+    triangulated = first.triangulate(second)
+    dense = mv4.Motive("D", sum(sizes), triangulated.to_dense())
+    np.testing.assert_allclose(np.sort_complex(triangulated.eigenvalues()), np.sort_complex(np.linalg.eigvals(dense.matrix)))
+    degenerate(triangulated)
+    degenerate(dense)
+    assert triangulated.is_block_structured == (sizes[0] == 2)
+    np.testing.assert_allclose(triangulated.to_dense(), dense.matrix)
+    assert triangulated.is_stable()
+
+
+# === Fused Degenerations ===
+
+def degeneration_chain():
+    # Every type, with tropical zeros on and off the diagonal after a shift
+    return [mv4.Degeneration('logarithmic', {'scaling_factor': mv4.Fraction(1, 3)}),
+            mv4.Degeneration('nodal', {'nodal_factor': mv4.Fraction(2, 5)}),
+            mv4.Degeneration('tropical', {'perturb_positions': [(0, 0), (0, 1), (2, 3), (9, 9)],
+                                          'scaling_factor': mv4.Fraction(1, 7)}),
+            mv4.Degeneration('arithmetic', {'arithmetic_factor': mv4.Fraction(1, 400)}),
+            mv4.Degeneration('nodal', {'nodal_factor': mv4.Fraction(-1, 5)})]
+
+
+@pytest.mark.parametrize('backend', ['float64', 'exact'])
+@pytest.mark.parametrize('shape', ['dense', 'block', 'coupled block'])
+def test_fused_degenerations_match_sequential(backend, shape):
+    # The coupled case has a 1 x 1 first block, so the nodal update falls back to the dense matrix
+    matrix = np.random.default_rng(6).integers(-5, 5, (4, 4))
+    if shape == 'dense':
+        fused = mv4.Motive("F", 4, matrix, backend=backend)
+    else:
+        sizes = 2 if shape == 'block' else 1
+        fused = mv4.BlockDiagonalMotive("F", [matrix[:sizes, :sizes], matrix[sizes:, sizes:]], backend=backend)
+    sequential = mv4.Motive("S", 4, fused.to_dense() if shape != 'dense' else matrix, backend=backend)
+    for degeneration in degeneration_chain():
+        fused.add_degeneration(degeneration)
+        degeneration.apply(sequential)
+    fused.apply_degenerations()
+    if shape != 'dense':
+        assert fused.is_block_structured == (shape == 'block')
+    dense = fused.to_dense() if isinstance(fused, mv4.BlockDiagonalMotive) else fused.matrix
+    if backend == 'exact':
+        assert (dense == sequential.matrix).all()
+    else:
+        np.testing.assert_allclose(dense, sequential.matrix, atol=1e-14)
+
+
+# === Identity Plus Rank-One Matrices ===
+
+def test_identity_plus_rank_one_matches_dense():
+    matrix, other = mv4.IdentityPlusRankOne(1.05, 0.05, 6), mv4.IdentityPlusRankOne(-2.0, 0.3, 6)
+    dense = matrix.to_dense()
+    np.testing.assert_allclose(np.sort(matrix.eigenvalues()), np.sort(np.linalg.eigvals(dense).real))
+    np.testing.assert_allclose(matrix.determinant(), np.linalg.det(dense))
+    np.testing.assert_allclose(matrix.inverse().to_dense(), np.linalg.inv(dense))
+    np.testing.assert_allclose((matrix @ other).to_dense(), dense @ other.to_dense())
+    np.testing.assert_allclose((2.5 * matrix).to_dense(), 2.5 * dense)
+    vector = np.arange(6.0)
+    np.testing.assert_allclose(matrix @ vector, dense @ vector)
+
+
+def test_identity_plus_rank_one_degenerations_match_dense():
+    matrix = mv4.IdentityPlusRankOne(1.05, 0.05, 4)
+    degenerated = matrix.apply_degenerations(degeneration_chain())
+    sequential = mv4.Motive("S", 4, matrix.to_dense())
+    for degeneration in degeneration_chain():
+        degeneration.apply(sequential)
+    assert not degenerated.is_rank_one_update
+    np.testing.assert_allclose(degenerated.to_dense(), sequential.matrix, atol=1e-15)
+    np.testing.assert_allclose(degenerated.determinant(), np.linalg.det(sequential.matrix))
+    np.testing.assert_allclose(degenerated.inverse(), np.linalg.inv(sequential.matrix))
+
+
+# === Copy-on-Write Snapshots ===
+
+def dense_matrix(motive):
+    return motive.to_dense() if isinstance(motive, mv4.BlockDiagonalMotive) else motive.matrix.copy()
+
+
+@pytest.mark.parametrize('operation', ['copy', 'triangulate', 'tensor_product'])
+def test_snapshot_rollback_restores_state(operation):
+    first, second = random_motive("A", 2, 0), random_motive("B", 2, 1)
+    motive = random_motive("M", 4, 0) if operation == 'copy' else getattr(first, operation)(second)
+    expected = np.kron(first.matrix, second.matrix) if operation == 'tensor_product' else dense_matrix(motive)
+    state = motive.snapshot()
+    degenerated = dense_matrix(degenerate(motive))
+    motive.restore(state)
+    assert operation != 'tensor_product' or not motive.is_materialized
+    np.testing.assert_array_equal(dense_matrix(motive), expected)
+    # Reapplying after the rollback gives the same result and leaves the snapshot untouched
+    motive.applied_degenerations = 0
+    motive.apply_degenerations()
+    np.testing.assert_array_equal(dense_matrix(motive), degenerated)
+    motive.restore(state)
+    np.testing.assert_array_equal(dense_matrix(motive), expected)
+
+
+def test_snapshot_shares_matrix_until_update():
+    motive = random_motive("M", 4, 0)
+    matrix, _ = motive.snapshot()
+    assert motive.matrix is matrix
+    degenerate(motive)
+    assert motive.matrix is not matrix
+
+
+# === Numeric Backends ===
+
+@pytest.fixture
+def exact_backend():
+    mv4.set_numeric_backend('exact')
+    yield
+    mv4.set_numeric_backend('float64')
+
+
+@pytest.mark.parametrize('backend', ['exact', 'mpmath'])
+def test_object_backend_operations_match_float64(backend):
+    entries = [[[1, 2], [3, 4]], [[0.5, 0.25], [0.0, 2.0]]]
+    object_motives = [mv4.Motive(f"M{i}", 2, matrix, backend=backend) for i, matrix in enumerate(entries)]
+    float_motives = [mv4.Motive(f"M{i}", 2, matrix) for i, matrix in enumerate(entries)]
+    for motives in (object_motives, float_motives):
+        tensor = degenerate(motives[0].tensor_product(motives[1]))
+        motives.extend([tensor, tensor.dual(), degenerate(motives[0].triangulate(motives[1]))])
+    for object_motive, float_motive in zip(object_motives[2:], float_motives[2:]):
+        assert object_motive.matrix.dtype == object
+        np.testing.assert_allclose(np.array(object_motive.matrix, dtype=float), float_motive.matrix, rtol=1e-14)
+
+
+def test_exact_backend_is_exact(exact_backend):
+    motive = degenerate(mv4.Motive("E", 2, [[1, 0], [0, 3]]))
+    assert motive.matrix[0, 0] == mv4.Fraction(3, 2) and motive.matrix[0, 1] == mv4.Fraction(2, 5)
+    eigenvalues, path = motive.eigenvalues_with_path()
+    assert path == 'exact'
+    assert sorted(float(value) for value in eigenvalues) == pytest.approx(sorted(np.linalg.eigvals(np.array(motive.matrix, dtype=float))))
+
+
+@pytest.mark.parametrize('backend', ['exact', 'mpmath'])
+def test_object_backend_eigenvalues_fall_back_above_dimension_limit(backend):
+    numeric_backend = mv4.get_numeric_backend(backend, float_fallback=True)
+    dimension = numeric_backend.max_eigen_dimension + 1
+    matrix = np.round(np.random.default_rng(0).random((dimension, dimension)), 3)
+    eigenvalues, path = mv4.Motive("L", dimension, matrix, backend=numeric_backend).eigenvalues_with_path()
+    assert 'float64 fallback' in path
+    np.testing.assert_allclose(np.sort_complex(eigenvalues), np.sort_complex(np.linalg.eigvals(matrix)))
+
+
+def test_mpmath_eigenvalues_match_float64():
+    matrix = np.random.default_rng(2).random((5, 5))
+    eigenvalues, path = mv4.Motive("P", 5, matrix, backend='mpmath').eigenvalues_with_path()
+    assert path == 'mpmath'
+    np.testing.assert_allclose(np.sort_complex(np.array(eigenvalues, dtype=complex)), np.sort_complex(np.linalg.eigvals(matrix)))
+
+
+def test_object_batch_falls_back_to_float64():
+    matrices = np.random.default_rng(3).random((4, 3, 3))
+    backend = mv4.get_numeric_backend('exact', float_fallback=True)
+    batch = mv4.MotiveBatch([f"B{i}" for i in range(4)], matrices, backend=backend)
+    eigenvalues, path = batch.eigenvalues_with_path()
+    assert 'float64 fallback' in path
+    np.testing.assert_allclose(np.sort_complex(eigenvalues), np.sort_complex(np.linalg.eigvals(matrices)))
+    assert batch.is_stable().all()
+
+
+
+@pytest.mark.parametrize('backend', ['exact', 'mpmath'])
+def test_object_backend_eigenvalues_above_limit_require_opt_in(backend):
+    dimension = mv4.get_numeric_backend(backend).max_eigen_dimension + 1
+    motive = mv4.Motive("L", dimension, np.identity(dimension), backend=backend)
+    with pytest.raises(ValueError, match='float_fallback=True'):
+        motive.eigenvalues_with_path()
+
+
+def test_object_batch_solves_in_backend_arithmetic():
+    matrices = np.array([[[2, 1], [0, 3]], [[1, 0], [0, 1]]])
+    batch = mv4.MotiveBatch(["B1", "B2"], matrices, backend='exact')
+    eigenvalues, path = batch.eigenvalues_with_path()
+    assert path == 'exact' and eigenvalues.dtype == object
+    assert [sorted(row) for row in eigenvalues] == [[2, 3], [1, 1]]
+    assert batch.is_stable().tolist() == [True, True]
+
+
+def test_object_backends_are_abstract():
+    with pytest.raises(TypeError):
+        mv4.ObjectBackend()
+    assert str(mv4.get_numeric_backend('exact', float_fallback=True)) == "NumericBackend(exact, float_fallback=True)"
+
+
+# === Parallel Stability Tests ===
+
+def stability_module():
+    # Pool-eligible dense motives (one with pending degenerations, one already degenerated) plus lazy
+    # tensor, block diagonal and exact motives that are handled in the calling process
+    module = mv4.TestModule()
+    pending, applied = random_motive("P", 30, 0), degenerate(random_motive("D", 20, 1))
+    pending.add_degeneration(mv4.Degeneration('nodal', {'nodal_factor': 0.4}))
+    for motive in (pending, applied, random_motive("A", 3, 2).tensor_product(random_motive("B", 4, 3)),
+                   random_motive("C", 5, 4).triangulate(random_motive("E", 6, 5)),
+                   mv4.Motive("X", 3, [[1, 2, 0], [0, 1, 3], [0, 0, 2]], backend='exact')):
+        module.add_motive(motive)
+    return module
+
+
+def test_parallel_stability_matches_serial():
+    module = stability_module()
+    before = [motive.matrix.copy() for motive in module.motives[:2]]
+    serial = module.perform_stability_tests()
+    parallel = module.perform_stability_tests(parallel=True, max_workers=2)
+    assert list(parallel) == list(serial)
+    for name, result in serial.items():
+        assert parallel[name]['stable'] == result['stable']
+        np.testing.assert_allclose(np.sort_complex(np.array(parallel[name]['eigenvalues'], dtype=complex)),
+                                   np.sort_complex(np.array(result['eigenvalues'], dtype=complex)), atol=1e-10)
+    for motive, matrix in zip(module.motives, before):
+        assert (motive.matrix == matrix).all()  # Pending degenerations were rolled back
+    assert not module.motives[2].is_materialized and module.motives[3].is_block_structured
+
+
+# === Structured Eigenvalues ===
+
+def structured_matrices():
+    rng = np.random.default_rng(7)
+    general, symmetric = rng.random((8, 8)), rng.random((8, 8))
+    symmetric += symmetric.T
+    tridiagonal = np.diag(rng.random(8)) + np.diag(rng.random(7), 1)
+    tridiagonal += np.triu(tridiagonal, 1).T
+    banded = sum(np.diag(np.full(12 - k, k + 1.0), -k) + np.diag(np.full(12 - k, k + 1.0), k) for k in (1, 2))
+    banded += np.diag(rng.random(12))
+    blocks = np.zeros((8, 8))
+    blocks[:3, :3], blocks[3:, 3:] = general[:3, :3], symmetric[:5, :5]
+    return {'diagonal': np.diag(rng.random(8)), 'triangular': np.triu(general), 'symmetric': symmetric,
+            'tridiagonal': tridiagonal, 'banded': banded, 'block(general, symmetric)': blocks, 'general': general}
+
+
+@pytest.mark.parametrize('expected_path', list(structured_matrices()))
+def test_structured_eigenvalues_match_general_solver(expected_path):
+    matrix = structured_matrices()[expected_path]
+    eigenvalues, path = mv4.structured_eigenvalues(matrix)
+    assert path == expected_path
+    np.testing.assert_allclose(np.sort_complex(eigenvalues.astype(complex)), np.sort_complex(np.linalg.eigvals(matrix)),
+                               atol=1e-10)
+
+
+# === Reduced Precision ===
+
+def test_float32_stability_within_estimated_error():
+    module = mv4.TestModule()
+    for i in range(3):
+        module.add_motive(random_motive(f"M{i}", 20, i))
+    reference = module.perform_stability_tests()
+    assert module.select_precision(tolerance=0.0, seed=0)['precision'] == 'float64'
+    assert max(module.estimate_precision_error('float64', seed=0).values()) == 0.0
+    report = module.select_precision(tolerance=1e-3, seed=0)
+    assert report['precision'] == 'float32' and len(report['errors']) == 3
+    reduced = module.perform_stability_tests()
+    for name, result in reduced.items():
+        eigenvalues, expected = np.sort_complex(result['eigenvalues']), np.sort_complex(reference[name]['eigenvalues'])
+        assert eigenvalues.dtype == np.complex64 and result['stable'] == reference[name]['stable']
+        scale = max(1.0, np.abs(expected).max())
+        assert np.abs(eigenvalues - expected).max() / scale <= 10 * report['max_error'] + 1e-6
+
+
+
+def test_precision_stays_float64_without_samples():
+    module = mv4.TestModule()
+    module.add_motive(mv4.Motive("E", 2, [[1, 0], [0, 3]], backend='exact'))
+    report = module.select_precision(tolerance=1.0)
+    assert report == {'precision': 'float64', 'max_error': None, 'errors': {}}
+
+
+# === Tiered Stability ===
+
+@pytest.mark.parametrize('dimension', [4, 40, 120])
+def test_tiered_stability_agrees_with_spectrum(dimension):
+    rng = np.random.default_rng(dimension)
+    for matrix in (np.identity(dimension) + rng.random((dimension, dimension)) / dimension, rng.random((dimension, dimension))):
+        expected = mv4.spectrum_verdict(np.linalg.eigvals(matrix), mv4.get_numeric_backend('float64'), 20, 1e-3)
+        stable, tier, _ = mv4.tiered_stability(matrix, 'spectrum', 20, 1e-3)
+        assert stable == expected, tier
+
+
+def test_tiered_stability_marks_condition_tier_heuristic():
+    module = mv4.TestModule()
+    module.add_motive(random_motive("R", 120, 1))
+    module.add_motive(mv4.Motive("I", 3, np.identity(3)))
+    results = module.perform_stability_tests(mode='spectrum', radius=200, min_modulus=1e-3)
+    assert results["I"]['tier'] == 'gershgorin' and not results["I"]['heuristic']
+    assert results["R"]['tier'] == 'condition' and results["R"]['heuristic'] and results["R"]['stable']
+
+
+
+@pytest.mark.parametrize('matrix, mode, expected', [
+    (np.array([[1.0, np.nan], [0.0, 1.0]]), 'spectrum', (False, 'finite')),
+    (np.identity(3), 'finite', (None, 'finite')),
+    (np.identity(3) * 50, 'spectrum', (False, 'gershgorin')),
+    (np.identity(3), 'spectrum', (True, 'gershgorin')),
+    (np.array([[1.0, 2.0], [2.0, 1.0]]), 'gershgorin', (None, 'gershgorin')),
+    (np.array([[1.0, 1.0], [1.0, 1.0]]), 'spectrum', (False, 'condition')),
+    (np.array([[1.0, 2.0], [2.0, 1.0]]), 'spectrum', (True, 'condition')),
+    (np.array([[1.0, 1.0], [1.0, 1.0 + 1e-6]]), 'spectrum', (False, 'spectrum')),
+])
+def test_tiered_stability_stops_at_the_deciding_tier(matrix, mode, expected):
+    stable, tier, eigenvalues = mv4.tiered_stability(matrix, mode, 20, 1e-3)
+    assert (stable, tier) == expected
+    assert (eigenvalues is not None) == (tier == 'spectrum')
+
+
+# === Motive Batches ===
+
+@pytest.mark.parametrize('symmetric', [False, True])
+def test_motive_batch_matches_individual_motives(symmetric):
+    matrices = np.random.default_rng(8).random((5, 4, 4))
+    if symmetric:
+        matrices += matrices.transpose(0, 2, 1)
+    motives = [mv4.Motive(f"M{i}", 4, matrix) for i, matrix in enumerate(matrices)]
+    batch = mv4.MotiveBatch.from_motives(motives)
+    eigenvalues, path = batch.eigenvalues_with_path()
+    assert path == ('symmetric' if symmetric else 'general')
+    for index, motive in enumerate(motives):
+        np.testing.assert_allclose(np.sort_complex(eigenvalues[index]), np.sort_complex(np.linalg.eigvals(motive.matrix)))
+    for degeneration in degeneration_chain():
+        batch.add_degeneration(degeneration)
+        for motive in motives:
+            motive.add_degeneration(degeneration)
+    batch.apply_degenerations()
+    eigenvalues = batch.eigenvalues()
+    for index, motive in enumerate(motives):
+        motive.apply_degenerations()
+        np.testing.assert_allclose(batch[index].matrix, motive.matrix)
+        np.testing.assert_allclose(batch.dual()[index].matrix, motive.dual().matrix)
+        np.testing.assert_allclose(np.sort_complex(eigenvalues[index]), np.sort_complex(np.linalg.eigvals(motive.matrix)),
+                                   atol=1e-12)
+
+
+def test_batch_stability_matches_motive_stability():
+    matrices = np.random.default_rng(9).random((4, 5, 5))
+    module, batch_module = mv4.TestModule(), mv4.TestModule()
+    batch = mv4.MotiveBatch([f"B{i}" for i in range(4)], matrices)
+    batch.add_degeneration(mv4.Degeneration('nodal', {'nodal_factor': 0.4}))
+    batch_module.add_motive_batch(batch)
+    for motive in batch.motives():
+        motive.add_degeneration(mv4.Degeneration('nodal', {'nodal_factor': 0.4}))
+        module.add_motive(motive)
+    expected = module.perform_stability_tests()
+    results = batch_module.perform_batch_stability_tests()
+    assert list(results) == list(expected)
+    for name, result in results.items():
+        assert result['stable'] == expected[name]['stable']
+        np.testing.assert_allclose(np.sort_complex(result['eigenvalues']), np.sort_complex(expected[name]['eigenvalues']))
+    np.testing.assert_array_equal(batch.matrices, matrices)  # Rolled back
+
+
+# === Out-of-Core Storage ===
+
+
+def test_out_of_core_tensor_matches_kron():
+    first, second = random_motive("A", 4, 0), random_motive("B", 5, 1)
+    with mv4.MatrixStore(tile_bytes=64) as store:
+        stored = mv4.Motive("A", 4, first.matrix, storage=store).tensor_product(second)
+        degenerate(stored)
+        expected = degenerate(mv4.Motive("T", 20, np.kron(first.matrix, second.matrix)))
+        assert isinstance(stored.matrix, np.memmap)
+        np.testing.assert_allclose(stored.matrix, expected.matrix)
+
+
+@pytest.mark.parametrize('tile_bytes', [8, 40, 1 << 20])
+def test_matrix_store_tiles_match_numpy(tile_bytes):
+    rng = np.random.default_rng(10)
+    matrix, first, second = rng.random((7, 5)), rng.random((3, 2)), rng.random((2, 3))
+    with mv4.MatrixStore(tile_bytes=tile_bytes) as store:
+        np.testing.assert_array_equal(store.copy(matrix), matrix)
+        np.testing.assert_array_equal(store.transpose(matrix), matrix.T)
+        np.testing.assert_array_equal(store.kron([first, second, first]), np.kron(np.kron(first, second), first))
+        blocks = [rng.random((2, 2)), rng.random((3, 3))]
+        expected = np.zeros((5, 5))
+        expected[:2, :2], expected[2:, 2:] = blocks
+        np.testing.assert_array_equal(store.block_diagonal(blocks), expected)
+
+
+def test_out_of_core_motive_operations_match_in_memory():
+    first, second = random_motive("A", 3, 0), random_motive("B", 4, 1)
+    with mv4.MatrixStore(tile_bytes=32) as store:
+        stored = mv4.Motive("A", 3, first.matrix, storage=store)
+        np.testing.assert_array_equal(stored.dual().matrix, first.dual().matrix)
+        triangulated, expected = stored.triangulate(second), first.triangulate(second)
+        np.testing.assert_allclose(degenerate(triangulated).to_dense(), degenerate(expected).to_dense())
+        tensor = stored.tensor_product(second)
+        np.testing.assert_allclose(np.sort_complex(tensor.eigenvalues()),
+                                   np.sort_complex(first.tensor_product(second).eigenvalues()))
+        assert store.owns(triangulated.to_dense()) and not tensor.is_materialized
+
+
+def test_out_of_core_float_motive_under_exact_default(exact_backend):
+    exact_motive = mv4.Motive("E", 2, [[1, 2], [3, 4]])
+    with mv4.MatrixStore() as store:
+        stored = mv4.Motive("S", 2, exact_motive.matrix, backend='float64', storage=store)
+        np.testing.assert_array_equal(stored.tensor_product(mv4.Motive("I", 2, np.identity(2), backend='float64')).matrix,
+                                      np.kron([[1, 2], [3, 4]], np.identity(2)))
+        with pytest.raises(ValueError):
+            mv4.Motive("S", 2, exact_motive.matrix, storage=store)
+
+
+# === Codimension Cycles ===
+
+def padded_product(first, second):
+    # The original intersection: zero-pad both matrices to the larger shape and multiply
+    shape = np.maximum(first.shape, second.shape)
+    pad = lambda matrix: np.pad(matrix, [(0, shape[0] - matrix.shape[0]), (0, shape[1] - matrix.shape[1])])
+    return pad(first) * pad(second)
+
+
+@pytest.mark.parametrize('shapes', [((4, 6), (5, 3)), ((3, 3), (3, 3)), ((2, 7), (6, 1))])
+@pytest.mark.parametrize('sparse_operands', [(False, False), (True, False), (False, True), (True, True)])
+def test_cycle_intersection_matches_padded_product(shapes, sparse_operands):
+    rng = np.random.default_rng(11)
+    matrices = [rng.random(shape) * (rng.random(shape) < 0.5) for shape in shapes]
+    cycles = [mv4.CodimensionCycle(f"C{i}", i + 1, sparse.csr_matrix(matrix) if is_sparse else matrix)
+              for i, (matrix, is_sparse) in enumerate(zip(matrices, sparse_operands))]
+    intersection = cycles[0].intersect(cycles[1])
+    assert intersection.is_sparse == any(sparse_operands) and intersection.codimension == 3
+    result = intersection.cycle_matrix.toarray() if intersection.is_sparse else intersection.cycle_matrix
+    np.testing.assert_array_equal(result, padded_product(*matrices))
+
+
+def cycle_module():
+    module = mv4.TestModule()
+    rng = np.random.default_rng(12)
+    for i, codimension in enumerate([3, 1, 2, 1, 4, 2]):
+        module.add_codimension_cycle(mv4.CodimensionCycle(f"C{i}", codimension, rng.random((3 + i % 3, 4 + i % 2))))
+    return module
+
+
+def test_streamed_pair_intersections_match_brute_force():
+    module = cycle_module()
+    results = dict(module.iter_cycle_intersections(max_workers=2))
+    cycles = module.cycles
+    expected = {f"{a.variety} ∩ {b.variety}": a.intersect(b) for i, a in enumerate(cycles) for b in cycles[i + 1:]}
+    assert set(results) == set(expected)
+    for label, intersection in results.items():
+        np.testing.assert_array_equal(intersection.cycle_matrix, expected[label].cycle_matrix)
+    assert module.test_codimension_cycles() == {label: cycle.codimension for label, cycle in expected.items()}
+
+
+@pytest.mark.parametrize('k, dimension', [(2, 3), (3, 5), (3, 100), (4, 6), (7, 100)])
+def test_pruned_k_way_intersections_match_brute_force(k, dimension):
+    module = cycle_module()
+    expected = {}
+    for chosen in itertools.combinations(module.cycles, k):
+        codimension = sum(cycle.codimension for cycle in chosen)
+        if codimension <= dimension:
+            expected[" ∩ ".join(cycle.variety for cycle in chosen)] = (codimension, reduce(lambda a, b: a.intersect(b), chosen))
+    assert dict(module.iter_k_way_intersections(k, dimension)) == {label: value[0] for label, value in expected.items()}
+    intersections = dict(module.iter_k_way_intersections(k, dimension, codimension_only=False))
+    assert set(intersections) == set(expected)
+    for label, intersection in intersections.items():
+        assert intersection.codimension == expected[label][0]
+        np.testing.assert_allclose(intersection.cycle_matrix, expected[label][1].cycle_matrix)
+
+
+# === Task Graph ===
+
+def validation_module():
+    module = mv4.TestModule()
+    for i in range(3):
+        motive = random_motive(f"M{i}", 12, i)
+        motive.add_degeneration(mv4.Degeneration('logarithmic', {'scaling_factor': 1.0 / 100}))
+        module.add_motive(motive)
+    module.add_motive_batch(mv4.MotiveBatch([f"B{i}" for i in range(5)], np.random.default_rng(9).random((5, 3, 3))))
+    module.add_automorphic_form(mv4.AutomorphicForm("F", 2, 11, {n: n % 7 + 1 for n in range(1, 500)}))
+    for i in range(4):
+        module.add_codimension_cycle(mv4.CodimensionCycle(f"C{i}", i + 1, np.random.default_rng(i).random((6, 6))))
+    return module
+
+
+def test_validation_matches_serial_calls():
+    module = validation_module()
+    stability = module.perform_stability_tests()
+    for executor in ('thread', 'process'):
+        validation = module.run_validation(executor=executor, max_workers=2)
+        results = validation['results']
+        assert set(validation['profile']) == set(results) == {'stability', 'tiered_stability', 'batch_stability',
+                                                             'l_functions', 'codimension_cycles'}
+        for name, result in stability.items():
+            np.testing.assert_allclose(np.sort_complex(results['stability'][name]['eigenvalues']),
+                                       np.sort_complex(result['eigenvalues']))
+        assert results['l_functions'] == module.compute_l_functions(2)
+        assert results['codimension_cycles'] == module.test_codimension_cycles()
+        assert all(profile['wall_time'] >= 0 and profile['peak_memory'] >= 0 for profile in validation['profile'].values())
+
+
+def test_tasks_start_after_their_dependencies(monkeypatch):
+    events = []
+
+    def task(name, delay):
+        events.append(('start', name))
+        time.sleep(delay)
+        events.append(('end', name))
+        return name
+
+    module = mv4.TestModule()
+    graph = {'a': (task, ('a', 0.05), ()), 'b': (task, ('b', 0.0), ('a',)), 'c': (task, ('c', 0.01), ()),
+             'd': (task, ('d', 0.0), ('b', 'c'))}
+    monkeypatch.setattr(module, 'validation_tasks', lambda *args: graph)
+    validation = module.run_validation(executor='thread', max_workers=4)
+    assert validation['results'] == {name: name for name in graph}
+    for name, (_, _, dependencies) in graph.items():
+        for dependency in dependencies:
+            assert events.index(('end', dependency)) < events.index(('start', name))
+
+
+def test_tiered_stability_task_uses_given_bounds():
+    module = mv4.TestModule()
+    module.add_motive(random_motive("R", 120, 1))
+    results = module.run_validation(radius=200, min_modulus=1e-3, track_memory=False)['results']
+    assert results['tiered_stability'] == module.perform_stability_tests(mode='spectrum', radius=200, min_modulus=1e-3)
+    assert results['tiered_stability']["R"]['tier'] == 'condition'
+
+
+def test_thread_validation_starts_no_process_pool(monkeypatch):
+    def no_process_pool(*args, **kwargs):
+        raise AssertionError("process pool started from a validation thread")
+    monkeypatch.setattr(mv4, 'ProcessPoolExecutor', no_process_pool)
+    validation_module().run_validation(executor='thread')
+
+
+
+def test_stability_tasks_run_on_independent_motives():
+    module = validation_module()
+    before = [motive.matrix.copy() for motive in module.motives]
+    tasks = module.validation_tasks(radius=20, min_modulus=1e-3)
+    assert tasks['tiered_stability'][2] == ()
+    forks = tasks['tiered_stability'][1][3]
+    assert all(fork is not motive and fork.matrix is motive.matrix for fork, motive in zip(forks, module.motives))
+    results = module.run_validation(radius=20, min_modulus=1e-3, track_memory=False)['results']
+    assert results['tiered_stability'] == module.perform_stability_tests(mode='spectrum', radius=20, min_modulus=1e-3)
+    for motive, matrix in zip(module.motives, before):
+        np.testing.assert_array_equal(motive.matrix, matrix)
+        assert motive.applied_degenerations == 0
+
+
+def test_fork_degenerations_leave_the_original_alone():
+    motive = random_motive("M", 4, 0)
+    original = motive.matrix.copy()
+    fork = motive.fork()
+    fork.add_degeneration(mv4.Degeneration('logarithmic', {'scaling_factor': 1.0 / 2}))
+    fork.apply_degenerations()
+    np.testing.assert_array_equal(motive.matrix, original)
+    assert not motive.degenerations and fork.matrix is not motive.matrix
+
+
+# === Dirichlet Series ===
+
+def naive_dirichlet_series(coefficients, s_value, terms):
+    # The original loop: sum of a_n n^{-s} over the stored n <= terms
+    return sum(value * n ** -s_value for n, value in coefficients.items() if 1 <= n <= terms)
+
+
+@pytest.mark.parametrize('s_value', [2, 1.5, 0.5 + 3j])
+@pytest.mark.parametrize('chunk_terms', [7, mv4.DIRICHLET_CHUNK_TERMS])
+def test_dirichlet_series_matches_naive_sum(s_value, chunk_terms):
+    rng = np.random.default_rng(13)
+    coefficients = {int(n): float(value) for n, value in zip(rng.choice(np.arange(1, 200), 60, replace=False), rng.normal(size=60))}
+    coefficients[0] = coefficients[500] = 1.0  # Outside 1 <= n <= terms
+    dense = mv4.dirichlet_coefficients(coefficients, 300)
+    assert len(dense) == max(n for n in coefficients if n <= 300)
+    np.testing.assert_allclose(mv4.dirichlet_series(dense, s_value, chunk_terms), naive_dirichlet_series(coefficients, s_value, 300))
+
+
+def test_l_function_sees_coefficient_updates():
+    form = mv4.AutomorphicForm("F", 2, 11, {1: 1.0, 2: -2.0})
+    assert form.compute_l_function(2) == pytest.approx(1 - 2 / 4)
+    form.coefficients = {1: 1.0, 3: 9.0}
+    assert form.compute_l_function(2) == pytest.approx(2)
+    form.coefficients[2] = 4.0
+    form.invalidate_coefficients()
+    assert form.compute_l_function(2) == pytest.approx(3)
+
+
+# === L-function Grids ===
+
+@pytest.mark.parametrize('s_values', [np.linspace(1.5, 4, 6).reshape(2, 3), np.array([2 + 1j, 0.5 - 14j, 3.0])])
+def test_l_function_grids_match_pointwise(s_values):
+    module = mv4.TestModule()
+    module.add_automorphic_form(mv4.AutomorphicForm("F", 2, 11, {n: (-1) ** n * n % 5 for n in range(1, 2000)}))
+    module.add_galois_representation(mv4.GaloisRepresentation("R", 1, {p: -1.5 if p % 4 == 3 else 0.5 for p in range(2, 500)}))
+    form, representation = module.forms[0], module.representations[0]
+    grids = module.compute_l_function_grids(s_values)
+    assert grids["F"].shape == grids["R"].shape == s_values.shape
+    for index, s_value in np.ndenumerate(s_values):
+        np.testing.assert_allclose(grids["F"][index], form.compute_l_function(s_value), rtol=1e-12)
+        np.testing.assert_allclose(grids["R"][index], representation.compute_artin_l_function(s_value), rtol=1e-12)
+    np.testing.assert_allclose(mv4.dirichlet_series_grid(form.coefficient_array(2000), s_values, chunk_terms=10),
+                               grids["F"], rtol=1e-12)
+
+
+# === Prime Sieve and Euler Products ===
+
+def test_segmented_sieve_matches_sympy():
+    sieve = mv4.PrimeSieve(limit=10)
+    for bound in (9, 30, 31, 1000, 5000, 4999):
+        np.testing.assert_array_equal(sieve.primes_up_to(bound), list(primerange(2, bound + 1)))
+    assert [sieve.is_prime(n) for n in range(12000)] == [isprime(n) for n in range(12000)]
+    assert [mv4.GaloisRepresentation.is_prime(n) for n in (0, 1, 2, 97, 65537, 10 ** 6 + 3, 10 ** 6 + 5)] == \
+        [isprime(n) for n in (0, 1, 2, 97, 65537, 10 ** 6 + 3, 10 ** 6 + 5)]
+
+
+def naive_euler_product(character_values, s_value, terms):
+    # The original loop over 2 <= p <= terms + 1, a vanishing local factor counting as 1e-10
+    l_value = 1.0
+    for p in range(2, terms + 2):
+        if isprime(p):
+            denominator = 1 - character_values.get(p, 1.0) / p ** s_value
+            l_value *= 1 / (denominator if denominator != 0 else 1e-10)
+    return l_value
+
+
+@pytest.mark.parametrize('character_values', [{}, {2: 5.0, 3: -1.0, 7: 0.0}, {2: 4.0, 5: 2.0}, {3: 1j, 11: -0.5 + 2j}])
+@pytest.mark.parametrize('s_value', [2, 3.5, 2 + 5j])
+def test_log_space_euler_product_matches_naive_product(character_values, s_value):
+    # Covers negative local factors (2: 5.0) and, at s = 2, a vanishing one (2: 4.0)
+    representation = mv4.GaloisRepresentation("R", 1, character_values)
+    np.testing.assert_allclose(representation.compute_artin_l_function(s_value, terms=400),
+                               naive_euler_product(character_values, s_value, 400), rtol=1e-11)
+
+
+# === Adaptive L-functions ===
+
+@pytest.mark.parametrize('growth', [(1.0, 0), (3.0, 0.5), (0.1, 1)])
+@pytest.mark.parametrize('sigma, tolerance', [(2, 1e-3), (2.5, 1e-3), (4, 1e-10), (3.1, 1e-6)])
+def test_tail_terms_are_minimal(growth, sigma, tolerance):
+    terms = mv4.dirichlet_tail_terms(growth, sigma, tolerance, 10 ** 9)
+    if sigma <= growth[1] + 1:
+        assert terms == 10 ** 9 and mv4.dirichlet_tail_bound(growth, sigma, terms) == np.inf
+    else:
+        assert mv4.dirichlet_tail_bound(growth, sigma, terms) <= tolerance
+        assert terms == 1 or mv4.dirichlet_tail_bound(growth, sigma, terms - 1) > tolerance
+
+
+@pytest.mark.parametrize('s_value, tolerance', [(2, 1e-4), (3, 1e-4), (4, 1e-4), (4, 1e-10)])
+def test_adaptive_zeta_within_bound(s_value, tolerance):
+    # Stopping before `terms`, the tail bound with |a_n| <= 1 covers the infinite series
+    form = mv4.AutomorphicForm("Z", 2, 1, {n: 1 for n in range(1, 100001)})
+    value, bound, used = form.compute_l_function_adaptive(s_value, tolerance=tolerance)
+    assert 0 < bound <= tolerance and used < 100000
+    assert abs(value - float(mpmath.zeta(s_value))) <= bound
+
+
+@pytest.mark.parametrize('s_value', [3, 4, 3 + 5j])
+def test_adaptive_euler_product_bound_within_tolerance(s_value):
+    representation = mv4.GaloisRepresentation("R", 1, {p: (-1) ** (p // 2) for p in range(2, 20000)})
+    value, bound, used = representation.compute_artin_l_function_adaptive(s_value, tolerance=1e-8)
+    assert 0 < bound <= 1e-8 and used < len(representation.local_factor_arrays(100000)[0])
+
+
+@pytest.mark.parametrize('s_value', [1.5, 0.5 + 1j])
+def test_fully_summed_series_reports_rounding(s_value):
+    form = mv4.AutomorphicForm("F", 2, 11, {n: (-1) ** n / n ** 0.3 for n in range(1, 3000)})
+    value, bound, used = form.compute_l_function_adaptive(s_value)
+    assert used == 2999 and 0 < bound < 1e-9
+    reference = mpmath.fsum(mpmath.mpf((-1) ** n / n ** 0.3) * mpmath.mpf(n) ** -mpmath.mpmathify(s_value) for n in range(1, 3000))
+    assert abs(value - complex(reference)) <= bound
+    assert abs(value - form.compute_l_function(s_value)) <= bound
+
+
+@pytest.mark.parametrize('s_value', [1.5, 2, 0.7 + 2j])
+def test_adaptive_euler_product_within_bound(s_value):
+    representation = mv4.GaloisRepresentation("R", 1, {p: (-1) ** (p // 2) for p in range(2, 20000)})
+    value, bound, used = representation.compute_artin_l_function_adaptive(s_value, tolerance=1e-300, terms=20000)
+    primes, character = representation.local_factor_arrays(20000)
+    assert used == len(primes) and 0 < bound < 1e-9
+    s = mpmath.mpmathify(s_value)
+    reference = mpmath.fprod(1 / (1 - mpmath.mpf(float(c)) * mpmath.mpf(int(p)) ** -s) for p, c in zip(primes, character))
+    assert abs(value - complex(reference)) <= bound
+    assert abs(value - representation.compute_artin_l_function(s_value, terms=20000)) <= bound